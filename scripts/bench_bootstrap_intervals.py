@@ -0,0 +1,91 @@
+"""
+Measures the cost of the bootstrap confidence intervals of a table of metrics.
+
+The results of an IPC-like table are generated, each domain having the same number of
+problems and each planner a result on every problem. The intervals of the coverage,
+time score, quality score and relative quality score of each cell are computed.
+
+Usage:
+    python scripts/bench_bootstrap_intervals.py [--domains 40] [--problems 25]
+        [--planners 10] [--samples 10000] [--jobs 1 4] [--runs 3]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import List
+
+from tyr.metrics.bootstrap import bootstrap_intervals
+from tyr.metrics.engine import ResultArrays
+from tyr.metrics.metrics.coverage import CoverageMetric
+from tyr.metrics.metrics.quality_score import QualityScoreMetric
+from tyr.metrics.metrics.relative_quality_score import RelativeQualityScoreMetric
+from tyr.metrics.metrics.time_score import TimeScoreMetric
+from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+
+def generate_results(
+    num_domains: int, num_problems: int, num_planners: int
+) -> List[PlannerResult]:
+    """Generates a result of each planner on each problem of each domain."""
+    rng = random.Random(0)
+    config = SolveConfig(1, 1, 300, 0, False, False, False, False)
+    statuses = [PlannerResultStatus.SOLVED] * 3 + [PlannerResultStatus.TIMEOUT]
+    return [
+        PlannerResult(
+            f"planner-{planner}",
+            f"domain-{domain}:{problem}",  # type: ignore
+            RunningMode.ONESHOT,
+            rng.choice(statuses),
+            config,
+            rng.uniform(0, 300),
+            rng.randint(1, 100),
+        )
+        for domain in range(num_domains)
+        for problem in range(num_problems)
+        for planner in range(num_planners)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--domains", type=int, default=40, help="Generated domains.")
+    parser.add_argument("--problems", type=int, default=25, help="Problems by domain.")
+    parser.add_argument("--planners", type=int, default=10, help="Generated planners.")
+    parser.add_argument("--samples", type=int, default=10000, help="Bootstrap samples.")
+    parser.add_argument(
+        "--jobs", type=int, nargs="+", default=[1], help="Numbers of processes."
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Number of measures.")
+    args = parser.parse_args()
+
+    results = generate_results(args.domains, args.problems, args.planners)
+    arrays = ResultArrays.from_results(results)
+    groups, keys = arrays.group_by(lambda r: (r.problem.split(":")[0], r.planner_name))
+    strata, _ = arrays.group_by(lambda r: r.problem.split(":")[0])
+    metrics = [
+        CoverageMetric(),
+        QualityScoreMetric(),
+        RelativeQualityScoreMetric(),
+        TimeScoreMetric(),
+    ]
+    print(f"{len(results)} results, {len(keys)} cells, {args.samples} samples")
+
+    for jobs in args.jobs:
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            bootstrap_intervals(
+                metrics, arrays, groups, len(keys), strata, 95, args.samples, jobs
+            )
+            timings.append(time.perf_counter() - start)
+        print(
+            f"jobs {jobs: <4} median {statistics.median(timings):8.3f}s"
+            f"    min {min(timings):8.3f}s    max {max(timings):8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
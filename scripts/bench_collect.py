@@ -0,0 +1,109 @@
+"""
+Measures the cost of collecting problems and the CLI time to first solve.
+
+The legacy collection builds every problem of every domain before matching the filters,
+the current one only builds the selected problems. Both are timed in this process, then
+the `tyr solve` command is timed end to end when a planner is given.
+
+Usage:
+    python scripts/bench_collect.py "rovers:3$" [--planner aries] [--runs 5]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess  # nosec: B404
+import sys
+import time
+from typing import Callable, List
+
+from tyr.cli.collector import collect_problems
+from tyr.problems import scanner as domain_scanner
+
+
+def legacy_collect_problems(*filters: str) -> List:
+    """Collects the problems by building all of them before filtering."""
+    all_problems = [
+        d.get_problem(p + 1)
+        for d in domain_scanner.get_all_domains()
+        for p in range(d.get_num_problems())
+    ]
+    available = [p for p in all_problems if p is not None]
+    if len(filters) == 0:
+        return available
+    selected = []
+    for flt in filters:
+        re_filter = re.compile(flt)
+        for problem in available:
+            if re_filter.match(problem.name) is not None:
+                selected.append(problem)
+    return list(set(selected))
+
+
+def clear_domain_caches():
+    """Forgets the problems built by the domains."""
+    for domain in domain_scanner.get_all_domains():
+        domain.problems.clear()
+
+
+def measure(function: Callable, runs: int) -> List[float]:
+    """Times the given function on fresh domain caches."""
+    timings = []
+    for _ in range(runs):
+        clear_domain_caches()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: List[float]):
+    """Prints the median and the extrema of the timings."""
+    print(
+        f"{name: <24} median {statistics.median(timings):8.3f}s"
+        f"    min {min(timings):8.3f}s    max {max(timings):8.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("filters", nargs="*", help="Regex filters on problem names.")
+    parser.add_argument("--planner", help="Planner used to time `tyr solve`.")
+    parser.add_argument("--timeout", type=int, default=5, help="Timeout of the solve.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measures.")
+    args = parser.parse_args()
+
+    report(
+        "legacy collection",
+        measure(lambda: legacy_collect_problems(*args.filters), args.runs),
+    )
+    report(
+        "filter-first collection",
+        measure(lambda: collect_problems(*args.filters), args.runs),
+    )
+
+    if args.planner is None or len(args.filters) != 1:
+        return
+
+    cmd = [
+        sys.executable,
+        "-m",
+        "tyr",
+        "solve",
+        args.planner,
+        args.filters[0],
+        "--fs",
+        "--no-db-save",
+        "-t",
+        str(args.timeout),
+    ]
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, check=False)  # nosec: B603
+        timings.append(time.perf_counter() - start)
+    report("tyr solve", timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Measures the cost of building several goal subsets of the same problem.
+
+The legacy path clones the whole problem for each number of goals, the bulk path
+flattens the goals once and shares everything else between the reduced problems.
+Both the time and the peak of allocated memory are reported.
+
+Usage:
+    python scripts/bench_reduce_problems.py "rovers:3" "satellite:10@base" [--runs 5]
+    python scripts/bench_reduce_problems.py --goals 500 --numbers 1 5 10 50 [--runs 5]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from unified_planning.shortcuts import (
+    BoolType,
+    Fluent,
+    InstantaneousAction,
+    Not,
+    Problem,
+    UserType,
+)
+
+from tyr.problems import scanner as domain_scanner
+from tyr.problems.converter import reduce_problem, reduce_problems
+
+
+def generate_problem(num_goals: int) -> Problem:
+    """Generates a problem with the given number of goals and as many objects."""
+    item = UserType("item")
+    done = Fluent("done", BoolType(), i=item)
+    ready = Fluent("ready", BoolType(), i=item)
+
+    process = InstantaneousAction("process", i=item)
+    i = process.parameter("i")
+    process.add_precondition(ready(i))
+    process.add_precondition(Not(done(i)))
+    process.add_effect(done(i), True)
+
+    problem = Problem("generated")
+    problem.add_fluent(done, default_initial_value=False)
+    problem.add_fluent(ready, default_initial_value=False)
+    problem.add_action(process)
+    for idx in range(num_goals):
+        obj = problem.add_object(f"i{idx}", item)
+        problem.set_initial_value(ready(obj), True)
+        problem.add_goal(done(obj))
+    return problem
+
+
+def get_problem(name: str) -> Problem:
+    """Builds the version of the tyr problem described as `DOMAIN:UID[@VERSION]`."""
+    problem_name, _, version = name.partition("@")
+    problem = domain_scanner.get_problem(problem_name)
+    if problem is None:
+        raise ValueError(f"Unknown problem {problem_name}")
+    return problem.versions[version or "base"].value
+
+
+def measure(function: Callable, runs: int) -> Tuple[List[float], int]:
+    """Times the given function and returns the peak of memory of its first run."""
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings, peak
+
+
+def report(name: str, timings: List[float], peak: int):
+    """Prints the median and the extrema of the timings and the peak of memory."""
+    print(
+        f"{name: <24} median {statistics.median(timings):8.3f}s"
+        f"    min {min(timings):8.3f}s    max {max(timings):8.3f}s"
+        f"    peak {peak / 1024 / 1024:8.1f}MB"
+    )
+
+
+def bench(name: str, problem: Problem, numbers: List[int], runs: int):
+    """Compares the legacy and the bulk reductions of the given problem."""
+    print(name)
+    report(
+        "clone per number",
+        *measure(lambda: [reduce_problem(problem, n) for n in numbers], runs),
+    )
+    report("bulk reduction", *measure(lambda: reduce_problems(problem, numbers), runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("problems", nargs="*", help="Problems as DOMAIN:UID[@VERSION].")
+    parser.add_argument("--goals", type=int, default=500, help="Generated goals.")
+    parser.add_argument(
+        "--numbers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 5, 10, 20, 50, 100],
+        help="Numbers of goals to keep.",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Number of measures.")
+    args = parser.parse_args()
+
+    if args.problems:
+        problems = [(name, get_problem(name)) for name in args.problems]
+    else:
+        problems = [(f"generated-{args.goals}", generate_problem(args.goals))]
+
+    for name, problem in problems:
+        bench(name, problem, args.numbers, args.runs)
+
+
+if __name__ == "__main__":
+    main()
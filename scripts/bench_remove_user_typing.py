@@ -0,0 +1,101 @@
+"""
+Measures the time taken by `converter.remove_user_typing`.
+
+The conversion is timed on the given tyr problems, using the version given after the
+problem name, or on a generated problem with typed objects and many grounded initial
+values when no problem is given.
+
+Usage:
+    python scripts/bench_remove_user_typing.py "rovers:3" "satellite:10@base" [--runs 5]
+    python scripts/bench_remove_user_typing.py --objects 2000 [--runs 5]
+"""
+
+import argparse
+import statistics
+import time
+from typing import List
+
+from unified_planning.shortcuts import (
+    BoolType,
+    Fluent,
+    InstantaneousAction,
+    Not,
+    Problem,
+    UserType,
+)
+
+from tyr.problems import scanner as domain_scanner
+from tyr.problems.converter import remove_user_typing
+
+
+def generate_problem(num_objects: int) -> Problem:
+    """Generates a typed problem with a grounded initial state of quadratic size."""
+    location = UserType("location")
+    robot = UserType("robot", location)
+    at = Fluent("at", BoolType(), r=robot, l=location)
+    link = Fluent("link", BoolType(), a=location, b=location)
+
+    move = InstantaneousAction("move", r=robot, a=location, b=location)
+    r, a, b = move.parameters
+    move.add_precondition(at(r, a))
+    move.add_precondition(link(a, b))
+    move.add_precondition(Not(at(r, b)))
+    move.add_effect(at(r, a), False)
+    move.add_effect(at(r, b), True)
+
+    problem = Problem("generated")
+    problem.add_fluent(at, default_initial_value=False)
+    problem.add_fluent(link, default_initial_value=False)
+    problem.add_action(move)
+    locations = [problem.add_object(f"l{i}", location) for i in range(num_objects)]
+    robots = [problem.add_object(f"r{i}", robot) for i in range(num_objects // 10)]
+    for i, loc in enumerate(locations):
+        for j in range(1, 10):
+            problem.set_initial_value(link(loc, locations[(i + j) % num_objects]), True)
+    for i, rob in enumerate(robots):
+        problem.set_initial_value(at(rob, locations[i]), True)
+        problem.add_goal(at(rob, locations[-i - 1]))
+    return problem
+
+
+def get_problem(name: str) -> Problem:
+    """Builds the version of the tyr problem described as `DOMAIN:UID[@VERSION]`."""
+    problem_name, _, version = name.partition("@")
+    problem = domain_scanner.get_problem(problem_name)
+    if problem is None:
+        raise ValueError(f"Unknown problem {problem_name}")
+    return problem.versions[version or "base"].value
+
+
+def report(name: str, problem: Problem, timings: List[float]):
+    """Prints the median and the extrema of the timings."""
+    print(
+        f"{name: <24} {len(problem.initial_values): >9} init values"
+        f"    median {statistics.median(timings):8.3f}s"
+        f"    min {min(timings):8.3f}s    max {max(timings):8.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("problems", nargs="*", help="Problems as DOMAIN:UID[@VERSION].")
+    parser.add_argument("--objects", type=int, default=1000, help="Generated objects.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measures.")
+    args = parser.parse_args()
+
+    if args.problems:
+        problems = [(name, get_problem(name)) for name in args.problems]
+    else:
+        problems = [(f"generated-{args.objects}", generate_problem(args.objects))]
+
+    for name, problem in problems:
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            remove_user_typing(problem)
+            timings.append(time.perf_counter() - start)
+        report(name, problem, timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Measures the time taken by `converter.scheduling_to_actions`.
+
+The conversion is timed on generated jobshop problems, with jobs made of a chain of
+activities sharing a set of machines, for each of the given numbers of activities.
+
+Usage:
+    python scripts/bench_scheduling_to_actions.py [--activities 1000 10000 50000] [--runs 3]
+"""
+
+import argparse
+import statistics
+import time
+from typing import List
+
+from unified_planning.model.scheduling import Activity, SchedulingProblem
+from unified_planning.shortcuts import LE
+
+from tyr.problems.converter import scheduling_to_actions
+
+
+def generate_problem(num_activities: int, job_size: int = 10) -> SchedulingProblem:
+    """Generates a jobshop problem with the given number of activities."""
+    problem = SchedulingProblem(f"jobshop-{num_activities}")
+    machines = [
+        problem.add_resource(f"machine_{m}", capacity=1) for m in range(job_size)
+    ]
+    activities: List[Activity] = []
+    for act_id in range(num_activities):
+        job, task = divmod(act_id, job_size)
+        activity = Activity(f"t_{job}_{task}", duration=1 + act_id % 7)
+        activity.uses(machines[(job + task) % job_size])
+        if task > 0:
+            problem.add_constraint(LE(activities[-1].end, activity.start))
+        activities.append(activity)
+    # The names are unique by construction, `add_activity` checks them in linear time.
+    problem._activities.extend(activities)  # pylint: disable = protected-access
+    return problem
+
+
+def report(name: str, timings: List[float]):
+    """Prints the median and the extrema of the timings."""
+    print(
+        f"{name: <24} median {statistics.median(timings):8.3f}s"
+        f"    min {min(timings):8.3f}s    max {max(timings):8.3f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--activities",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Numbers of activities of the generated problems.",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Number of measures.")
+    args = parser.parse_args()
+
+    for num_activities in args.activities:
+        problem = generate_problem(num_activities)
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            scheduling_to_actions(problem)
+            timings.append(time.perf_counter() - start)
+        report(f"{num_activities} activities", timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
-# pylint: disable = missing-function-docstring, too-many-arguments, too-many-locals
+# pylint: disable = missing-function-docstring, too-many-arguments, too-many-locals, too-many-lines
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import click
 
@@ -15,6 +15,8 @@ from tyr import (  # type: ignore
     run_table,
 )
 from tyr.__version__ import __version__
+from tyr.cli.cache.runner import run_cache_clear, run_warm
+from tyr.cli.compare.runner import run_compare
 from tyr.cli.plot.runner import run_plot
 from tyr.cli.slurm.runner import run_slurm
 from tyr.core.paths import TyrPaths
@@ -23,10 +25,12 @@ from tyr.core.paths import TyrPaths
 #                                 Configuration                                #
 # ============================================================================ #
 
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG: Dict[str, Any] = {
     "anytime": False,
     "best_column": False,
     "best_row": False,
+    "ci": None,
+    "ci_samples": 10000,
     "db_only": False,
     "db_path": "",
     "domains": [],
@@ -40,9 +44,13 @@ DEFAULT_CONFIG = {
     "latex_horizontal_space": 0.35,
     "latex_pos": "htb",
     "latex_star": False,
+    "leaderboard": None,
     "logs_path": "",
+    "manifest": None,
+    "memory_budget": None,
     "memout": 4 * 1024**3,
     "metrics": [],
+    "no_cache": False,
     "no_db": False,
     "no_db_load": False,
     "no_db_save": False,
@@ -50,16 +58,24 @@ DEFAULT_CONFIG = {
     "nodelist": [],
     "oneshot": False,
     "out": [],
+    "pack": None,
+    "per_domain": False,
+    "persist_best_qualities": False,
     "planner": "",
     "plotters": [],
+    "portfolio": "portfolio",
+    "prewarm": False,
     "planners": [],
     "problem": "",
     "quiet": 0,
+    "save_virtual": False,
     "timeout": 5,
     "timeout_offset": 10,
     "unify_epsilons": False,
     "user_mail": None,
+    "versions_budget": None,
     "verbose": 0,
+    "virtual": [],
 }
 
 
@@ -109,6 +125,11 @@ anytime_option = click.option(
     is_flag=True,
     help="Perform anytime solving method only.",
 )
+cache_path_option = click.option(
+    "--cache-path",
+    type=str,
+    help="Path of the directory storing the parsed problems.",
+)
 config_option = click.option(
     "-c",
     "--config",
@@ -149,11 +170,23 @@ latex_option = click.option(
     is_flag=True,
     help="Generate LaTeX code of the result.",
 )
+leaderboard_option = click.option(
+    "--leaderboard",
+    type=int,
+    help="Print the coverage, time score and quality score of the planners every given \
+number of seconds during the benchmark and on each domain at the end of it.",
+)
 logs_path_option = click.option(
     "--logs-path",
     type=str,
     help="Path to the logs directory.",
 )
+memory_budget_option = click.option(
+    "--memory-budget",
+    type=int,
+    help="Total memory in bytes shared by the parallel resolutions. A new resolution \
+starts only while the sum of the memouts of the running ones fits in the budget.",
+)
 memout_option = click.option(
     "-m",
     "--memout",
@@ -167,6 +200,11 @@ metrics_filter = click.option(
     multiple=True,
     help="A list of regex filters on metric names.",
 )
+no_cache_option = click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not use the cache of the analyses, reload the results from the database.",
+)
 no_db_option = click.option(
     "--no-db",
     is_flag=True,
@@ -208,12 +246,23 @@ plotters_filter = click.option(
     multiple=True,
     help="A list of regex filters on plotter names.",
 )
+prewarm_option = click.option(
+    "--prewarm",
+    is_flag=True,
+    help="Build in parallel the problem versions to solve before the resolutions.",
+)
 quiet_option = click.option(
     "-q",
     "--quiet",
     count=True,
     help="Decrease verbosity.",
 )
+save_virtual_option = click.option(
+    "--save-virtual",
+    is_flag=True,
+    help="Store the results of the virtual best and worst solvers in the database, \
+keyed by their members, and reuse them until a member has a new result.",
+)
 timeout_option = click.option(
     "-t",
     "--timeout",
@@ -237,6 +286,20 @@ verbose_option = click.option(
     count=True,
     help="Increase verbosity.",
 )
+virtual_filter = click.option(
+    "-V",
+    "--virtual",
+    type=str,
+    multiple=True,
+    help="A list of regex filters on the names of the planners combined into the virtual \
+best and worst solvers, added to the analysis as the planners 'vbs' and 'vws'.",
+)
+versions_budget_option = click.option(
+    "--versions-budget",
+    type=int,
+    help="Memory in bytes that the built problem versions can use in each process. "
+    "The least recently used versions are evicted and rebuilt when needed.",
+)
 
 
 # ============================================================================ #
@@ -251,10 +314,12 @@ verbose_option = click.option(
 @out_option
 @logs_path_option
 @db_path_option
+@cache_path_option
 @config_option
 @pass_context
-def cli(ctx: CliContext, verbose, quiet, out, logs_path, db_path, config):
+def cli(ctx: CliContext, verbose, quiet, out, logs_path, db_path, cache_path, config):
     update_context(ctx, verbose, quiet, out, logs_path, db_path, config)
+    TyrPaths().cache = cache_path or TyrPaths().cache
 
 
 def update_context(ctx, verbose, quiet, out, logs_path, db_path, config):
@@ -283,6 +348,7 @@ def update_context(ctx, verbose, quiet, out, logs_path, db_path, config):
 @timeout_option
 @timeout_offset_option
 @memout_option
+@memory_budget_option
 @jobs_option
 @planners_filter
 @domains_filter
@@ -294,6 +360,9 @@ def update_context(ctx, verbose, quiet, out, logs_path, db_path, config):
 @no_db_save_option
 @unify_epsilons_option
 @no_summary_option
+@prewarm_option
+@versions_budget_option
+@leaderboard_option
 @pass_context
 def cli_bench(
     ctx: CliContext,
@@ -306,6 +375,7 @@ def cli_bench(
     timeout: int,
     timeout_offset: int,
     memout: int,
+    memory_budget: int,
     jobs: int,
     planners: List[str],
     domains: List[str],
@@ -317,6 +387,9 @@ def cli_bench(
     no_db_save: bool,
     unify_epsilons: bool,
     no_summary: bool,
+    prewarm: bool,
+    versions_budget: Optional[int],
+    leaderboard: Optional[int],
 ):
     config = config or ctx.config
     cli_config = {
@@ -328,6 +401,7 @@ def cli_bench(
         "timeout": timeout,
         "timeout_offset": timeout_offset,
         "memout": memout,
+        "memory_budget": memory_budget,
         "jobs": jobs,
         "planners": planners,
         "domains": domains,
@@ -339,6 +413,9 @@ def cli_bench(
         "no_db_save": no_db_save,
         "unify_epsilons": unify_epsilons,
         "no_summary": no_summary,
+        "prewarm": prewarm,
+        "versions_budget": versions_budget,
+        "leaderboard": leaderboard,
     }
     conf = merge_configs(cli_config, yaml_config(config, "bench"), DEFAULT_CONFIG)
     update_context(
@@ -386,6 +463,155 @@ def cli_bench(
         conf["domains"],
         running_modes,
         conf["no_summary"],
+        conf["memory_budget"],
+        prewarm=conf["prewarm"],
+        versions_budget=conf["versions_budget"],
+        leaderboard=conf["leaderboard"],
+    )
+
+
+# ============================================================================ #
+#                                     Cache                                    #
+# ============================================================================ #
+
+
+@cli.group(
+    "cache",
+    help="Manage the cache of the parsed problems and of the analyses.",
+)
+def cli_cache():
+    pass
+
+
+@cli_cache.command(
+    "clear",
+    help="Remove all the parsed problems and the analyses from the cache.",
+)
+@verbose_option
+@quiet_option
+@out_option
+@cache_path_option
+@config_option
+@pass_context
+def cli_cache_clear(
+    ctx: CliContext,
+    verbose: int,
+    quiet: int,
+    out,
+    cache_path: str,
+    config,
+):
+    config = config or ctx.config
+    cli_config = {
+        "verbose": verbose,
+        "quiet": quiet,
+        "out": out,
+    }
+    conf = merge_configs(cli_config, yaml_config(config, "cache"), DEFAULT_CONFIG)
+    ctx.verbosity += conf["verbose"] - conf["quiet"]
+    ctx.out.extend(conf["out"])
+    ctx.config = config
+    TyrPaths().cache = cache_path or TyrPaths().cache
+
+    solve_config = SolveConfig(
+        jobs=1,
+        memout=DEFAULT_CONFIG["memout"],
+        timeout=DEFAULT_CONFIG["timeout"],
+        timeout_offset=DEFAULT_CONFIG["timeout_offset"],
+        db_only=False,
+        no_db_load=True,
+        no_db_save=True,
+        unify_epsilons=False,
+    )
+    run_cache_clear(ctx, solve_config)
+
+
+# ============================================================================ #
+#                                    Compare                                   #
+# ============================================================================ #
+
+
+@cli.command(
+    "compare",
+    help="Compare the planners with each other on the results stored in the database.",
+)
+@verbose_option
+@quiet_option
+@out_option
+@logs_path_option
+@db_path_option
+@config_option
+@timeout_option
+@memout_option
+@planners_filter
+@domains_filter
+@click.option(
+    "--colored",
+    is_flag=True,
+    help="Color the matrices by the balance of wins and losses.",
+)
+@latex_option
+@click.option(
+    "--per-domain",
+    is_flag=True,
+    help="Print the matrices of each domain before the overall ones.",
+)
+@no_cache_option
+@pass_context
+def cli_compare(
+    ctx: CliContext,
+    verbose: int,
+    quiet: int,
+    out,
+    logs_path: str,
+    db_path: str,
+    config,
+    timeout: int,
+    memout: int,
+    planners: List[str],
+    domains: List[str],
+    colored: bool,
+    latex: bool,
+    per_domain: bool,
+    no_cache: bool,
+):
+    config = config or ctx.config
+    cli_config = {
+        "verbose": verbose,
+        "quiet": quiet,
+        "out": out,
+        "logs_path": logs_path,
+        "db_path": db_path,
+        "timeout": timeout,
+        "memout": memout,
+        "planners": planners,
+        "domains": domains,
+        "colored": colored,
+        "latex": latex,
+        "per_domain": per_domain,
+        "no_cache": no_cache,
+    }
+    conf = merge_configs(cli_config, yaml_config(config, "compare"), DEFAULT_CONFIG)
+    update_context(
+        ctx,
+        conf["verbose"],
+        conf["quiet"],
+        conf["out"],
+        conf["logs_path"],
+        conf["db_path"],
+        config,
+    )
+
+    run_compare(
+        ctx,
+        conf["timeout"],
+        conf["memout"],
+        conf["planners"],
+        conf["domains"],
+        conf["colored"],
+        conf["latex"],
+        conf["per_domain"],
+        conf["no_cache"],
     )
 
 
@@ -410,6 +636,9 @@ def cli_bench(
 @domains_filter
 @plotters_filter
 @latex_option
+@no_cache_option
+@virtual_filter
+@save_virtual_option
 @pass_context
 def cli_plot(
     ctx: CliContext,
@@ -425,6 +654,9 @@ def cli_plot(
     domains: List[str],
     plotters: List[str],
     latex: bool,
+    no_cache: bool,
+    virtual: List[str],
+    save_virtual: bool,
 ):
     config = config or ctx.config
     cli_config = {
@@ -439,6 +671,9 @@ def cli_plot(
         "domains": domains,
         "plotters": plotters,
         "latex": latex,
+        "no_cache": no_cache,
+        "virtual": virtual,
+        "save_virtual": save_virtual,
     }
     conf = merge_configs(cli_config, yaml_config(config, "plot"), DEFAULT_CONFIG)
     update_context(
@@ -459,6 +694,118 @@ def cli_plot(
         conf["domains"],
         conf["plotters"],
         conf["latex"],
+        conf["no_cache"],
+        conf["virtual"],
+        conf["save_virtual"],
+    )
+
+
+# ============================================================================ #
+#                                     Race                                     #
+# ============================================================================ #
+
+
+@cli.command(
+    "race",
+    help="Race several planners on each problem and save the portfolio results in the \
+database.",
+)
+@verbose_option
+@quiet_option
+@out_option
+@logs_path_option
+@db_path_option
+@config_option
+@timeout_option
+@timeout_offset_option
+@memout_option
+@planners_filter
+@domains_filter
+@anytime_option
+@oneshot_option
+@no_db_option
+@no_db_load_option
+@no_db_save_option
+@click.option(
+    "--portfolio",
+    type=str,
+    help="Name under which the results of the race are saved, followed by the sorted "
+    f"names of the racers. Default to '{DEFAULT_CONFIG['portfolio']}'.",
+)
+@no_summary_option
+@pass_context
+def cli_race(
+    ctx: CliContext,
+    verbose: int,
+    quiet: int,
+    out,
+    logs_path: str,
+    db_path: str,
+    config,
+    timeout: int,
+    timeout_offset: int,
+    memout: int,
+    planners: List[str],
+    domains: List[str],
+    anytime: bool,
+    oneshot: bool,
+    no_db: bool,
+    no_db_load: bool,
+    no_db_save: bool,
+    portfolio: str,
+    no_summary: bool,
+):
+    config = config or ctx.config
+    cli_config = {
+        "verbose": verbose,
+        "quiet": quiet,
+        "out": out,
+        "logs_path": logs_path,
+        "db_path": db_path,
+        "timeout": timeout,
+        "timeout_offset": timeout_offset,
+        "memout": memout,
+        "planners": planners,
+        "domains": domains,
+        "anytime": anytime,
+        "oneshot": oneshot,
+        "no_db": no_db,
+        "no_db_load": no_db_load,
+        "no_db_save": no_db_save,
+        "portfolio": portfolio,
+        "no_summary": no_summary,
+    }
+    conf = merge_configs(cli_config, yaml_config(config, "race"), DEFAULT_CONFIG)
+    update_context(
+        ctx,
+        conf["verbose"],
+        conf["quiet"],
+        conf["out"],
+        conf["logs_path"],
+        conf["db_path"],
+        config,
+    )
+
+    running_modes = merge_running_modes(conf["anytime"], conf["oneshot"])
+    solve_config = SolveConfig(
+        jobs=1,
+        memout=conf["memout"],
+        timeout=conf["timeout"],
+        timeout_offset=conf["timeout_offset"],
+        db_only=False,
+        no_db_load=conf["no_db_load"] or conf["no_db"],
+        no_db_save=conf["no_db_save"] or conf["no_db"],
+        unify_epsilons=False,
+    )
+
+    run_bench(
+        ctx,
+        solve_config,
+        conf["planners"],
+        conf["domains"],
+        running_modes,
+        conf["no_summary"],
+        portfolio=conf["portfolio"],
     )
 
 
@@ -495,6 +842,18 @@ def cli_plot(
     multiple=True,
     help="The list of nodes to use on the cluster.",
 )
+@click.option(
+    "--pack",
+    type=int,
+    help="Pack the (planner, problem, mode) jobs into array tasks of roughly equal "
+    "expected wall time under this budget in seconds, based on the database history.",
+)
+@click.option(
+    "--manifest",
+    type=str,
+    help="Path of the manifest listing the jobs of each packed task. "
+    "Default to a timestamped file in the current directory.",
+)
 @pass_context
 def cli_slurm(
     ctx: CliContext,
@@ -513,6 +872,8 @@ def cli_slurm(
     oneshot: bool,
     user_mail: str,
     nodelist: List[str],
+    pack: Optional[int],
+    manifest: Optional[str],
 ):
     config = config or ctx.config
     cli_config = {
@@ -530,6 +891,8 @@ def cli_slurm(
         "oneshot": oneshot,
         "user_mail": user_mail,
         "nodelist": nodelist,
+        "pack": pack,
+        "manifest": manifest,
     }
     conf = merge_configs(cli_config, yaml_config(config, "slurm"), DEFAULT_CONFIG)
     update_context(
@@ -563,6 +926,8 @@ def cli_slurm(
         running_modes,
         conf["user_mail"],
         conf["nodelist"],
+        conf["pack"],
+        conf["manifest"],
     )
 
 
@@ -677,6 +1042,19 @@ def cli_solve(
 @planners_filter
 @domains_filter
 @metrics_filter
+@jobs_option
+@click.option(
+    "--ci",
+    type=float,
+    help="Print the bootstrap confidence intervals of the values at the given level "
+    "in percent, e.g. 95. The problems of each domain are resampled with replacement.",
+)
+@click.option(
+    "--ci-samples",
+    type=int,
+    help="Number of bootstrap samples used to compute the confidence intervals. "
+    f"Default: {DEFAULT_CONFIG['ci_samples']}",
+)
 @click.option(
     "--colored",
     is_flag=True,
@@ -716,6 +1094,15 @@ def cli_solve(
     is_flag=True,
     help="Use a table* environment in LaTeX. Default: table.",
 )
+@no_cache_option
+@click.option(
+    "--persist-best-qualities",
+    is_flag=True,
+    help="Merge the best qualities of the problems with the ones stored in the database "
+    "and store them back, so that quality scores stay stable across partial results.",
+)
+@virtual_filter
+@save_virtual_option
 @pass_context
 def cli_table(
     ctx: CliContext,
@@ -730,6 +1117,9 @@ def cli_table(
     planners: List[str],
     domains: List[str],
     metrics: List[str],
+    jobs: int,
+    ci: Optional[float],
+    ci_samples: int,
     latex: bool,
     latex_array_stretch: float,
     latex_caption: str,
@@ -738,6 +1128,10 @@ def cli_table(
     latex_horizontal_space: float,
     latex_pos: str,
     latex_star: bool,
+    no_cache: bool,
+    persist_best_qualities: bool,
+    virtual: List[str],
+    save_virtual: bool,
 ):
     config = config or ctx.config
     cli_config = {
@@ -751,6 +1145,9 @@ def cli_table(
         "planners": planners,
         "domains": domains,
         "metrics": metrics,
+        "jobs": jobs,
+        "ci": ci,
+        "ci_samples": ci_samples,
         "latex": latex,
         "latex_array_stretch": latex_array_stretch,
         "latex_caption": latex_caption,
@@ -759,6 +1156,10 @@ def cli_table(
         "latex_horizontal_space": latex_horizontal_space,
         "latex_pos": latex_pos,
         "latex_star": latex_star,
+        "no_cache": no_cache,
+        "persist_best_qualities": persist_best_qualities,
+        "virtual": virtual,
+        "save_virtual": save_virtual,
     }
     conf = merge_configs(cli_config, yaml_config(config, "table"), DEFAULT_CONFIG)
     update_context(
@@ -771,6 +1172,12 @@ def cli_table(
         config,
     )
 
+    if conf["ci"] is not None and not 0 < conf["ci"] < 100:
+        raise click.BadOptionUsage(
+            "--ci",
+            "The confidence level must be between 0 and 100.",
+        )
+
     run_table(
         ctx,
         conf["timeout"],
@@ -786,7 +1193,72 @@ def cli_table(
         conf["latex_horizontal_space"],
         conf["latex_pos"],
         conf["latex_star"],
+        conf["persist_best_qualities"],
+        conf["ci"],
+        conf["ci_samples"],
+        conf["jobs"],
+        conf["no_cache"],
+        conf["virtual"],
+        conf["save_virtual"],
+    )
+
+
+# ============================================================================ #
+#                                     Warm                                     #
+# ============================================================================ #
+
+
+@cli.command(
+    "warm",
+    help="Build in parallel the problem versions solved by the planners and store them \
+in the cache.",
+)
+@verbose_option
+@quiet_option
+@out_option
+@cache_path_option
+@config_option
+@jobs_option
+@planners_filter
+@domains_filter
+@pass_context
+def cli_warm(
+    ctx: CliContext,
+    verbose: int,
+    quiet: int,
+    out,
+    cache_path: str,
+    config,
+    jobs: int,
+    planners: List[str],
+    domains: List[str],
+):
+    config = config or ctx.config
+    cli_config = {
+        "verbose": verbose,
+        "quiet": quiet,
+        "out": out,
+        "jobs": jobs,
+        "planners": planners,
+        "domains": domains,
+    }
+    conf = merge_configs(cli_config, yaml_config(config, "warm"), DEFAULT_CONFIG)
+    ctx.verbosity += conf["verbose"] - conf["quiet"]
+    ctx.out.extend(conf["out"])
+    ctx.config = config
+    TyrPaths().cache = cache_path or TyrPaths().cache
+
+    solve_config = SolveConfig(
+        jobs=conf["jobs"],
+        memout=DEFAULT_CONFIG["memout"],
+        timeout=DEFAULT_CONFIG["timeout"],
+        timeout_offset=DEFAULT_CONFIG["timeout_offset"],
+        db_only=False,
+        no_db_load=True,
+        no_db_save=True,
+        unify_epsilons=False,
     )
+    run_warm(ctx, solve_config, conf["planners"], conf["domains"])
 
 
 if __name__ == "__main__":
@@ -1,15 +1,28 @@
-from . import bench, collector, config, solve, table, writter
+from . import (
+    analysis_cache,
+    bench,
+    collector,
+    config,
+    result_set,
+    solve,
+    table,
+    writter,
+)
+from .analysis_cache import *
 from .bench import *
 from .collector import *
 from .config import *
+from .result_set import *
 from .solve import *
 from .table import *
 from .writter import *
 
 __all__ = (
-    bench.__all__
+    analysis_cache.__all__
+    + bench.__all__
     + collector.__all__
     + config.__all__
+    + result_set.__all__
     + solve.__all__
     + table.__all__
     + writter.__all__
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import pickle  # nosec: B403
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from tyr.__version__ import __version__
+from tyr.core.paths import TyrPaths
+from tyr.patterns.singleton import Singleton
+
+
+class AnalysisCache(Singleton):
+    """
+    Persistent cache of the results loaded and the values computed by the analyses.
+
+    An entry is identified by the version of tyr and by the inputs of the analysis,
+    which include the fingerprint of the database for the loaded results. Any new result
+    in the database changes the keys of the analyses, so the entries never need to be
+    invalidated by hand.
+    """
+
+    extension = "pkl"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.enabled = True
+
+    @property
+    def folder(self) -> Path:
+        """
+        Returns:
+            Path: The directory storing the cached analyses.
+        """
+        return TyrPaths().cache / "analyses"
+
+    # ================================== Access ================================== #
+
+    def get_key(self, *parts: Any) -> str:
+        """Computes the key of the analysis with the given inputs.
+
+        Args:
+            *parts (Any): The inputs of the analysis, with a deterministic representation.
+
+        Returns:
+            str: The key of the analysis in the cache.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"tyr={__version__};".encode())
+        digest.update(repr(parts).encode())
+        return digest.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        """
+        Args:
+            key (str): The key of an analysis.
+
+        Returns:
+            Path: The file storing the analysis with the given key.
+        """
+        return self.folder / f"{key}.{self.extension}"
+
+    def load(self, key: str) -> Optional[Any]:
+        """Loads the analysis with the given key from the cache.
+
+        Args:
+            key (str): The key of the analysis.
+
+        Returns:
+            Optional[Any]: The cached analysis, `None` if it is absent or unreadable.
+        """
+        if not self.enabled:
+            return None
+        try:
+            return pickle.loads(self.get_path(key).read_bytes())  # nosec: B301
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+    def save(self, key: str, value: Any) -> bool:
+        """Saves the given analysis in the cache.
+
+        The file is written atomically so that concurrent processes never read a partial entry.
+
+        Args:
+            key (str): The key of the analysis.
+            value (Any): The analysis to save.
+
+        Returns:
+            bool: Whether the analysis has been saved.
+        """
+        if not self.enabled:
+            return False
+        try:
+            content = pickle.dumps(value)
+            self.folder.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp_path, self.get_path(key))
+            return True
+        except Exception:  # pylint: disable=broad-exception-caught
+            return False
+
+    # ================================ Management ================================ #
+
+    def clear(self) -> int:
+        """Removes all the entries of the cache.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        if not self.folder.exists():
+            return 0
+        removed = 0
+        for file in self.folder.iterdir():
+            if file.suffix in [f".{self.extension}", ".tmp"]:
+                file.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+__all__ = ["AnalysisCache"]
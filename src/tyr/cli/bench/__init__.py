@@ -1,5 +1,6 @@
-from . import runner, terminal_writter
+from . import runner, scheduler, terminal_writter
 from .runner import *
+from .scheduler import *
 from .terminal_writter import *
 
-__all__ = runner.__all__ + terminal_writter.__all__
+__all__ = runner.__all__ + scheduler.__all__ + terminal_writter.__all__
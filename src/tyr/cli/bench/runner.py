@@ -1,20 +1,94 @@
+import contextlib
 import multiprocessing
-from typing import Dict, List, TypeVar
+import threading
+from dataclasses import dataclass, replace
+from queue import Queue
+from typing import Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from joblib import Parallel, delayed
 
 from tyr.cli import collector
+from tyr.cli.bench.scheduler import MemoryBudget
 from tyr.cli.bench.terminal_writter import BenchResult, BenchTerminalWritter
+from tyr.cli.cache.runner import get_needed_versions, warm_versions
 from tyr.cli.config import CliContext
+from tyr.planners import scanner as planner_scanner
 from tyr.planners.loader import register_all_planners
-from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.config import PlannerConfig, RunningMode, SolveConfig
 from tyr.planners.model.planner import Planner
+from tyr.planners.model.portfolio_planner import PortfolioPlanner
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.problems import scanner as domain_scanner
+from tyr.problems.cache import ProblemCache
+from tyr.problems.eviction import VersionEvictor
 from tyr.problems.model.domain import AbstractDomain
 from tyr.problems.model.instance import ProblemInstance
 
 I = TypeVar("I")  # noqa: E741
 
 
+@dataclass(frozen=True)
+class BenchEvent:
+    """The compact progress event sent by a worker after one resolution."""
+
+    job_id: int
+    status: PlannerResultStatus
+    computation_time: Optional[float]
+    plan_quality: Optional[float]
+    from_database: bool
+    error_message: str
+
+    @staticmethod
+    def from_planner(job_id: int, result: PlannerResult) -> "BenchEvent":
+        """Converts the given planner result into a progress event.
+
+        Args:
+            job_id (int): The identifier of the job producing the result.
+            result (PlannerResult): The result to convert.
+
+        Returns:
+            BenchEvent: The converted event.
+        """
+        return BenchEvent(
+            job_id,
+            result.status,
+            result.computation_time,
+            result.plan_quality,
+            result.from_database,
+            result.error_message,
+        )
+
+    def to_planner_result(
+        self,
+        planner: Planner,
+        problem: ProblemInstance,
+        solve_config: SolveConfig,
+        running_mode: RunningMode,
+    ) -> PlannerResult:
+        """Rebuilds the planner result described by the event.
+
+        Args:
+            planner (Planner): The planner of the job.
+            problem (ProblemInstance): The problem of the job.
+            solve_config (SolveConfig): The configuration used for the resolution.
+            running_mode (RunningMode): The running mode of the job.
+
+        Returns:
+            PlannerResult: The rebuilt result.
+        """
+        return PlannerResult(
+            planner.name,
+            problem,
+            running_mode,
+            self.status,
+            solve_config,
+            self.computation_time,
+            self.plan_quality,
+            self.error_message,
+            self.from_database,
+        )
+
+
 # pylint: disable = too-many-arguments
 def _solve(
     tw: BenchTerminalWritter,
@@ -31,6 +105,76 @@ def _solve(
     tw.report_planner_result(problem.domain, planner, result)
 
 
+def _solve_job(
+    events: "Queue[Optional[BenchEvent]]",
+    job_id: int,
+    planner_name: str,
+    problem_name: str,
+    solve_config: SolveConfig,
+    running_mode: RunningMode,
+    versions_budget: Optional[int],
+):
+    # Only names are sent to the workers, the planner and the problem are rebuilt
+    # locally and kept in the scanners caches for the next jobs of the worker.
+    register_all_planners()
+    VersionEvictor().budget = versions_budget
+    ProblemCache().enabled = True
+    planner = planner_scanner.get_planner(planner_name)
+    problem = domain_scanner.get_problem(problem_name)
+    if planner is None or problem is None:
+        missing = planner_name if planner is None else problem_name
+        events.put(
+            BenchEvent(
+                job_id,
+                PlannerResultStatus.ERROR,
+                None,
+                None,
+                False,
+                f"Cannot find {missing} in the worker.",
+            )
+        )
+        return
+    result = planner.solve_single(problem, solve_config, running_mode)
+    events.put(BenchEvent.from_planner(job_id, result))
+
+
+def _render_events(
+    tw: BenchTerminalWritter,
+    events: "Queue[Optional[BenchEvent]]",
+    jobs: List[Tuple[Planner, ProblemInstance, RunningMode]],
+    solve_config: SolveConfig,
+    memory_budget: MemoryBudget,
+):
+    while (event := events.get()) is not None:
+        planner, problem, running_mode = jobs[event.job_id]
+        config = planner.get_solve_config(solve_config)
+        memory_budget.release(config.memout)
+        result = event.to_planner_result(planner, problem, config, running_mode)
+        tw.report_planner_result(problem.domain, planner, result)
+
+
+def _dispatch_jobs(
+    events: "Queue[Optional[BenchEvent]]",
+    jobs: List[Tuple[Planner, ProblemInstance, RunningMode]],
+    solve_config: SolveConfig,
+    memory_budget: MemoryBudget,
+    versions_budget: Optional[int],
+) -> Iterator:
+    # The generator is consumed lazily by joblib, a job is only dispatched once its
+    # memout is reserved. The reservation is released when its event is rendered.
+    for job_id, (planner, problem, running_mode) in enumerate(jobs):
+        memory_budget.acquire(planner.get_solve_config(solve_config).memout)
+        yield delayed(_solve_job)(
+            events,
+            job_id,
+            planner.name,
+            problem.name,
+            solve_config,
+            running_mode,
+            versions_budget,
+        )
+
+
 def _sort_items(items: List[I]) -> List[I]:
     return sorted(
         items,
@@ -42,7 +186,7 @@ def _sort_items(items: List[I]) -> List[I]:
     )
 
 
-# pylint: disable = too-many-locals
+# pylint: disable = too-many-locals, too-many-branches, too-many-statements
 def run_bench(
     ctx: CliContext,
     solve_config: SolveConfig,
@@ -50,6 +194,11 @@ def run_bench(
     domain_filters: List[str],
     running_modes: List[RunningMode],
     no_summary: bool,
+    memory_budget: Optional[int] = None,
+    portfolio: Optional[str] = None,
+    prewarm: bool = False,
+    versions_budget: Optional[int] = None,
+    leaderboard: Optional[int] = None,
 ):
     """Compares a set of planners over a bench of problems.
 
@@ -61,18 +210,50 @@ def run_bench(
         domains_filters (List[str]): A list of regex filters on problems names.
         running_modes (List[RunningMode]): A list of mode to run planner resolutions.
         no_summary (bool): If True, the summary will not be displayed.
+        memory_budget (Optional[int], optional): The total memory in bytes that the
+            memouts of the concurrent resolutions can reserve. Defaults to None.
+        portfolio (Optional[str], optional): When given, the selected planners race on
+            each problem as a portfolio of this name. Defaults to None.
+        prewarm (bool, optional): If True, the versions to solve are built in parallel
+            and stored in the problem cache before the resolutions. Defaults to False.
+        versions_budget (Optional[int], optional): The memory in bytes that the built
+            versions of the problems can use in each process before the least recently
+            used ones are evicted. Defaults to None.
+        leaderboard (Optional[int], optional): When given, the scores of the planners
+            are printed every given number of seconds and at the end of the session.
+            Defaults to None.
     """
+    VersionEvictor().budget = versions_budget
+    ProblemCache().enabled = True
+
+    # The members of a portfolio already run concurrently, problems are raced in turn.
+    prewarm_jobs = solve_config.jobs
+    if portfolio is not None:
+        solve_config = replace(solve_config, jobs=1)
 
     # Create the writter and start the session.
     tw = BenchTerminalWritter(
-        solve_config, ctx.out, ctx.verbosity, ctx.config, no_summary
+        solve_config, ctx.out, ctx.verbosity, ctx.config, no_summary, leaderboard
     )
     tw.session_starts()
 
     # Collect the planners and the problems to use for the benchmark.
     planners = collector.collect_planners(*planner_filters)
+    if portfolio is not None:
+        members = _sort_items(planners.selected)
+        config = PlannerConfig(portfolio, portfolio=[m.name for m in members])
+        planners = collector.CollectionResult(
+            [PortfolioPlanner(config, members)], planners.deselected
+        )
     problems = collector.collect_problems(*domain_filters)
+
+    # Build the versions before they are needed, they are then loaded from the cache.
+    if prewarm:
+        versions = get_needed_versions(planners.selected, problems.selected)
+        warmed = [w[2] for w in warm_versions(versions, prewarm_jobs)]
     tw.report_collect(planners, problems, running_modes)
+    if prewarm:
+        tw.report_prewarmed(sum(warmed), len(warmed))
 
     # Group problems by domains.
     pb_by_dom: Dict[AbstractDomain, List[ProblemInstance]] = {}
@@ -111,24 +292,44 @@ def run_bench(
 
         else:
             tw.line()
+            tw.set_results(results)
 
+            # Workers only receive names and send back compact events, the writter
+            # lives in this process.
+            jobs = [
+                (planner, problem, running_mode)
+                for running_mode in running_modes
+                for domain in srtd_domains
+                for planner in srtd_planners
+                for problem in pb_by_dom[domain]
+            ]
+            budget = MemoryBudget(memory_budget)
             with multiprocessing.Manager() as manager:
-                shared_results = manager.list(results)
-                Parallel(n_jobs=solve_config.jobs)(
-                    delayed(_solve)(
-                        tw,
-                        shared_results,
-                        planner,
-                        problem,
-                        solve_config,
-                        running_mode,
-                    )
-                    for running_mode in running_modes
-                    for domain in srtd_domains
-                    for planner in srtd_planners
-                    for problem in pb_by_dom[domain]
+                events = manager.Queue()
+                renderer = threading.Thread(
+                    target=_render_events,
+                    args=(tw, events, jobs, solve_config, budget),
+                    daemon=True,
                 )
-                results = shared_results[:]
+                renderer.start()
+                try:
+                    # Do not queue more jobs than workers when memory is reserved at
+                    # dispatch time, otherwise idle queued jobs would hold the budget.
+                    Parallel(
+                        n_jobs=solve_config.jobs,
+                        pre_dispatch=(
+                            "2 * n_jobs" if memory_budget is None else "n_jobs"
+                        ),
+                    )(
+                        _dispatch_jobs(
+                            events, jobs, solve_config, budget, versions_budget
+                        )
+                    )
+                finally:
+                    budget.close()
+                    with contextlib.suppress(OSError, EOFError):
+                        events.put(None)
+                    renderer.join()
     except KeyboardInterrupt:
         tw.line()
         tw.line()
@@ -140,4 +341,4 @@ def run_bench(
     tw.session_finished()
 
 
-__all__ = ["run_bench"]
+__all__ = ["BenchEvent", "run_bench"]
@@ -0,0 +1,71 @@
+import threading
+from typing import Optional
+
+
+class MemoryBudget:
+    """
+    Admission control of concurrent resolutions based on their reserved memory.
+
+    A resolution is admitted while the sum of the reserved memory, including its own,
+    fits in the budget. A resolution larger than the whole budget is admitted alone.
+    Without budget, every resolution is admitted immediately.
+    """
+
+    def __init__(self, budget: Optional[int] = None) -> None:
+        if budget is not None and budget <= 0:
+            raise ValueError("The memory budget must be positive.")
+        self._budget = budget
+        self._reserved = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def budget(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The total memory budget in bytes, `None` if unlimited.
+        """
+        return self._budget
+
+    @property
+    def reserved(self) -> int:
+        """
+        Returns:
+            int: The memory currently reserved by the admitted resolutions in bytes.
+        """
+        with self._condition:
+            return self._reserved
+
+    def _fits(self, amount: int) -> bool:
+        if self._budget is None or self._closed or self._reserved == 0:
+            return True
+        return self._reserved + amount <= self._budget
+
+    def acquire(self, amount: int) -> None:
+        """Blocks until the given amount of memory can be reserved, then reserves it.
+
+        Args:
+            amount (int): The memory to reserve in bytes.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._fits(amount))
+            self._reserved += amount
+
+    def release(self, amount: int) -> None:
+        """Releases memory reserved by a finished resolution.
+
+        Args:
+            amount (int): The memory to release in bytes.
+        """
+        with self._condition:
+            self._reserved = max(0, self._reserved - amount)
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Admits all the waiting and future resolutions, used when the session stops."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+__all__ = ["MemoryBudget"]
@@ -1,10 +1,15 @@
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, TextIO, Tuple, Union
+from typing import Dict, Hashable, List, Optional, TextIO, Tuple, Union, cast
 
 from tyr.cli.collector import CollectionResult
 from tyr.cli.writter import Writter
+from tyr.metrics.accumulator import AccumulatedScores, MetricAccumulator
+from tyr.metrics.metric import Metric
+from tyr.metrics.metrics.coverage import CoverageMetric
+from tyr.metrics.metrics.quality_score import QualityScoreMetric
+from tyr.metrics.metrics.time_score import TimeScoreMetric
 from tyr.planners.model.config import RunningMode, SolveConfig
 from tyr.planners.model.planner import Planner
 from tyr.planners.model.result import PlannerResult, PlannerResultStatus
@@ -41,7 +46,7 @@ class BenchResult:
         )
 
 
-class BenchTerminalWritter(Writter):
+class BenchTerminalWritter(Writter):  # pylint: disable=too-many-instance-attributes
     """Utility class to write content of the benchmark on the terminal."""
 
     _default_version_name = "base"
@@ -63,9 +68,18 @@ class BenchTerminalWritter(Writter):
         verbosity: int = 0,
         config: Optional[Path] = None,
         no_summary: bool = True,
+        leaderboard: Optional[int] = None,
     ) -> None:
         super().__init__(solve_config, out, verbosity, config)
         self._no_summary = no_summary
+        self._leaderboard = leaderboard
+        self._leaderboard_time = time.time()
+        self._scores = MetricAccumulator(self._score_key)
+        self._metrics: List[Metric] = [
+            CoverageMetric(),
+            TimeScoreMetric(),
+            QualityScoreMetric(),
+        ]
         self._num_to_run = 0
         self._planner_max_length = 0
         self._problem_max_length = 0
@@ -93,6 +107,7 @@ class BenchTerminalWritter(Writter):
         self.line()
         self.summary_errors()
         self.summary_short()
+        self.summary_leaderboard()
         self.summary_stats()
 
     # ================================== Summary ================================= #
@@ -187,6 +202,23 @@ class BenchTerminalWritter(Writter):
         if self.current_line_width != 0:
             self.line()
 
+    def summary_leaderboard(self):
+        """Prints the final scores of the planners on each domain."""
+        if self._leaderboard is None or len(self._scores) == 0:
+            return
+
+        by_domain: Dict[str, Dict[Tuple[str, str], List[Hashable]]] = {}
+        for key in self._scores.keys():
+            planner_name, running_mode, domain_name = cast(Tuple[str, str, str], key)
+            by_domain.setdefault(domain_name, {})[(planner_name, running_mode)] = [key]
+
+        self.separator("=", "leaderboard", cyan=True, bold=True)
+        for domain_name in sorted(by_domain):
+            self.line(domain_name, bold=True)
+            self._write_scores(by_domain[domain_name])
+        self.line("all domains", bold=True)
+        self._write_scores(self._planner_groups())
+
     # pylint: disable=too-many-locals
     def summary_stats(self):
         """Prints a summary of the statistics of the run benchmark."""
@@ -263,6 +295,20 @@ class BenchTerminalWritter(Writter):
         self.report_collected(planners, "planner")
         self.report_collected(problems, "problem")
 
+    def report_prewarmed(self, num_warmed: int, num_versions: int):
+        """Prints a report about the versions built before the resolutions.
+
+        Args:
+            num_warmed (int): The number of versions built and cached.
+            num_versions (int): The number of versions to build.
+        """
+        if self.quiet:
+            return
+        line = f"prewarmed {num_warmed} version" + ("" if num_warmed <= 1 else "s")
+        if num_warmed < num_versions:
+            line += f" / {num_versions - num_warmed} failed"
+        self.line(line, bold=True)
+
     def report_running_mode(self, running_mode: RunningMode):
         """Prints a report about a new running mode.
 
@@ -318,6 +364,7 @@ class BenchTerminalWritter(Writter):
             result (PlannerResult): The resolution result of the planner.
         """
         self._results.append(BenchResult.from_planner(result))
+        self._scores.add(result)
         letter, markup_key = self._status_map[result.status]
 
         markup = {markup_key: True}
@@ -401,5 +448,61 @@ class BenchTerminalWritter(Writter):
         fill = self._fullwidth - self.current_line_width
         self.line(msg.rjust(fill), **{self._main_color: True})
 
+        if (
+            self._leaderboard is not None
+            and time.time() - self._leaderboard_time >= self._leaderboard
+        ):
+            self.report_leaderboard()
+
+    def report_leaderboard(self):
+        """Prints the current scores of the planners over all the domains."""
+        self._leaderboard_time = time.time()
+        if self.quiet or len(self._scores) == 0:
+            return
+        self.separator("-", "leaderboard")
+        self._write_scores(self._planner_groups())
+        self.separator("-")
+
+    # ================================== Scores ================================== #
+
+    @staticmethod
+    def _score_key(result: PlannerResult) -> Tuple[str, str, str]:
+        return (
+            result.planner_name,
+            result.running_mode.name.lower(),
+            result.problem.domain.name,
+        )
+
+    def _planner_groups(self) -> Dict[Tuple[str, str], List[Hashable]]:
+        groups: Dict[Tuple[str, str], List[Hashable]] = {}
+        for key in self._scores.keys():
+            planner_name, running_mode, _ = cast(Tuple[str, str, str], key)
+            groups.setdefault((planner_name, running_mode), []).append(key)
+        return groups
+
+    def _write_scores(self, groups: Dict[Tuple[str, str], List[Hashable]]):
+        """Prints the scores of the given groups, from the best to the worst.
+
+        Args:
+            groups (Dict[Tuple[str, str], List[Hashable]]): The keys of the scores of
+                each planner and running mode.
+        """
+        scores = {name: self._scores.scores(keys) for name, keys in groups.items()}
+        ranking = sorted(
+            scores.items(),
+            key=lambda s: (-s[1].coverage, -s[1].time_score, -s[1].quality_score, s[0]),
+        )
+        name_width = max(len(f"{p} - {m}") for p, m in scores)
+        for (planner_name, running_mode), score in ranking:
+            self.write(f"    {f'{planner_name} - {running_mode}': <{name_width}}")
+            for metric, value in zip(self._metrics, self._score_values(score)):
+                self.write(f"    {metric.abbrev()} ")
+                self.write(f"{metric.format_value(value): >6}", cyan=True)
+            self.line(f"    ({score.num_results} results)")
+
+    @staticmethod
+    def _score_values(score: AccumulatedScores) -> List[float]:
+        return [score.coverage, score.time_score, score.quality_score]
+
 
 __all__ = ["BenchResult", "BenchTerminalWritter"]
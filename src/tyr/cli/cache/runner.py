@@ -0,0 +1,144 @@
+import time
+import traceback
+from typing import Iterator, List, Sequence, Set, Tuple
+
+from joblib import Parallel, delayed
+
+from tyr.cli import collector
+from tyr.cli.analysis_cache import AnalysisCache
+from tyr.cli.cache.terminal_writter import CacheTerminalWritter
+from tyr.cli.config import CliContext
+from tyr.planners.model.config import SolveConfig
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.portfolio_planner import PortfolioPlanner
+from tyr.problems import scanner as domain_scanner
+from tyr.problems.cache import ProblemCache
+from tyr.problems.model.instance import ProblemInstance
+
+
+def _warm_version(problem_name: str, version_name: str) -> Tuple[str, str, bool, float]:
+    """Builds the given version of the problem to store it in the cache.
+
+    Args:
+        problem_name (str): The name of the problem to warm.
+        version_name (str): The name of the version to warm.
+
+    Returns:
+        Tuple[str, str, bool, float]: The names of the problem and of the version,
+            whether the version has been built and the time spent.
+    """
+    start = time.time()
+    ProblemCache().enabled = True
+    problem = domain_scanner.get_problem(problem_name)
+    try:
+        if problem is None or version_name not in problem.versions:
+            success = False
+        else:
+            lazy = problem.versions[version_name]
+            key = ProblemCache().get_version_key(problem, version_name)
+            if key is None:
+                success = lazy.value is not None
+            else:
+                success = (
+                    ProblemCache().get_or_build(key, lambda: lazy.value) is not None
+                )
+    except Exception:  # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+        success = False
+    return problem_name, version_name, success, time.time() - start
+
+
+def get_needed_versions(
+    planners: Sequence[Planner],
+    problems: Sequence[ProblemInstance],
+) -> List[Tuple[str, str]]:
+    """Lists the versions the planners solve, as chosen by their configurations.
+
+    Args:
+        planners (Sequence[Planner]): The planners of the benchmark.
+        problems (Sequence[ProblemInstance]): The problems of the benchmark.
+
+    Returns:
+        List[Tuple[str, str]]: The names of the problems and of the versions to build.
+    """
+    versions: Set[Tuple[str, str]] = set()
+    for planner in planners:
+        members = (
+            planner.members if isinstance(planner, PortfolioPlanner) else [planner]
+        )
+        for member in members:
+            for problem in problems:
+                version_name = member.config.problems.get(problem.domain.name, "base")
+                versions.add((problem.name, version_name))
+    return sorted(versions)
+
+
+def warm_versions(
+    versions: List[Tuple[str, str]],
+    jobs: int,
+) -> Iterator[Tuple[str, str, bool, float]]:
+    """Builds the given versions in parallel and stores them in the problem cache.
+
+    Args:
+        versions (List[Tuple[str, str]]): The names of the problems and of the versions.
+        jobs (int): The number of processes to use.
+
+    Returns:
+        Iterator[Tuple[str, str, bool, float]]: The outcome of each version, as soon as
+            it is warmed.
+    """
+    # The workers only receive the names, the problems are rebuilt on their side.
+    yield from Parallel(n_jobs=jobs, return_as="generator_unordered")(
+        delayed(_warm_version)(problem_name, version_name)
+        for problem_name, version_name in versions
+    )
+
+
+def run_cache_clear(ctx: CliContext, solve_config: SolveConfig):
+    """Removes all the entries of the problem cache and of the analysis cache.
+
+    Args:
+        ctx (CliContext): The CLI execution context.
+        solve_config (SolveConfig): The configuration of the session.
+    """
+    tw = CacheTerminalWritter(solve_config, ctx.out, ctx.verbosity, ctx.config)
+    tw.session_starts()
+    tw.report_cleared(ProblemCache().clear() + AnalysisCache().clear())
+
+
+def run_warm(
+    ctx: CliContext,
+    solve_config: SolveConfig,
+    planner_filters: List[str],
+    domain_filters: List[str],
+):
+    """Builds the versions solved by the selected planners on the selected problems.
+
+    The versions are built in parallel and stored in the problem cache, where the
+    resolutions find them.
+
+    Args:
+        ctx (CliContext): The CLI execution context.
+        solve_config (SolveConfig): The configuration of the session.
+        planner_filters (List[str]): A list of regex filters on planner names.
+        domain_filters (List[str]): A list of regex filters on problems names.
+    """
+    tw = CacheTerminalWritter(solve_config, ctx.out, ctx.verbosity, ctx.config)
+    tw.session_starts()
+
+    planners = collector.collect_planners(*planner_filters)
+    problems = collector.collect_problems(*domain_filters)
+    tw.rewrite("")
+    tw.report_collected(planners, "planner")
+    tw.report_collected(problems, "problem")
+
+    versions = get_needed_versions(planners.selected, problems.selected)
+    for problem_name, version_name, success, duration in warm_versions(
+        versions, solve_config.jobs
+    ):
+        tw.report_warmed(problem_name, version_name, success, duration)
+
+    tw.session_finished()
+
+
+__all__ = ["get_needed_versions", "run_cache_clear", "run_warm", "warm_versions"]
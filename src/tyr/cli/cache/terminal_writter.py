@@ -0,0 +1,84 @@
+import time
+from pathlib import Path
+from typing import List, Optional, TextIO, Union
+
+from tyr.cli.writter import Writter
+from tyr.planners.model.config import SolveConfig
+from tyr.problems.cache import ProblemCache
+
+
+class CacheTerminalWritter(Writter):
+    """Utility class to write content of the cache management on the terminal."""
+
+    def __init__(
+        self,
+        solve_config: SolveConfig,
+        out: Union[Optional[TextIO], List[TextIO]] = None,
+        verbosity: int = 0,
+        config: Optional[Path] = None,
+    ) -> None:
+        super().__init__(solve_config, out, verbosity, config)
+        self._num_warmed = 0
+        self._num_failed = 0
+
+    # ================================== Report ================================== #
+
+    def report_solve_config(self):
+        """Prints a report about the cache being managed."""
+        if self.quiet:
+            return
+        folder = ProblemCache().folder.resolve().absolute()
+        self.line(f"cache: {folder} -- jobs: {self._solve_config.jobs}")
+
+    def report_cleared(self, removed: int):
+        """Prints a report about the clearing of the cache.
+
+        Args:
+            removed (int): The number of removed entries.
+        """
+        self.rewrite("")
+        if not self.quiet:
+            self.line(f"removed {removed} entr" + ("y" if removed == 1 else "ies"))
+
+    def report_warmed(
+        self,
+        problem_name: str,
+        version_name: str,
+        success: bool,
+        duration: float,
+    ):
+        """Prints a report about the warming of a problem version.
+
+        Args:
+            problem_name (str): The name of the warmed problem.
+            version_name (str): The name of the warmed version.
+            success (bool): Whether the version has been built.
+            duration (float): The time spent to warm the version.
+        """
+        if success:
+            self._num_warmed += 1
+        else:
+            self._num_failed += 1
+        if self.verbose:
+            status = "OK" if success else "FAILED"
+            markup = {"green": True} if success else {"red": True}
+            self.write(f"{problem_name + ' ' + version_name: <50} ")
+            self.line(f"{status} ({duration:.2f}s)", **markup)
+
+    # ================================== Session ================================= #
+
+    def session_name(self) -> str:
+        return "cache"
+
+    def session_finished(self):
+        """Prints summary of the finished cache session."""
+        session_duration = int(time.time() - self._starttime)
+        msg = f"{self._num_warmed} warmed"
+        if self._num_failed:
+            msg += f", {self._num_failed} failed"
+        msg += f" in {self.format_seconds(session_duration)}"
+        color = "red" if self._num_failed else "green"
+        self.separator("=", msg, **{color: True})
+
+
+__all__ = ["CacheTerminalWritter"]
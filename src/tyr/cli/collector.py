@@ -1,11 +1,12 @@
 import re
 from dataclasses import dataclass, field
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Sequence, TypeVar, Union
 
 from tyr.metrics import scanner as metric_scanner
 from tyr.metrics.metric import Metric
 from tyr.planners import scanner as planner_scanner
 from tyr.planners.model.planner import Planner
+from tyr.planners.model.virtual_planner import VirtualPlanner, virtual_planners
 from tyr.plotters import scanner as plotter_scanner
 from tyr.plotters.plotter import Plotter
 from tyr.problems import scanner as domain_scanner
@@ -19,7 +20,7 @@ class CollectionResult(Generic[T]):
     """Stores the result of a collection."""
 
     selected: List[T] = field(default_factory=list)
-    deselected: List[T] = field(default_factory=list)
+    deselected: Sequence[Union[T, str]] = field(default_factory=list)
     skipped: List[None] = field(default_factory=list)
 
     @property
@@ -87,6 +88,31 @@ def collect_planners(*filters: str) -> CollectionResult[Planner]:
     return CollectionResult(selected, deselected)
 
 
+def collect_virtual_planners(
+    planners: List[Planner],
+    *filters: str,
+) -> List[VirtualPlanner]:
+    """
+    Args:
+        planners (List[Planner]): The planners the members are chosen from.
+        filters (List[str]): A list of regex filters on the names of the members.
+
+    Returns:
+        List[VirtualPlanner]: The virtual best and worst solvers of the planners
+            matching a filter, none without filters.
+    """
+    if len(filters) == 0:
+        return []
+
+    re_filters = [re.compile(flt) for flt in filters]
+    members = [
+        planner
+        for planner in planners
+        if any(re_filter.match(planner.name) is not None for re_filter in re_filters)
+    ]
+    return virtual_planners(members)
+
+
 def collect_plotters(
     *filters: str,
 ) -> CollectionResult[Plotter]:
@@ -118,34 +144,40 @@ def collect_plotters(
 
 def collect_problems(*filters: str) -> CollectionResult[ProblemInstance]:
     """
+    The filters are matched against the problem names before building them, so only the
+    selected problems are built. The deselected problems are only given by name. The
+    domains are refreshed first to take into account the changes in their files.
+
     Args:
         filters (List[str]): A list of regex filters on problem names.
 
     Returns:
         CollectionResult[Planner]: The collected problems for the benchmark.
     """
-    all_problems = [
-        d.get_problem(p + 1)
-        for d in domain_scanner.get_all_domains()
+    domains = domain_scanner.get_all_domains()
+    for domain in domains:
+        domain.refresh()
+    all_names = [
+        (d, p + 1, f"{d.name}:{p + 1}")
+        for d in domains
         for p in range(d.get_num_problems())
     ]
-    skipped = [p for p in all_problems if p is None]
-    available = [p for p in all_problems if p is not None]
-    selected: List[ProblemInstance] = []
 
-    if len(filters) == 0:
-        return CollectionResult(available, [], skipped)
+    selected_names = all_names
+    deselected: List[str] = []
+    if len(filters) != 0:
+        re_filters = [re.compile(flt) for flt in filters]
+        selected_names = []
+        for domain, uid, name in all_names:
+            if any(f.match(name) is not None for f in re_filters):
+                selected_names.append((domain, uid, name))
+            else:
+                deselected.append(name)
 
-    for flt in filters:
-        re_filter = re.compile(flt)
-
-        for problem in available:
-            if re_filter.match(problem.name) is not None:
-                selected.append(problem)
-
-    selected = list(set(selected))  # Remove duplicates
-    desectected = [p for p in available if p not in selected]
-    return CollectionResult(selected, desectected, skipped)
+    built = [d.get_problem(uid) for d, uid, _ in selected_names]
+    skipped = [p for p in built if p is None]
+    selected = [p for p in built if p is not None]
+    return CollectionResult(selected, deselected, skipped)
 
 
 __all__ = [
@@ -153,5 +185,6 @@ __all__ = [
     "collect_planners",
     "collect_plotters",
     "collect_problems",
+    "collect_virtual_planners",
     "CollectionResult",
 ]
@@ -0,0 +1,5 @@
+from . import runner, terminal_writter
+from .runner import *
+from .terminal_writter import *
+
+__all__ = runner.__all__ + terminal_writter.__all__
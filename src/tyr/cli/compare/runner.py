@@ -0,0 +1,71 @@
+from typing import List
+
+from tyr.cli import collector
+from tyr.cli.analysis_cache import AnalysisCache
+from tyr.cli.compare.terminal_writter import CompareTerminalWritter
+from tyr.cli.config import CliContext
+from tyr.cli.result_set import load_result_set
+from tyr.metrics.pairwise import compare_planners
+from tyr.planners.model.config import SolveConfig
+
+
+# pylint: disable=too-many-arguments
+def run_compare(
+    ctx: CliContext,
+    timeout: int,
+    memout: int,
+    planner_filters: List[str],
+    domain_filters: List[str],
+    colored: bool,
+    latex: bool,
+    per_domain: bool,
+    no_cache: bool = False,
+):
+    """Compares the planners with each other based on the database content.
+
+    Args:
+        ctx (CliContext): The CLI execution context.
+        timeout (int): The timeout limit to use for planner results.
+        memout (int): The memory out limit to use for planner results.
+        planner_filters (List[str]): A list of regex filters on planner names.
+        domains_filters (List[str]): A list of regex filters on problems names.
+        colored (bool): Whether to color the matrices by the balance of wins and losses.
+        latex (bool): Whether to print the matrices in LaTeX format.
+        per_domain (bool): Whether to print the matrices of each domain as well.
+        no_cache (bool, optional): Whether to ignore the analysis cache, loading the
+            results from the database again. Defaults to False.
+    """
+    # pylint: disable = duplicate-code
+
+    # Create the writter and start the session.
+    solve_config = SolveConfig(1, memout, timeout, 0, True, False, True, False)
+    tw = CompareTerminalWritter(
+        solve_config,
+        ctx.out,
+        ctx.verbosity,
+        ctx.config,
+        colored,
+        latex,
+        per_domain,
+    )
+    tw.session_starts()
+
+    # Collect the planners and the problems to compare.
+    planners = collector.collect_planners(*planner_filters)
+    problems = collector.collect_problems(*domain_filters)
+    tw.report_collect(planners, problems)
+
+    # Get the results from the database, or from the cache if it has not changed.
+    AnalysisCache().enabled = not no_cache
+    result_set = load_result_set(planners.selected, problems.selected, solve_config)
+    if not result_set.is_consistent:
+        tw.report_inconsistencies(result_set.inconsistencies)
+        return
+    results = result_set.results
+    tw.report_results(results)
+
+    # Compare all the pairs of planners at once.
+    tw.report_comparison(compare_planners(results))
+
+
+__all__ = ["run_compare"]
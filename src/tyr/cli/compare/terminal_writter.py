@@ -0,0 +1,198 @@
+from pathlib import Path
+from typing import List, Optional, TextIO, Union
+
+import numpy as np
+
+from tyr.cli.collector import CollectionResult
+from tyr.cli.writter import Writter
+from tyr.metrics.pairwise import CRITERIA, PairwiseComparison
+from tyr.planners.model.config import SolveConfig
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.result import PlannerResult
+from tyr.problems.model.instance import ProblemInstance
+
+
+class CompareTerminalWritter(Writter):
+    """A terminal writter for the compare command."""
+
+    def __init__(  # pylint: disable = too-many-arguments
+        self,
+        solve_config: SolveConfig,
+        out: Union[Optional[TextIO], List[TextIO]] = None,
+        verbosity: int = 0,
+        config: Optional[Path] = None,
+        colored: bool = False,
+        latex: bool = False,
+        per_domain: bool = False,
+    ) -> None:
+        super().__init__(solve_config, out, verbosity, config)
+        self._colored = colored
+        self._latex = latex
+        self._per_domain = per_domain
+
+    # ================================= Reports ================================== #
+
+    def report_collect(
+        self,
+        planners: CollectionResult[Planner],
+        problems: CollectionResult[ProblemInstance],
+    ) -> None:
+        """Prints a report about the collection of planners and problems.
+
+        Args:
+            planners (CollectionResult[Planner]): The collection result on planners.
+            problems (CollectionResult[ProblemInstance]): The collection result on problems.
+        """
+        self.rewrite("")
+        self.report_collected(planners, "planner")
+        self.report_collected(problems, "problem")
+
+    def report_results(self, results: List[PlannerResult]):
+        """Prints a report about the collected results."""
+        if self.quiet:
+            return
+        total = len(results)
+        msg = f"collected {total} result" + ("" if total <= 1 else "s")
+        self.line(msg, bold=True)
+
+    def report_comparison(self, comparison: PairwiseComparison) -> None:
+        """Prints the matrices of wins, ties and losses of the planners.
+
+        The matrices of each domain are printed before the overall ones when the
+        comparison is done per domain.
+
+        Args:
+            comparison (PairwiseComparison): The comparison of the planners.
+        """
+        domains: List[Optional[str]] = []
+        if self._per_domain:
+            domains.extend(comparison.domains)
+        domains.append(None)
+        for domain in domains:
+            for criterion in CRITERIA:
+                self.line()
+                if self._latex:
+                    self.latex_matrix(comparison, criterion, domain)
+                else:
+                    self.terminal_matrix(comparison, criterion, domain)
+
+    # ================================= Matrices ================================= #
+
+    @staticmethod
+    def heat(wins: int, ties: int, losses: int) -> float:
+        """
+        Args:
+            wins (int): The number of wins of a planner against another one.
+            ties (int): The number of ties between them.
+            losses (int): The number of losses of the planner against the other one.
+
+        Returns:
+            float: The balance of the wins and losses, between -1 and 1.
+        """
+        total = wins + ties + losses
+        return 0 if total == 0 else (wins - losses) / total
+
+    @staticmethod
+    def scope(criterion: str, domain: Optional[str]) -> str:
+        """
+        Returns:
+            str: The title of the matrix of the given criterion and domain.
+        """
+        return f"{criterion} ({'all domains' if domain is None else domain})"
+
+    def terminal_matrix(  # pylint: disable = too-many-locals
+        self, comparison: PairwiseComparison, criterion: str, domain: Optional[str]
+    ) -> None:
+        """Prints a matrix of wins, ties and losses in the terminal.
+
+        The columns are numbered after the rows to keep the matrix narrow with many
+        planners, the last one sums the results of the planner against all the others.
+
+        Args:
+            comparison (PairwiseComparison): The comparison of the planners.
+            criterion (str): The criterion to print.
+            domain (Optional[str]): The domain to print, all the domains if `None`.
+        """
+        wins, ties, losses = comparison.counts(criterion, domain)
+        labels = [f"{i + 1}. {p}" for i, p in enumerate(comparison.planners)]
+        rows = [
+            [self.cell_text(wins, ties, losses, i, j) for j in range(len(labels))]
+            + [f"{wins[i].sum()}/{ties[i].sum()}/{losses[i].sum()}"]
+            for i in range(len(labels))
+        ]
+        headers = [str(j + 1) for j in range(len(labels))] + ["total"]
+        width = max(len(text) for row in [headers] + rows for text in row)
+        label_width = max((len(label) for label in labels), default=0)
+
+        self.line(f"{self.scope(criterion, domain)}: wins/ties/losses", bold=True)
+        self.line(" " * label_width + "".join(f" │ {h:^{width}}" for h in headers))
+        for i, label in enumerate(labels):
+            cells = []
+            for j, text in enumerate(rows[i]):
+                text = f"{text:>{width}}"
+                if self._colored and j < len(labels) and i != j:
+                    heat = self.heat(wins[i, j], ties[i, j], losses[i, j])
+                    text = self.markup(
+                        text, green=heat > 0, red=heat < 0, bold=abs(heat) >= 0.5
+                    )
+                cells.append(f" │ {text}")
+            self.line(label.ljust(label_width) + "".join(cells))
+
+    def latex_matrix(  # pylint: disable = too-many-locals
+        self, comparison: PairwiseComparison, criterion: str, domain: Optional[str]
+    ) -> None:
+        """Prints a matrix of wins, ties and losses in LaTeX.
+
+        The cells are colored by the balance of the wins and losses when the output is
+        colored, which requires the `table` option of the `xcolor` package.
+
+        Args:
+            comparison (PairwiseComparison): The comparison of the planners.
+            criterion (str): The criterion to print.
+            domain (Optional[str]): The domain to print, all the domains if `None`.
+        """
+        wins, ties, losses = comparison.counts(criterion, domain)
+        num_planners = len(comparison.planners)
+        self.line("\\begin{table}[htb]")
+        self.line("\\centering")
+        self.line("\\footnotesize")
+        self.line("\\begin{tabular}{l" + "c" * (num_planners + 1) + "}")
+        self.line("\\toprule")
+        headers = [str(j + 1) for j in range(num_planners)] + ["Total"]
+        self.line(" & " + " & ".join(headers) + " \\\\")
+        self.line("\\midrule")
+        for i, planner in enumerate(comparison.planners):
+            cells = [f"{i + 1}. {planner}"]
+            for j in range(num_planners):
+                text = self.cell_text(wins, ties, losses, i, j)
+                heat = self.heat(wins[i, j], ties[i, j], losses[i, j])
+                if self._colored and i != j and heat != 0:
+                    color = "green" if heat > 0 else "red"
+                    text = f"\\cellcolor{{{color}!{round(abs(heat) * 50)}}}{text}"
+                cells.append(text)
+            cells.append(f"{wins[i].sum()}/{ties[i].sum()}/{losses[i].sum()}")
+            self.line(" & ".join(cells) + " \\\\")
+        self.line("\\bottomrule")
+        self.line("\\end{tabular}")
+        scope = self.scope(criterion, domain)
+        self.line(f"\\caption{{Wins, ties and losses on {scope}.}}")
+        self.line(f"\\label{{tab:compare-{criterion}-{domain or 'all'}}}")
+        self.line("\\end{table}")
+
+    @staticmethod
+    def cell_text(
+        wins: np.ndarray, ties: np.ndarray, losses: np.ndarray, i: int, j: int
+    ) -> str:
+        """
+        Returns:
+            str: The wins, ties and losses of the planner `i` against the planner `j`.
+        """
+        if i == j:
+            return "-"
+        return f"{wins[i, j]}/{ties[i, j]}/{losses[i, j]}"
+
+    def session_name(self) -> str:
+        return "compare"
+
+
+__all__ = ["CompareTerminalWritter"]
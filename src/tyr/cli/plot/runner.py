@@ -1,11 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from tyr.cli import collector
+from tyr.cli.analysis_cache import AnalysisCache
 from tyr.cli.config import CliContext
 from tyr.cli.plot.terminal_writter import PlotTerminalWritter
-from tyr.planners.database import Database
-from tyr.planners.model.config import RunningMode, SolveConfig
-from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.cli.result_set import add_virtual_results, load_result_set
+from tyr.planners.model.config import SolveConfig
 
 
 # pylint: disable=too-many-arguments, too-many-locals
@@ -17,6 +17,9 @@ def run_plot(
     domain_filters: List[str],
     plot_filters: List[str],
     latex: bool,
+    no_cache: bool = False,
+    virtual_filters: Optional[List[str]] = None,
+    save_virtual: bool = False,
 ):
     """Analyse the planners over the domains based on the database content.
 
@@ -28,6 +31,13 @@ def run_plot(
         domains_filters (List[str]): A list of regex filters on problems names.
         plot_filters (List[str]): A list of regex filters on plot names.
         latex (bool): If True, the plots will be generated in latex format.
+        no_cache (bool, optional): Whether to ignore the analysis cache, loading the
+            results from the database again. Defaults to False.
+        virtual_filters (Optional[List[str]], optional): A list of regex filters on the
+            names of the planners combined into the virtual best and worst solvers.
+            Defaults to None, in which case no virtual solver is added.
+        save_virtual (bool, optional): Whether to store the results of the virtual
+            solvers in the database and reuse the stored ones. Defaults to False.
     """
     # pylint: disable = duplicate-code
 
@@ -40,50 +50,19 @@ def run_plot(
     planners = collector.collect_planners(*planner_filters)
     problems = collector.collect_problems(*domain_filters)
     plotters = collector.collect_plotters(*plot_filters)
+    virtual = collector.collect_virtual_planners(
+        planners.selected, *(virtual_filters or [])
+    )
     tw.report_collect(planners, problems, plotters)
 
-    # Get the results from the database.
-    results: List[PlannerResult] = []
-    for planner in planners.selected:
-        for problem in problems.selected:
-            for running_mode in RunningMode:
-                result = Database().load_planner_result(
-                    planner.name,
-                    problem,
-                    solve_config,
-                    running_mode,
-                    keep_unsupported=True,
-                )
-                if result is None:
-                    result = PlannerResult.not_run(
-                        problem, planner, solve_config, running_mode
-                    )
-                results.append(result)
-
-    # Filter the results.
-    results = [
-        r
-        for r in results
-        if not any(
-            r1.status == PlannerResultStatus.NOT_RUN
-            for r1 in results
-            if r1.problem.name == r.problem.name and r1.running_mode == r.running_mode
-        )
-    ]
-    for r in results:
-        if r.status == PlannerResultStatus.UNSUPPORTED and not all(
-            r1.status == PlannerResultStatus.UNSUPPORTED
-            for r1 in results
-            if r1.problem.domain == r.problem.domain
-            and r1.planner_name == r.planner_name
-            and r1.running_mode == r.running_mode
-        ):
-            msg = f"Unsupported results on domain {r.problem.domain.name} \
-are not consistent for planner {r.planner_name}."
-            tw.line()
-            tw.write("[ERROR]", bold=True, red=True)
-            tw.line(f" {msg}", red=True)
-            return
+    # Get the results from the database, or from the cache if it has not changed.
+    AnalysisCache().enabled = not no_cache
+    result_set = load_result_set(planners.selected, problems.selected, solve_config)
+    result_set = add_virtual_results(result_set, virtual, save_virtual)
+    if not result_set.is_consistent:
+        tw.report_inconsistencies(result_set.inconsistencies)
+        return
+    results = result_set.results
     tw.report_results(results)
 
     # Perform the plots.
@@ -0,0 +1,273 @@
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+from tyr.cli.analysis_cache import AnalysisCache
+from tyr.planners.database import Database
+from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.planners.model.virtual_planner import (
+    VirtualPlanner,
+    synthesize_virtual_results,
+)
+from tyr.problems.model.domain import AbstractDomain
+from tyr.problems.model.instance import ProblemInstance
+
+
+@dataclass(frozen=True)
+class InconsistentGroup:
+    """A group of results where a planner supports only some problems of a domain."""
+
+    domain: AbstractDomain
+    planner_name: str
+    running_mode: RunningMode
+
+    def message(self) -> str:
+        """
+        Returns:
+            str: The description of the inconsistency.
+        """
+        return (
+            f"Unsupported results on domain {self.domain.name} are not consistent "
+            f"for planner {self.planner_name} in {self.running_mode.name.lower()} mode."
+        )
+
+
+@dataclass
+class ResultSet:
+    """Stores the results of the planners on the problems used by an analysis."""
+
+    results: List[PlannerResult] = field(default_factory=list)
+    inconsistencies: List[InconsistentGroup] = field(default_factory=list)
+    key: Optional[str] = None
+
+    @property
+    def is_consistent(self) -> bool:
+        """
+        Returns:
+            bool: Whether the unsupported results are consistent in all the groups.
+        """
+        return len(self.inconsistencies) == 0
+
+
+def load_result_set(
+    planners: List[Planner],
+    problems: List[ProblemInstance],
+    solve_config: SolveConfig,
+    with_solutions: bool = False,
+) -> ResultSet:
+    """Loads the results of the planners on the problems from the database.
+
+    The problems which have not been run by every planner in a running mode are
+    dropped for this mode, and the groups of results where a planner only supports a
+    part of a domain are reported.
+
+    The result set is stored in the analysis cache, keyed by the fingerprint of the
+    database, and reused as long as no result is added to the database.
+
+    Args:
+        planners (List[Planner]): The planners to analyse.
+        problems (List[ProblemInstance]): The problems to analyse.
+        solve_config (SolveConfig): The configuration of the results to load.
+        with_solutions (bool, optional): Whether to load the intermediate solutions of
+            the anytime results. Defaults to False.
+
+    Returns:
+        ResultSet: The filtered results and the inconsistent groups.
+    """
+    key = AnalysisCache().get_key(
+        "results",
+        Database().fingerprint(),
+        [
+            (p.name, p.get_solve_config(solve_config))
+            for p in sorted(planners, key=lambda p: p.name)
+        ],
+        sorted(p.name for p in problems),
+        solve_config,
+        with_solutions,
+    )
+    cached = AnalysisCache().load(key)
+    if cached is not None:
+        result_set = _from_cache(cached, problems)
+        if result_set is not None:
+            result_set.key = key
+            return result_set
+
+    results = drop_not_run(load_results(planners, problems, solve_config))
+    if with_solutions:
+        results = Database().load_anytime_solutions(results)
+    result_set = ResultSet(results, find_inconsistencies(results), key)
+    AnalysisCache().save(key, _to_cache(result_set))
+    return result_set
+
+
+def _to_cache(result_set: ResultSet) -> Tuple[list, list]:
+    # The problems are not picklable, the results only keep their names.
+    results = [
+        replace(r, problem=r.problem.name) for r in result_set.results  # type: ignore
+    ]
+    inconsistencies = [
+        (i.domain.name, i.planner_name, i.running_mode)
+        for i in result_set.inconsistencies
+    ]
+    return results, inconsistencies
+
+
+def _from_cache(
+    cached: Tuple[list, list], problems: List[ProblemInstance]
+) -> Optional[ResultSet]:
+    by_name = {p.name: p for p in problems}
+    domains = {p.domain.name: p.domain for p in problems}
+    try:
+        results, inconsistencies = cached
+        return ResultSet(
+            [replace(r, problem=by_name[r.problem]) for r in results],
+            [
+                InconsistentGroup(domains[domain], planner_name, running_mode)
+                for domain, planner_name, running_mode in inconsistencies
+            ],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def add_virtual_results(
+    result_set: ResultSet,
+    planners: List[VirtualPlanner],
+    save: bool = False,
+) -> ResultSet:
+    """Adds the results of the virtual planners to the result set.
+
+    Args:
+        result_set (ResultSet): The results of the members of the virtual planners.
+        planners (List[VirtualPlanner]): The virtual planners.
+        save (bool, optional): Whether to reuse the results of the virtual planners
+            stored in the database for the same members, and to store the missing ones.
+            Defaults to False.
+
+    Returns:
+        ResultSet: The result set with the synthesised results, keyed by the members
+            of the virtual planners as well. Its inconsistent groups include the ones
+            of the virtual planners.
+    """
+    if not planners:
+        return result_set
+    if save:
+        synthesized = [
+            r for p in planners for r in _load_virtual_results(p, result_set.results)
+        ]
+    else:
+        synthesized = synthesize_virtual_results(planners, result_set.results)
+    key = result_set.key
+    if key is not None:
+        members = [(p.name, sorted(m.name for m in p.members)) for p in planners]
+        key = AnalysisCache().get_key("virtual", key, members)
+    results = result_set.results + synthesized
+    return ResultSet(results, find_inconsistencies(results), key)
+
+
+def _load_virtual_results(
+    planner: VirtualPlanner, results: List[PlannerResult]
+) -> List[PlannerResult]:
+    # The stored results are outdated as soon as a member has a new result.
+    members = sorted({m.name for m in planner.members})
+    results = [r for r in results if r.planner_name in members]
+    last_result = Database().last_result_id(members)
+    stored = Database().load_virtual_results(
+        planner.name, members, last_result, results
+    )
+    done = {(r.problem.name, r.running_mode) for r in stored}
+    missing = [r for r in results if (r.problem.name, r.running_mode) not in done]
+    if not missing:
+        return stored
+    # The stored results keep the quality curves, whichever analysis uses them next.
+    synthesized = synthesize_virtual_results(
+        [planner], Database().load_anytime_solutions(missing)
+    )
+    Database().save_virtual_results(members, last_result, synthesized)
+    return stored + synthesized
+
+
+def load_results(
+    planners: List[Planner],
+    problems: List[ProblemInstance],
+    solve_config: SolveConfig,
+) -> List[PlannerResult]:
+    """Loads the results of the planners on the problems in every running mode.
+
+    Args:
+        planners (List[Planner]): The planners of the results.
+        problems (List[ProblemInstance]): The problems of the results.
+        solve_config (SolveConfig): The configuration of the results to load.
+
+    Returns:
+        List[PlannerResult]: The loaded results, not run ones when they are missing.
+    """
+    results: List[PlannerResult] = []
+    for planner in planners:
+        for problem in problems:
+            for running_mode in RunningMode:
+                result = Database().load_planner_result(
+                    planner.name,
+                    problem,
+                    planner.get_solve_config(solve_config),
+                    running_mode,
+                    keep_unsupported=True,
+                )
+                if result is None:
+                    result = PlannerResult.not_run(
+                        problem, planner, solve_config, running_mode
+                    )
+                results.append(result)
+    return results
+
+
+def drop_not_run(results: List[PlannerResult]) -> List[PlannerResult]:
+    """Drops the results on problems not run by some planner in the same running mode.
+
+    Args:
+        results (List[PlannerResult]): The results to filter.
+
+    Returns:
+        List[PlannerResult]: The results on the problems run by all the planners.
+    """
+    not_run = {
+        (r.problem.name, r.running_mode)
+        for r in results
+        if r.status == PlannerResultStatus.NOT_RUN
+    }
+    return [r for r in results if (r.problem.name, r.running_mode) not in not_run]
+
+
+def find_inconsistencies(results: List[PlannerResult]) -> List[InconsistentGroup]:
+    """Finds the groups of results where a planner supports only a part of a domain.
+
+    Args:
+        results (List[PlannerResult]): The results to check.
+
+    Returns:
+        List[InconsistentGroup]: The inconsistent groups, by order of first appearance.
+    """
+    # Whether some and whether all the results of each group are unsupported.
+    groups: Dict[Tuple[AbstractDomain, str, RunningMode], Tuple[bool, bool]] = {}
+    for result in results:
+        key = (result.problem.domain, result.planner_name, result.running_mode)
+        unsupported = result.status == PlannerResultStatus.UNSUPPORTED
+        some, every = groups.get(key, (False, True))
+        groups[key] = (some or unsupported, every and unsupported)
+    return [
+        InconsistentGroup(*key)
+        for key, (some, every) in groups.items()
+        if some and not every
+    ]
+
+
+__all__ = [
+    "InconsistentGroup",
+    "ResultSet",
+    "add_virtual_results",
+    "drop_not_run",
+    "find_inconsistencies",
+    "load_result_set",
+    "load_results",
+]
@@ -1,5 +1,6 @@
-from . import runner, terminal_writter
+from . import packer, runner, terminal_writter
+from .packer import *
 from .runner import *
 from .terminal_writter import *
 
-__all__ = runner.__all__ + terminal_writter.__all__
+__all__ = packer.__all__ + runner.__all__ + terminal_writter.__all__
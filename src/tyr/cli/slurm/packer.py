@@ -0,0 +1,150 @@
+import heapq
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+from tyr.planners.database import Database
+from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.result import PlannerResultStatus
+from tyr.problems.model.instance import ProblemInstance
+
+
+@dataclass(frozen=True)
+class SlurmJob:
+    """A single resolution to run on the cluster."""
+
+    planner: Planner
+    problem: ProblemInstance
+    running_mode: RunningMode
+    expected_time: float
+    # The memory limit of the planner, with its own override of the global one.
+    memout: int
+
+
+@dataclass
+class SlurmTask:
+    """A set of jobs run sequentially by one task of the slurm array."""
+
+    jobs: List[SlurmJob] = field(default_factory=list)
+
+    @property
+    def expected_time(self) -> float:
+        """
+        Returns:
+            float: The expected wall time of the task in seconds.
+        """
+        return sum(job.expected_time for job in self.jobs)
+
+
+def estimate_time(
+    planner: Planner,
+    problem: ProblemInstance,
+    solve_config: SolveConfig,
+    running_mode: RunningMode,
+) -> float:
+    """Estimates the wall time of a resolution based on the database history.
+
+    When no result is known, the worst case is assumed, i.e. the timeout and its offset.
+
+    Args:
+        planner (Planner): The planner to run.
+        problem (ProblemInstance): The problem to solve.
+        solve_config (SolveConfig): The configuration to use for the resolution.
+        running_mode (RunningMode): The mode to run the resolution.
+
+    Returns:
+        float: The expected wall time in seconds.
+    """
+    worst_case = float(solve_config.timeout + solve_config.timeout_offset)
+    if not planner.supports_running_mode(running_mode):
+        return 0.0
+
+    result = Database().load_planner_result(
+        planner.name,
+        problem,
+        planner.get_solve_config(solve_config),
+        running_mode,
+        keep_unsupported=True,
+    )
+    if result is None or result.status == PlannerResultStatus.TIMEOUT:
+        return worst_case
+    if result.status == PlannerResultStatus.UNSUPPORTED:
+        return 0.0
+    if (
+        running_mode == RunningMode.ANYTIME
+        and result.status == PlannerResultStatus.SOLVED
+    ):
+        # Anytime planners keep improving their solution until the timeout.
+        return float(solve_config.timeout)
+    if result.computation_time is None:
+        return worst_case
+    return min(float(result.computation_time), float(solve_config.timeout))
+
+
+def pack_jobs(jobs: List[SlurmJob], budget: float) -> List[SlurmTask]:
+    """Packs the jobs into tasks of roughly equal expected wall time.
+
+    The jobs are distributed with the longest processing time first rule over the
+    smallest number of tasks such that no task exceeds the budget.
+    A job longer than the budget gets its own task.
+
+    Args:
+        jobs (List[SlurmJob]): The jobs to pack.
+        budget (float): The target wall time of a task in seconds.
+
+    Raises:
+        ValueError: When the budget is not positive.
+
+    Returns:
+        List[SlurmTask]: The packed tasks, none of them being empty.
+    """
+    if budget <= 0:
+        raise ValueError("The packing budget must be positive.")
+    if len(jobs) == 0:
+        return []
+
+    srtd_jobs = sorted(
+        jobs,
+        key=lambda j: (-j.expected_time, j.planner.name, j.problem.name),
+    )
+    total = sum(job.expected_time for job in srtd_jobs)
+    num_tasks = max(1, math.ceil(total / budget))
+
+    while True:
+        tasks = [SlurmTask() for _ in range(num_tasks)]
+        heap = [(0.0, i) for i in range(num_tasks)]
+        for job in srtd_jobs:
+            load, idx = heapq.heappop(heap)
+            tasks[idx].jobs.append(job)
+            heapq.heappush(heap, (load + job.expected_time, idx))
+
+        if all(t.expected_time <= budget or len(t.jobs) == 1 for t in tasks):
+            return [t for t in tasks if len(t.jobs) > 0]
+        num_tasks += 1
+
+
+def write_manifest(tasks: List[SlurmTask], path: Path) -> None:
+    """Writes the job list of each task in a tab separated manifest file.
+
+    Each line is of the form `TASK_ID PLANNER PROBLEM MODE MEMOUT`.
+
+    Args:
+        tasks (List[SlurmTask]): The tasks to write.
+        path (Path): The path of the manifest file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        for task_id, task in enumerate(tasks):
+            for job in task.jobs:
+                line = [
+                    str(task_id),
+                    job.planner.name,
+                    job.problem.name,
+                    job.running_mode.name.lower(),
+                    str(job.memout),
+                ]
+                file.write("\t".join(line) + "\n")
+
+
+__all__ = ["SlurmJob", "SlurmTask", "estimate_time", "pack_jobs", "write_manifest"]
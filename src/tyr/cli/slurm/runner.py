@@ -1,12 +1,15 @@
+import datetime
+from pathlib import Path
 from typing import List, Optional
 
 from tyr.cli import collector
 from tyr.cli.config import CliContext
+from tyr.cli.slurm.packer import SlurmJob, estimate_time, pack_jobs, write_manifest
 from tyr.cli.slurm.terminal_writter import SlurmTerminalWritter
 from tyr.planners.model.config import RunningMode, SolveConfig
 
 
-# pylint: disable=too-many-arguments
+# pylint: disable=too-many-arguments, too-many-locals
 def run_slurm(
     ctx: CliContext,
     solve_config: SolveConfig,
@@ -15,6 +18,8 @@ def run_slurm(
     running_modes: List[RunningMode],
     user_mail: Optional[str],
     nodelist: List[str],
+    pack_budget: Optional[int] = None,
+    manifest: Optional[str] = None,
 ):
     """Create the slurm bash script to run the resolution.
 
@@ -27,6 +32,10 @@ def run_slurm(
         running_modes (List[RunningMode]): A list of mode to run planner resolutions.
         user_mail (Optional[str]): The email to send the notifications.
         nodes (List[str]): The list of nodes to use on the cluster.
+        pack_budget (Optional[int]): The target wall time of an array task in seconds.
+            If given, the jobs are packed into tasks of roughly equal expected time.
+        manifest (Optional[str]): The path of the manifest listing the jobs of each task.
+            Defaults to a timestamped file in the current directory.
     """
 
     # Create the writter and start the session.
@@ -38,6 +47,34 @@ def run_slurm(
     problems = collector.collect_problems(*domain_filters)
     tw.report_collect(planners, problems)
 
+    # Pack the jobs into tasks of roughly equal expected wall time.
+    if pack_budget is not None:
+        jobs = [
+            SlurmJob(
+                planner,
+                problem,
+                running_mode,
+                estimate_time(planner, problem, solve_config, running_mode),
+                planner.get_solve_config(solve_config).memout,
+            )
+            for planner in planners.selected
+            for problem in problems.selected
+            for running_mode in running_modes
+            if planner.supports_running_mode(running_mode)
+        ]
+        tasks = pack_jobs(jobs, pack_budget)
+        if manifest is None:
+            uid = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+            manifest = f"tyr-manifest-{uid}.tsv"
+        manifest_path = Path(manifest)
+        write_manifest(tasks, manifest_path)
+        tw.report_packing(tasks, manifest_path)
+
+        # Create the slurm script.
+        tw.line()
+        tw.script(user_mail, nodelist, running_modes, tasks, manifest_path)
+        return
+
     # Create the slurm script.
     tw.line()
     tw.script(user_mail, nodelist, running_modes)
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import List, Optional, TextIO, Union
 
 from tyr.cli.collector import CollectionResult
+from tyr.cli.slurm.packer import SlurmTask
 from tyr.cli.writter import Writter
 from tyr.planners.model.config import RunningMode, SolveConfig
 from tyr.planners.model.planner import Planner
@@ -45,6 +46,24 @@ class SlurmTerminalWritter(Writter):
         self._planners = planners.selected
         self._domains = list({p.domain for p in problems.selected})
 
+    def report_packing(self, tasks: List[SlurmTask], manifest: Path) -> None:
+        """Prints a report about the packing of the jobs into tasks.
+
+        Args:
+            tasks (List[SlurmTask]): The packed tasks.
+            manifest (Path): The manifest file listing the jobs of each task.
+        """
+        if self.quiet:
+            return
+
+        num_jobs = sum(len(t.jobs) for t in tasks)
+        longest = int(max((t.expected_time for t in tasks), default=0))
+        line = f"packed {num_jobs} job" + ("" if num_jobs <= 1 else "s")
+        line += f" into {len(tasks)} task" + ("" if len(tasks) <= 1 else "s")
+        line += f" / longest {self.format_seconds(longest)}"
+        self.line(line, bold=True)
+        self.line(f"manifest: {manifest.resolve().absolute()}")
+
     # ================================== Session ================================= #
 
     def session_name(self) -> str:
@@ -52,23 +71,58 @@ class SlurmTerminalWritter(Writter):
 
     # =============================== Slurm Script =============================== #
 
-    def mem_kilo(self) -> int:
-        """Return the memory stored in the config in kilobytes."""
-        return int(self._solve_config.memout / 1024)
+    def mem_kilo(self, tasks: Optional[List[SlurmTask]] = None) -> int:
+        """Return the memory stored in the config in kilobytes.
 
-    def script(
+        When tasks are given, the largest memory limit of their jobs is used instead.
+        """
+        memout = self._solve_config.memout
+        if tasks:
+            memout = max(job.memout for task in tasks for job in task.jobs)
+        return int(memout / 1024)
+
+    def script(  # pylint: disable = too-many-arguments
         self,
         user_mail: Optional[str],
         nodelist: List[str],
         running_modes: List[RunningMode],
+        tasks: Optional[List[SlurmTask]] = None,
+        manifest: Optional[Path] = None,
     ) -> None:
-        """Prints the slurm script."""
-        num_jobs = len(self._planners) * len(self._domains)
+        """Prints the slurm script.
+
+        Args:
+            user_mail (Optional[str]): The email to send the notifications.
+            nodelist (List[str]): The list of nodes to use on the cluster.
+            running_modes (List[RunningMode]): A list of mode to run planner resolutions.
+            tasks (Optional[List[SlurmTask]], optional): The packed tasks to run.
+                If given, each array task runs the jobs listed in the manifest.
+                Otherwise, each array task runs a planner on a whole domain.
+            manifest (Optional[Path], optional): The manifest describing the packed tasks.
+        """
+        if tasks is not None:
+            num_jobs = len(tasks)
+        else:
+            num_jobs = len(self._planners) * len(self._domains)
         if num_jobs == 0:
             self.line("No jobs to run.", red=True)
             return
 
-        # Print the header of the script.
+        self.script_header(num_jobs, user_mail, nodelist, tasks)
+        uid = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+        if tasks is not None and manifest is not None:
+            self.script_packed_body(uid, manifest)
+        else:
+            self.script_domains_body(uid, running_modes)
+
+    def script_header(
+        self,
+        num_jobs: int,
+        user_mail: Optional[str],
+        nodelist: List[str],
+        tasks: Optional[List[SlurmTask]] = None,
+    ) -> None:
+        """Prints the header of the slurm script."""
         self.line("#!/bin/bash")
         self.line("#SBATCH --job-name=tyr")
         self.line("#SBATCH --output=%x-%j.out")
@@ -83,9 +137,34 @@ class SlurmTerminalWritter(Writter):
             # 5 is a total arbitrary number.
             self.line(f"#SBATCH --nodes=1-{min(5, num_jobs)}")
         self.line("#SBATCH --cpus-per-task=1")
-        self.line(f"#SBATCH --mem-per-cpu={self.mem_kilo()}K")
+        self.line(f"#SBATCH --mem-per-cpu={self.mem_kilo(tasks)}K")
         self.line(f"#SBATCH --array=0-{num_jobs-1}")
 
+    def script_command(
+        self,
+        uid: str,
+        planner: str,
+        domain: str,
+        running_options: str,
+        memout: Optional[str] = None,
+    ) -> str:
+        """Returns the bench command run by an array task.
+
+        The memory limit defaults to the global one of the configuration.
+        """
+        if memout is None:
+            memout = str(self._solve_config.memout)
+        return " ".join(
+            f"srun tyr.sif bench -p {planner} -d {domain} --logs-path logs-{uid}/ "
+            f"--db-path db-{uid}-${{SLURM_ARRAY_TASK_ID}}.sqlite3 "
+            f"--timeout {self._solve_config.timeout} "
+            f"--memout {memout} "
+            f"--verbose{running_options}"
+            "".splitlines()
+        )
+
+    def script_domains_body(self, uid: str, running_modes: List[RunningMode]) -> None:
+        """Prints the body of the slurm script running a planner on a domain per task."""
         # Print the planners list and the planner to use.
         self.write("\nPLANNERS=(")
         for i, planner in enumerate(sorted(self._planners, key=str)):
@@ -113,17 +192,20 @@ class SlurmTerminalWritter(Writter):
         if RunningMode.ONESHOT in running_modes:
             running_options += " --oneshot"
         self.line("\necho \"==> Running '$PLANNER' on '$DOMAIN'\"")
-        uid = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-        self.line(
-            " ".join(
-                f"srun tyr.sif bench -p $PLANNER -d $DOMAIN --logs-path logs-{uid}/ "
-                f"--db-path db-{uid}-${{SLURM_ARRAY_TASK_ID}}.sqlite3 "
-                f"--timeout {self._solve_config.timeout} "
-                f"--memout {self._solve_config.memout} "
-                f"--verbose{running_options}"
-                "".splitlines()
-            )
-        )
+        self.line(self.script_command(uid, "$PLANNER", "$DOMAIN", running_options))
+
+    def script_packed_body(self, uid: str, manifest: Path) -> None:
+        """Prints the body of the slurm script running the jobs listed in the manifest."""
+        self.line(f'\nMANIFEST="{manifest.resolve().absolute()}"')
+        self.line("while IFS=$'\\t' read -r -u 3 TASK PLANNER PROBLEM MODE MEMOUT; do")
+        self.line('    if [ "$TASK" != "$SLURM_ARRAY_TASK_ID" ]; then')
+        self.line("        continue")
+        self.line("    fi")
+        self.line("    echo \"==> Running '$PLANNER' on '$PROBLEM' in $MODE\"")
+        planner, problem = '"${PLANNER}\\$"', '"${PROBLEM}\\$"'
+        command = self.script_command(uid, planner, problem, " --$MODE", '"$MEMOUT"')
+        self.line("    " + command)
+        self.line('done 3< "$MANIFEST"')
 
 
 __all__ = ["SlurmTerminalWritter"]
@@ -1,11 +1,15 @@
-from typing import List
+from typing import List, Optional, Union
 
 from tyr.cli import collector
+from tyr.cli.analysis_cache import AnalysisCache
+from tyr.cli.collector import CollectionResult
 from tyr.cli.config import CliContext
+from tyr.cli.result_set import add_virtual_results, load_result_set
 from tyr.cli.table.terminal_writter import TableTerminalWritter
-from tyr.planners.database import Database
-from tyr.planners.model.config import RunningMode, SolveConfig
-from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.metrics.best_quality import BestQualityIndex
+from tyr.planners.model.config import SolveConfig
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.virtual_planner import VirtualPlanner
 
 
 # pylint: disable=too-many-arguments, too-many-locals
@@ -24,6 +28,13 @@ def run_table(
     latex_horizontal_space: float,
     latex_pos: str,
     latex_star: bool,
+    persist_best_qualities: bool,
+    ci: Optional[float] = None,
+    ci_samples: int = 10000,
+    jobs: int = 1,
+    no_cache: bool = False,
+    virtual_filters: Optional[List[str]] = None,
+    save_virtual: bool = False,
 ):
     """Analyse the planners over the domains based on the database content.
 
@@ -42,11 +53,26 @@ def run_table(
         latex_horizontal_space (float): The horizontal space for the LaTeX table in cm.
         latex_pos (str): The position to use for the LaTeX table.
         latex_star (bool): Whether to use a table* environment in LaTeX rather than a table one.
+        persist_best_qualities (bool): Whether to merge the best qualities of the problems
+            with the ones stored in the database and to store them back.
+        ci (Optional[float], optional): When given, the confidence level in percent of
+            the bootstrap intervals printed next to the values. Defaults to None.
+        ci_samples (int, optional): The number of bootstrap samples of the problems of
+            each domain. Defaults to 10000.
+        jobs (int, optional): The number of processes computing the intervals.
+            Defaults to 1.
+        no_cache (bool, optional): Whether to ignore the analysis cache, loading the
+            results from the database and evaluating the metrics again. Defaults to False.
+        virtual_filters (Optional[List[str]], optional): A list of regex filters on the
+            names of the planners combined into the virtual best and worst solvers.
+            Defaults to None, in which case no virtual solver is added.
+        save_virtual (bool, optional): Whether to store the results of the virtual
+            solvers in the database and reuse the stored ones. Defaults to False.
     """
     # pylint: disable = duplicate-code
 
     # Create the writter and start the session.
-    solve_config = SolveConfig(1, memout, timeout, 0, True, False, True, False)
+    solve_config = SolveConfig(jobs, memout, timeout, 0, True, False, True, False)
     tw = TableTerminalWritter(
         solve_config,
         ctx.out,
@@ -60,6 +86,8 @@ def run_table(
         latex_horizontal_space,
         latex_pos,
         latex_star,
+        ci,
+        ci_samples,
     )
     tw.session_starts()
 
@@ -67,51 +95,31 @@ def run_table(
     planners = collector.collect_planners(*planner_filters)
     problems = collector.collect_problems(*domain_filters)
     metrics = collector.collect_metrics(*metric_filters)
-    tw.report_collect(planners, problems, metrics)
-
-    # Get the results from the database.
-    results: List[PlannerResult] = []
-    for planner in planners.selected:
-        for problem in problems.selected:
-            for running_mode in RunningMode:
-                result = Database().load_planner_result(
-                    planner.name,
-                    problem,
-                    solve_config,
-                    running_mode,
-                    keep_unsupported=True,
-                )
-                if result is None:
-                    result = PlannerResult.not_run(
-                        problem, planner, solve_config, running_mode
-                    )
-                results.append(result)
+    virtual = collector.collect_virtual_planners(
+        planners.selected, *(virtual_filters or [])
+    )
+    analysed: CollectionResult[Union[Planner, VirtualPlanner]] = CollectionResult(
+        [*planners.selected, *virtual], planners.deselected, planners.skipped
+    )
+    tw.report_collect(analysed, problems, metrics)
 
-    # Filter the results.
-    results = [
-        r
-        for r in results
-        if not any(
-            r1.status == PlannerResultStatus.NOT_RUN
-            for r1 in results
-            if r1.problem.name == r.problem.name and r1.running_mode == r.running_mode
-        )
-    ]
-    for r in results:
-        if r.status == PlannerResultStatus.UNSUPPORTED and not all(
-            r1.status == PlannerResultStatus.UNSUPPORTED
-            for r1 in results
-            if r1.problem.domain == r.problem.domain
-            and r1.planner_name == r.planner_name
-            and r1.running_mode == r.running_mode
-        ):
-            msg = f"Unsupported results on domain {r.problem.domain.name} \
-are not consistent for planner {r.planner_name}."
-            tw.line()
-            tw.write("[ERROR]", bold=True, red=True)
-            tw.line(f" {msg}", red=True)
-            return
-    tw.set_results(results)
+    # Get the results from the database, or from the cache if it has not changed.
+    AnalysisCache().enabled = not no_cache
+    result_set = load_result_set(
+        planners.selected,
+        problems.selected,
+        solve_config,
+        with_solutions=any(m.uses_solutions() for m in metrics.selected),
+    )
+    result_set = add_virtual_results(result_set, virtual, save_virtual)
+    if not result_set.is_consistent:
+        tw.report_inconsistencies(result_set.inconsistencies)
+        return
+    results = result_set.results
+    best_qualities = BestQualityIndex.from_results(results)
+    if persist_best_qualities:
+        best_qualities.sync(problems.selected)
+    tw.set_results(results, best_qualities, result_set.key)
 
     # Perform the analysis.
     tw.line()
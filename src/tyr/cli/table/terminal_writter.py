@@ -1,16 +1,36 @@
+# pylint: disable = too-many-lines
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Set, TextIO, Tuple, Union
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from tyr.cli.analysis_cache import AnalysisCache
 from tyr.cli.collector import CollectionResult
 from tyr.cli.writter import Writter
 from tyr.configuration.loader import load_config
+from tyr.metrics.best_quality import BestQualityIndex
+from tyr.metrics.bootstrap import bootstrap_intervals
+from tyr.metrics.engine import ResultArrays
 from tyr.metrics.metric import Metric
 from tyr.planners.model.config import SolveConfig
 from tyr.planners.model.planner import Planner
 from tyr.planners.model.result import PlannerResult
+from tyr.planners.model.virtual_planner import VirtualPlanner
 from tyr.problems.model.domain import AbstractDomain
 from tyr.problems.model.instance import ProblemInstance
 
@@ -129,6 +149,14 @@ class CellRow:
             col += item.h_span
         raise ValueError(f"{cell} is not in the row.")
 
+    def columns(self) -> Dict[int, int]:
+        """Returns the column of each cell in the row, by identity of the cell."""
+        columns, col = {}, 0
+        for item in self.cells:
+            columns[id(item)] = col
+            col += item.h_span
+        return columns
+
     def index(self, item: Union[Cell, Sep], start: int = 0):
         """Returns the index of an item in the row."""
         return self.row.index(item, start)
@@ -196,10 +224,13 @@ class TableTerminalWritter(Writter):
         latex_horizontal_space: float = 0.35,
         latex_pos: str = "htb",
         latex_star: bool = False,
+        ci: Optional[float] = None,
+        ci_samples: int = 10000,
     ) -> None:
         super().__init__(solve_config, out, verbosity, config)
         self._results: List[PlannerResult] = []
-        self._planners: List[Planner] = []
+        self._best_qualities = BestQualityIndex()
+        self._planners: List[Union[Planner, VirtualPlanner]] = []
         self._problems: List[ProblemInstance] = []
         self._metrics: List[Metric] = []
         self._colored = colored
@@ -210,16 +241,32 @@ class TableTerminalWritter(Writter):
         self._latex_horizontal_space = latex_horizontal_space
         self._latex_pos = latex_pos
         self._latex_star = latex_star
+        self._ci = ci
+        self._ci_samples = ci_samples
+        self._cache_key: Optional[str] = None
 
     # =============================== Manipulation =============================== #
 
-    def set_results(self, results: List[PlannerResult]):
+    def set_results(
+        self,
+        results: List[PlannerResult],
+        best_qualities: Optional[BestQualityIndex] = None,
+        cache_key: Optional[str] = None,
+    ):
         """Modifies the stored results.
 
         Args:
             results (List[Optional[PlannerResult]]): The results to store.
+            best_qualities (Optional[BestQualityIndex], optional): The best known quality
+                of each problem. Default to the best qualities of the results.
+            cache_key (Optional[str], optional): The key of the results in the analysis
+                cache, to cache the values of the metrics. Default to no caching.
         """
         self._results = PlannerResult.merge_all(results)
+        if best_qualities is None:
+            best_qualities = BestQualityIndex.from_results(self._results)
+        self._best_qualities = best_qualities
+        self._cache_key = cache_key
 
         if not self.quiet:
             total = len(self._results)
@@ -230,14 +277,15 @@ class TableTerminalWritter(Writter):
 
     def report_collect(
         self,
-        planners: CollectionResult[Planner],
+        planners: CollectionResult[Union[Planner, VirtualPlanner]],
         problems: CollectionResult[ProblemInstance],
         metrics: CollectionResult[Metric],
     ) -> None:
         """Prints a report about the collection of planners and problems.
 
         Args:
-            planners (CollectionResult[Planner]): The collection result on planners.
+            planners (CollectionResult[Union[Planner, VirtualPlanner]]): The collection
+                result on planners, with the virtual ones.
             problems (CollectionResult[ProblemInstance]): The collection result on problems.
             metrics (CollectionResult[Metric]): The collection result on metrics.
         """
@@ -287,12 +335,51 @@ class TableTerminalWritter(Writter):
         # Get all domains.
         domains = {p.domain for p in self._problems}
 
-        # Get all headers.
+        # Group the results by domain and planner to evaluate each metric in one pass.
+        arrays = ResultArrays.from_results(self._results, self._best_qualities)
+        groups, group_keys = arrays.group_by(
+            lambda r: (r.problem.domain, r.planner_name)
+        )
+        group_ids = {key: i for i, key in enumerate(group_keys)}
+        metric_values, metric_intervals = self.evaluate_metrics(
+            arrays, groups, cast(List[Tuple[AbstractDomain, str]], group_keys)
+        )
+
+        # Compile the mappings and orderings of the headers once for all the cells.
+        col_mappings = [eval(h["mapping"]) for h in conf_col_headers]  # nosec: B307
+        row_mappings = [eval(h["mapping"]) for h in conf_row_headers]  # nosec: B307
+        col_orderings = [
+            eval(h.get("ordering", default_ordering))  # nosec: B307
+            for h in conf_col_headers
+        ]
+        row_orderings = [
+            eval(h.get("ordering", default_ordering))  # nosec: B307
+            for h in conf_row_headers
+        ]
+        post_process = eval(post_process_value)  # nosec: B307
+        final_column_value: Any = (
+            None if final_column is None else eval(final_column["value"])  # nosec: B307
+        )
+        final_row_value: Any = (
+            None if final_row is None else eval(final_row["value"])  # nosec: B307
+        )
+
+        # Get all headers, and index the candidates of each cell by its headers.
+        cell_candidates: Dict[
+            Tuple[Tuple, Tuple],
+            Set[Tuple[AbstractDomain, Union[Planner, VirtualPlanner], Metric]],
+        ] = defaultdict(set)
         raw_col_headers: Dict[
-            str, Union[Dict, Set[Tuple[AbstractDomain, Planner, Metric]]]
+            str,
+            Union[
+                Dict, Set[Tuple[AbstractDomain, Union[Planner, VirtualPlanner], Metric]]
+            ],
         ] = {}
         raw_row_headers: Dict[
-            str, Union[Dict, Set[Tuple[AbstractDomain, Planner, Metric]]]
+            str,
+            Union[
+                Dict, Set[Tuple[AbstractDomain, Union[Planner, VirtualPlanner], Metric]]
+            ],
         ] = {}
         for d in domains:
             if d is None:
@@ -300,10 +387,8 @@ class TableTerminalWritter(Writter):
             for p in self._planners:
                 for m in self._metrics:
                     crt_col_header = raw_col_headers
-                    for i, conf_header in enumerate(conf_col_headers):
-                        col_header = eval(conf_header["mapping"])(  # nosec: B307
-                            d, p, m
-                        )
+                    col_key = tuple(mapping(d, p, m) for mapping in col_mappings)
+                    for i, col_header in enumerate(col_key):
                         if col_header not in crt_col_header:
                             if i == len(conf_col_headers) - 1:
                                 crt_col_header[col_header] = {(d, p, m)}
@@ -314,10 +399,8 @@ class TableTerminalWritter(Writter):
                         crt_col_header = crt_col_header[col_header]  # type: ignore
 
                     crt_row_header = raw_row_headers
-                    for i, conf_header in enumerate(conf_row_headers):
-                        col_header = eval(conf_header["mapping"])(  # nosec: B307
-                            d, p, m
-                        )
+                    row_key = tuple(mapping(d, p, m) for mapping in row_mappings)
+                    for i, col_header in enumerate(row_key):
                         if col_header not in crt_row_header:
                             if i == len(conf_row_headers) - 1:
                                 crt_row_header[col_header] = {(d, p, m)}
@@ -327,29 +410,30 @@ class TableTerminalWritter(Writter):
                             crt_row_header[col_header].add((d, p, m))  # type: ignore
                         crt_row_header = crt_row_header[col_header]  # type: ignore
 
+                    cell_candidates[(col_key, row_key)].add((d, p, m))
+
         # Order the headers.
         def get_lvl(
             d: Union[Dict, Set],
             lvl: int,
-            conf: List,
+            orderings: List[Callable],
             crt_lvl: int = 0,
         ) -> Generator[Tuple[str, ...], None, None]:
             if isinstance(d, set):
                 return
-            ordering = conf[crt_lvl].get("ordering", default_ordering)
-            for key in sorted(d.keys(), key=eval(ordering)):  # nosec: B307
+            for key in sorted(d.keys(), key=orderings[crt_lvl]):
                 if lvl == 0:
                     yield (key,)
                 else:
-                    for val in get_lvl(d[key], lvl - 1, conf, crt_lvl + 1):
+                    for val in get_lvl(d[key], lvl - 1, orderings, crt_lvl + 1):
                         yield (key, *val)
 
         flat_col_headers = [
-            list(get_lvl(raw_col_headers, i, conf_col_headers))
+            list(get_lvl(raw_col_headers, i, col_orderings))
             for i in range(len(conf_col_headers))
         ]
         flat_row_headers = [
-            list(get_lvl(raw_row_headers, i, conf_row_headers))
+            list(get_lvl(raw_row_headers, i, row_orderings))
             for i in range(len(conf_row_headers))
         ]
 
@@ -414,22 +498,12 @@ class TableTerminalWritter(Writter):
             table[-1].append(Sep.DOUBLE)
 
             for j, col_header in enumerate(flat_col_headers[-1]):
-                crt_col_header: Set[Tuple] = raw_col_headers  # type: ignore
-                for v in col_header:
-                    crt_col_header = crt_col_header[v]  # type: ignore
-
-                crt_row_header: Set[Tuple] = raw_row_headers  # type: ignore
-                for v in row_header:
-                    crt_row_header = crt_row_header[v]  # type: ignore
-
-                candidates = crt_col_header.intersection(crt_row_header)  # type: ignore
+                candidates = cell_candidates.get((col_header, row_header), set())
                 # Filter the candidates with unsupported results.
                 candidates = {
                     candidate
                     for candidate in candidates
-                    for result in self._results
-                    if result.problem.domain == candidate[0]
-                    and result.planner_name == candidate[1].name
+                    if (candidate[0], candidate[1].name) in group_ids
                 }
 
                 if len(candidates) > 1:
@@ -440,15 +514,12 @@ class TableTerminalWritter(Writter):
                     value = "x"
                 else:
                     d, p, m = candidates.pop()  # type: ignore
-                    results = [
-                        result
-                        for result in self._results
-                        if result.problem.domain == d and result.planner_name == p.name
-                    ]
-                    raw_value = m.evaluate_raw(results, self._results)
-                    value = eval(post_process_value)(  # nosec: B307
-                        d, p, m, raw_value, m.evaluate(results, self._results)
-                    )
+                    raw_value = float(metric_values[m][group_ids[(d, p.name)]])
+                    value = post_process(d, p, m, raw_value, m.format_value(raw_value))
+                    if m in metric_intervals:
+                        value += self.format_interval(
+                            m, metric_intervals[m][group_ids[(d, p.name)]]
+                        )
                     row_values[i].append(raw_value)
                     row_metrics[i].append(m)
                     col_values[j].append(raw_value)
@@ -468,7 +539,7 @@ class TableTerminalWritter(Writter):
                     if set(row_metrics[i]) != {row_metrics[i][0]}
                     else row_metrics[i][0]
                 )
-                eval_value = eval(final_column["value"])  # nosec: B307
+                eval_value = final_column_value
                 final_col_val = eval_value(metric, row_values[i])
                 col_val = Cell(
                     f"{final_col_val:.2f}",
@@ -499,7 +570,7 @@ class TableTerminalWritter(Writter):
                     if set(col_metrics[j]) != {col_metrics[j][0]}
                     else col_metrics[j][0]
                 )
-                eval_value = eval(final_row["value"])  # nosec: B307
+                eval_value = final_row_value
                 final_row_val = eval_value(metric, col_vals)
                 row_val = Cell(
                     f"{final_row_val:.2f}",
@@ -558,24 +629,27 @@ class TableTerminalWritter(Writter):
         max_span = max(cell.h_span for line in table.lines for cell in line.cells)
         for span in range(1, max_span + 1):
             for line in table.lines:
+                columns = line.columns()
                 for cell in line.cells:
                     if cell.h_span != span:
                         continue
-                    length = sum(
-                        col_length[line.column_of(cell) + i] for i in range(span)
-                    ) + (span - 1)
+                    column = columns[id(cell)]
+                    length = sum(col_length[column + i] for i in range(span)) + (
+                        span - 1
+                    )
                     delta = cell.length - length
                     col_idx = 0
                     while delta > 0:
-                        col_length[line.column_of(cell) + (col_idx % span)] += 1
+                        col_length[column + (col_idx % span)] += 1
                         delta -= 1
                         col_idx += 1
 
         # Update the length of each cell.
         for line in table.lines:
+            columns = line.columns()
             for cell in line.cells:
                 cell.length = sum(
-                    col_length[line.column_of(cell) + i] for i in range(cell.h_span)
+                    col_length[columns[id(cell)] + i] for i in range(cell.h_span)
                 ) + (cell.h_span - 1)
 
         # Update the horizontal span of cells for LaTeX.
@@ -607,8 +681,99 @@ class TableTerminalWritter(Writter):
         else:
             self.term_print(table, col_length)
 
+    def evaluate_metrics(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        group_keys: List[Tuple[AbstractDomain, str]],
+    ) -> Tuple[Dict[Metric, np.ndarray], Dict[Metric, np.ndarray]]:
+        """Evaluates the metrics and their confidence intervals on each group of results.
+
+        When the results have a key in the analysis cache, the values are cached with
+        the metrics, the best qualities and the configuration of the intervals, so that
+        the tables printed from the same results with other layouts reuse them.
+
+        Args:
+            arrays (ResultArrays): The results, in columnar format.
+            groups (np.ndarray): The group of each result.
+            group_keys (List[Tuple[AbstractDomain, str]]): The domain and the planner
+                name of each group.
+
+        Returns:
+            Tuple[Dict[Metric, np.ndarray], Dict[Metric, np.ndarray]]: The value of each
+                group for each metric, and the bounds of the interval of each group for
+                each metric when the intervals are requested.
+        """
+        key = None
+        names = [(d.name, p) for d, p in group_keys]
+        if self._cache_key is not None:
+            key = AnalysisCache().get_key(
+                "metrics",
+                self._cache_key,
+                [m.name for m in self._metrics],
+                sorted((p.name, q) for p, q in self._best_qualities.items()),
+                self._ci,
+                self._ci_samples,
+            )
+            cached = AnalysisCache().load(key)
+            if cached is not None and cached[0] == names:
+                by_name = {m.name: m for m in self._metrics}
+                return (
+                    {by_name[n]: v for n, v in cached[1].items()},
+                    {by_name[n]: v for n, v in cached[2].items()},
+                )
+
+        values = {
+            m: m.evaluate_groups(arrays, groups, len(group_keys)) for m in self._metrics
+        }
+
+        # Resample the problems of each domain to get the intervals of all the cells.
+        intervals: Dict[Metric, np.ndarray] = {}
+        if self._ci is not None:
+            strata, _ = arrays.group_by(lambda r: r.problem.domain)
+            intervals = bootstrap_intervals(
+                self._metrics,
+                arrays,
+                groups,
+                len(group_keys),
+                strata,
+                self._ci,
+                self._ci_samples,
+                self._solve_config.jobs,
+            )
+
+        if key is not None:
+            AnalysisCache().save(
+                key,
+                (
+                    names,
+                    {m.name: v for m, v in values.items()},
+                    {m.name: v for m, v in intervals.items()},
+                ),
+            )
+        return values, intervals
+
     # ================================== Format ================================== #
 
+    def format_interval(self, metric: Metric, bounds: np.ndarray) -> str:
+        """Formats the confidence interval of a cell to print after its value.
+
+        Args:
+            metric (Metric): The metric of the cell.
+            bounds (np.ndarray): The lower and upper bounds of the interval.
+
+        Returns:
+            str: The formatted interval, empty if the interval is unknown.
+        """
+        if np.isnan(bounds).any():
+            return ""
+        interval = (
+            f"[{metric.format_value(bounds[0])}, {metric.format_value(bounds[1])}]"
+        )
+        if self._latex:
+            return f" {{\\tiny {interval}}}"
+        return f" {interval}"
+
     def latex_print(
         self,
         table: CellTable,
@@ -793,21 +958,21 @@ class TableTerminalWritter(Writter):
 
         prev_cell, prev_sep, prev_cell_idx = prev_line[1], prev_line[2], 1
         next_cell, next_sep, next_cell_idx = next_line[1], next_line[2], 1
+        prev_columns, next_columns = prev_line.columns(), next_line.columns()
+        num_columns = prev_line.num_columns
         for c in sorted(col_length.keys()):
             length = col_length[c]
-            end_prev_cell = prev_line.column_of(prev_cell) + prev_cell.h_span - 1 == c
-            end_next_cell = next_line.column_of(next_cell) + next_cell.h_span - 1 == c
+            end_prev_cell = prev_columns[id(prev_cell)] + prev_cell.h_span - 1 == c
+            end_next_cell = next_columns[id(next_cell)] + next_cell.h_span - 1 == c
             self.write(
                 (
                     " "
                     if next_cell.v_span < 0
-                    else "─"
-                    if line_sep is Sep.SIMPLE
-                    else "═"
+                    else "─" if line_sep is Sep.SIMPLE else "═"
                 )
                 * length
             )
-            if c == prev_line.num_columns - 1:
+            if c == num_columns - 1:
                 if prev_sep != next_sep:
                     raise ValueError("The two lines must end with the same separator.")
                 if next_cell.v_span < 0:
@@ -859,9 +1024,7 @@ class TableTerminalWritter(Writter):
                     (
                         " "
                         if next_cell.v_span < 0
-                        else "─"
-                        if line_sep is Sep.SIMPLE
-                        else "═"
+                        else "─" if line_sep is Sep.SIMPLE else "═"
                     )
                 )
 
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import List, Optional, TextIO, Union
 
 from tyr.cli.collector import CollectionResult
+from tyr.cli.result_set import InconsistentGroup
 from tyr.configuration.loader import get_config_file
 from tyr.core.paths import TyrPaths
 from tyr.planners.model.config import SolveConfig
@@ -229,6 +230,13 @@ class Writter:
 
         self.line(line, bold=True)
 
+    def report_inconsistencies(self, inconsistencies: List[InconsistentGroup]):
+        """Reports all the groups of results with inconsistent unsupported results."""
+        self.line()
+        for inconsistency in inconsistencies:
+            self.write("[ERROR]", bold=True, red=True)
+            self.line(f" {inconsistency.message()}", red=True)
+
     def report_solve_config(self):
         """Prints a report about the configuration being used for the resolution."""
         if self.quiet:
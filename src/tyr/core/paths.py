@@ -12,6 +12,7 @@ class TyrPaths(Singleton):
         super().__init__()
         self._logs = self.ROOT_DIR / "logs"
         self._db = self.ROOT_DIR / "db.sqlite3"
+        self._cache = self.ROOT_DIR / "cache"
 
     @property
     def logs(self):
@@ -33,5 +34,15 @@ class TyrPaths(Singleton):
         """Set the path to the SQLite database file."""
         self._db = Path(value).resolve().absolute()
 
+    @property
+    def cache(self):
+        """Return the path to the cache directory."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        """Set the path to the cache directory."""
+        self._cache = Path(value).resolve().absolute()
+
 
 __all__ = ["TyrPaths"]
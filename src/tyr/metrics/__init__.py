@@ -1,6 +1,29 @@
-from . import metric, metrics, scanner
+from . import (
+    accumulator,
+    best_quality,
+    bootstrap,
+    engine,
+    metric,
+    metrics,
+    pairwise,
+    scanner,
+)
+from .accumulator import *
+from .best_quality import *
+from .bootstrap import *
+from .engine import *
 from .metric import *
 from .metrics import *
+from .pairwise import *
 from .scanner import *
 
-__all__ = metric.__all__ + metrics.__all__ + scanner.__all__
+__all__ = (
+    accumulator.__all__
+    + best_quality.__all__
+    + bootstrap.__all__
+    + engine.__all__
+    + metric.__all__
+    + metrics.__all__
+    + pairwise.__all__
+    + scanner.__all__
+)
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from math import log10
+from typing import Callable, Dict, Hashable, Iterable, List
+
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+
+@dataclass
+class AccumulatedScores:
+    """The coverage, time score and quality score of a set of results."""
+
+    num_results: int
+    coverage: float
+    time_score: float
+    quality_score: float
+
+
+@dataclass
+class _GroupSums:
+    num_results: int = 0
+    num_solved: int = 0
+    time_score: float = 0
+    quality_score: float = 0
+
+
+class MetricAccumulator:
+    """
+    Incremental evaluation of the coverage, time score and quality score.
+
+    The results are added one at a time and the sums of the metrics are kept for each
+    group of results, so adding a result does not evaluate the previous ones again.
+    The quality score of a group is kept as the sum of the inverse qualities of its
+    results on each problem, weighted by the best quality of the problem. Improving the
+    best quality of a problem only updates the groups having solved this problem.
+
+    The values follow the rules of the corresponding metrics, up to the rounding of the
+    updated quality sums.
+    """
+
+    def __init__(self, key: Callable[[PlannerResult], Hashable]) -> None:
+        self._key = key
+        self._groups: Dict[Hashable, _GroupSums] = {}
+        self._best_qualities: Dict[Hashable, float] = {}
+        # Sum of the positive inverse qualities of each group on each problem.
+        self._inverse_qualities: Dict[Hashable, Dict[Hashable, float]] = {}
+
+    # ================================== Access ================================== #
+
+    def keys(self) -> List[Hashable]:
+        """
+        Returns:
+            List[Hashable]: The keys of the groups, by order of first appearance.
+        """
+        return list(self._groups.keys())
+
+    def scores(self, keys: Iterable[Hashable]) -> AccumulatedScores:
+        """Computes the scores of the results of the given groups.
+
+        Args:
+            keys (Iterable[Hashable]): The keys of the groups, unknown keys are ignored.
+
+        Returns:
+            AccumulatedScores: The scores of the results of the groups as percentages.
+        """
+        total = _GroupSums()
+        for key in set(keys):
+            if (group := self._groups.get(key)) is None:
+                continue
+            total.num_results += group.num_results
+            total.num_solved += group.num_solved
+            total.time_score += group.time_score
+            total.quality_score += group.quality_score
+        if total.num_results == 0:
+            return AccumulatedScores(0, 0, 0, 0)
+        return AccumulatedScores(
+            total.num_results,
+            total.num_solved / total.num_results * 100,
+            total.time_score / total.num_results * 100,
+            total.quality_score / total.num_results * 100,
+        )
+
+    def __len__(self) -> int:
+        return sum(g.num_results for g in self._groups.values())
+
+    # =============================== Manipulation =============================== #
+
+    def add(self, result: PlannerResult) -> None:
+        """Registers the given result in its group.
+
+        Args:
+            result (PlannerResult): The result to register.
+        """
+        key = self._key(result)
+        group = self._groups.setdefault(key, _GroupSums())
+        group.num_results += 1
+        solved = result.status == PlannerResultStatus.SOLVED
+        if (quality := result.plan_quality) is not None:
+            self._add_quality(key, result.problem, quality, solved)
+        if not solved:
+            return
+        group.num_solved += 1
+
+        computation_time = result.computation_time
+        if computation_time is not None:
+            if computation_time < 1:
+                group.time_score += 1
+            elif computation_time <= result.config.timeout:
+                timeout = result.config.timeout
+                group.time_score += 1 - log10(computation_time) / log10(timeout)
+
+    def update(self, results: Iterable[PlannerResult]) -> None:
+        """Registers the given results.
+
+        Args:
+            results (Iterable[PlannerResult]): The results to register.
+        """
+        for result in results:
+            self.add(result)
+
+    def _add_quality(
+        self, key: Hashable, problem: Hashable, quality: float, scored: bool
+    ) -> None:
+        # The best quality of a problem comes from all its results, like for the metrics.
+        best = self._best_qualities.get(problem, float("inf"))
+        inverses = self._inverse_qualities.setdefault(problem, {})
+        if quality < best:
+            # The scores of the other results on the problem depend on the best quality.
+            self._best_qualities[problem] = quality
+            for other, inverse in inverses.items():
+                self._groups[other].quality_score += (quality - best) * inverse
+            best = quality
+        if not scored:
+            return
+        if quality == 0:
+            # A null quality is always the best one, its score never changes.
+            self._groups[key].quality_score += 1
+        else:
+            inverses[key] = inverses.get(key, 0) + 1 / quality
+            self._groups[key].quality_score += best / quality
+
+
+__all__ = ["AccumulatedScores", "MetricAccumulator"]
@@ -0,0 +1,119 @@
+from typing import Any, Callable, Dict, ItemsView, List, Optional
+
+from tyr.planners.database import Database
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.problems.model.instance import ProblemInstance
+
+
+class BestQualityIndex:
+    """
+    Best known plan quality of each problem.
+
+    The index is built once from all the results of an analysis by its caller, and given
+    with the columns of the results to the metrics comparing the quality of a plan with
+    the best one found for its problem (see `ResultArrays.from_results`).
+    It can be merged with the qualities stored in the database, so that the reference
+    qualities stay the same when the analysis only covers some of the results.
+    """
+
+    def __init__(self) -> None:
+        self._qualities: Dict[Any, float] = {}
+
+    @staticmethod
+    def from_results(results: List[PlannerResult]) -> "BestQualityIndex":
+        """Builds the index of the best qualities of the given results.
+
+        Args:
+            results (List[PlannerResult]): The results to index.
+
+        Returns:
+            BestQualityIndex: The index of the best qualities.
+        """
+        index = BestQualityIndex()
+        index.update(results)
+        return index
+
+    # ================================== Access ================================== #
+
+    def get(self, problem: Any) -> float:
+        """
+        Args:
+            problem (Any): The problem of the results.
+
+        Returns:
+            float: The best known quality of the problem, `inf` if unknown.
+        """
+        return self._qualities.get(problem, float("inf"))
+
+    def items(self) -> ItemsView[Any, float]:
+        """
+        Returns:
+            ItemsView[Any, float]: The problems and their best known quality.
+        """
+        return self._qualities.items()
+
+    def mean_score(
+        self,
+        results: List[PlannerResult],
+        score: Callable[[PlannerResult, float], float],
+    ) -> float:
+        """Averages a score comparing each solved result with the best quality known.
+
+        Args:
+            results (List[PlannerResult]): The results to score.
+            score (Callable[[PlannerResult, float], float]): The score of a solved
+                result given the best known quality of its problem.
+
+        Returns:
+            float: The mean score of the results, the unsolved ones scoring 0.
+        """
+        if len(results) == 0:
+            return 0
+        total = 0.0
+        for result in results:
+            if result.status == PlannerResultStatus.SOLVED:
+                total += score(result, self.get(result.problem))
+        return total / len(results)
+
+    def __contains__(self, problem: Any) -> bool:
+        return problem in self._qualities
+
+    def __len__(self) -> int:
+        return len(self._qualities)
+
+    # =============================== Manipulation =============================== #
+
+    def add(self, problem: Any, quality: Optional[float]) -> None:
+        """Registers a quality found for the given problem.
+
+        Args:
+            problem (Any): The problem of the quality.
+            quality (Optional[float]): The quality, ignored if `None`.
+        """
+        if quality is not None and quality < self.get(problem):
+            self._qualities[problem] = quality
+
+    def update(self, results: List[PlannerResult]) -> None:
+        """Registers the qualities of the given results.
+
+        Args:
+            results (List[PlannerResult]): The results to register.
+        """
+        for result in results:
+            self.add(result.problem, result.plan_quality)
+
+    def sync(self, problems: List[ProblemInstance]) -> None:
+        """Merges the index with the qualities stored in the database and stores it back.
+
+        Args:
+            problems (List[ProblemInstance]): The problems to synchronize.
+        """
+        stored = Database().load_best_qualities([p.name for p in problems])
+        for problem in problems:
+            self.add(problem, stored.get(problem.name))
+        Database().save_best_qualities(
+            {p.name: self.get(p) for p in problems if p in self}
+        )
+
+
+__all__ = ["BestQualityIndex"]
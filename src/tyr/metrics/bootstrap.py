@@ -0,0 +1,106 @@
+from dataclasses import replace
+from typing import Dict, List, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from tyr.metrics.engine import ResultArrays
+from tyr.metrics.metric import Metric
+
+
+# pylint: disable = too-many-arguments, too-many-locals
+def bootstrap_intervals(
+    metrics: List[Metric],
+    arrays: ResultArrays,
+    groups: np.ndarray,
+    num_groups: int,
+    strata: np.ndarray,
+    confidence: float,
+    num_samples: int = 10000,
+    jobs: int = 1,
+    seed: int = 0,
+) -> Dict[Metric, np.ndarray]:
+    """Computes bootstrap confidence intervals of the metrics of each group of results.
+
+    The problems are resampled with replacement within each stratum, e.g. each domain,
+    and the same samples are shared by all the groups of the stratum. The intervals are
+    the percentiles of the values of the metrics on the samples. Each stratum is
+    evaluated in its own job with only the columns of its results.
+
+    Args:
+        metrics (List[Metric]): The metrics to evaluate.
+        arrays (ResultArrays): All the results, in columnar format.
+        groups (np.ndarray): The group of each result, negative to ignore the result.
+        num_groups (int): The number of groups.
+        strata (np.ndarray): The stratum of each result. The results of a group must
+            belong to the same stratum.
+        confidence (float): The confidence level of the intervals, in percent.
+        num_samples (int, optional): The number of samples. Defaults to 10000.
+        jobs (int, optional): The number of processes evaluating the strata, if
+            negative (n_cpus + 1 + jobs) are used. Defaults to 1.
+        seed (int, optional): The seed of the samples. Defaults to 0.
+
+    Raises:
+        ValueError: When the confidence level is not strictly between 0 and 100.
+
+    Returns:
+        Dict[Metric, np.ndarray]: The lower and upper bounds of the interval of each
+            group for each metric, `nan` when the metric cannot be sampled.
+    """
+    if not 0 < confidence < 100:
+        raise ValueError(
+            f"The confidence level must be between 0 and 100: {confidence}"
+        )
+
+    intervals = {m: np.full((num_groups, 2), np.nan) for m in metrics}
+    tasks = []
+    for stratum in np.unique(strata[groups >= 0]):
+        indices = np.flatnonzero((strata == stratum) & (groups >= 0))
+        # The results and the problems are not needed and may not be picklable.
+        columns = replace(arrays.take(indices), results=[], problems=[])
+        tasks.append(
+            delayed(_bootstrap_stratum)(
+                metrics,
+                columns,
+                groups[indices],
+                confidence,
+                num_samples,
+                (seed, int(stratum)),
+            )
+        )
+
+    for group_ids, stratum_intervals in Parallel(n_jobs=jobs)(tasks):
+        for metric, values in zip(metrics, stratum_intervals):
+            intervals[metric][group_ids] = values
+    return intervals
+
+
+def _bootstrap_stratum(
+    metrics: List[Metric],
+    arrays: ResultArrays,
+    groups: np.ndarray,
+    confidence: float,
+    num_samples: int,
+    seed: Tuple[int, int],
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    group_ids, local_groups = np.unique(groups, return_inverse=True)
+    problems, local_problems = np.unique(arrays.problem_ids, return_inverse=True)
+    arrays = replace(arrays, problem_ids=local_problems)
+
+    # Number of times each problem of the stratum is drawn in each sample.
+    rng = np.random.default_rng(seed)
+    num_problems = len(problems)
+    draws = rng.integers(num_problems, size=(num_samples, num_problems))
+    draws += np.arange(num_samples)[:, None] * num_problems
+    weights = np.bincount(draws.ravel(), minlength=num_samples * num_problems)
+    weights = weights.reshape(num_samples, num_problems).astype(np.float64)
+
+    tail = (100 - confidence) / 2
+    intervals = []
+    for metric in metrics:
+        samples = metric.evaluate_samples(arrays, local_groups, len(group_ids), weights)
+        intervals.append(np.percentile(samples, [tail, 100 - tail], axis=0).T)
+    return group_ids, intervals
+
+
+__all__ = ["bootstrap_intervals"]
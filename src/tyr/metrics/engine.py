@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from tyr.metrics.best_quality import BestQualityIndex
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.problems.model.instance import ProblemInstance
+
+
+@dataclass
+class ResultArrays:  # pylint: disable = too-many-instance-attributes
+    """
+    Columnar representation of planner results.
+
+    The results are converted once into arrays so that the metrics can be evaluated on
+    any grouping of them with array reductions instead of loops over the results.
+    Missing times and qualities are represented by `nan`.
+    """
+
+    results: List[PlannerResult]
+    problems: List[ProblemInstance]
+    statuses: np.ndarray
+    times: np.ndarray
+    qualities: np.ndarray
+    timeouts: np.ndarray
+    problem_ids: np.ndarray
+    best_qualities: np.ndarray
+    inverse_quality_areas: np.ndarray
+    zero_quality_times: np.ndarray
+
+    @staticmethod
+    def from_results(
+        results: List[PlannerResult],
+        best_qualities: Optional[BestQualityIndex] = None,
+    ) -> "ResultArrays":
+        """Converts the given results into arrays.
+
+        Args:
+            results (List[PlannerResult]): The results to convert.
+            best_qualities (Optional[BestQualityIndex], optional): The best known
+                quality of each problem. Default to the best qualities of the results.
+
+        Returns:
+            ResultArrays: The columnar representation of the results.
+        """
+        if best_qualities is None:
+            best_qualities = BestQualityIndex.from_results(results)
+
+        problem_ids: Dict[ProblemInstance, int] = {}
+        for result in results:
+            problem_ids.setdefault(result.problem, len(problem_ids))
+
+        ids = np.array([problem_ids[r.problem] for r in results], dtype=np.int64)
+        best = np.array([best_qualities.get(p) for p in problem_ids], dtype=np.float64)
+        areas = np.array([quality_curve_areas(r) for r in results], dtype=np.float64)
+        areas = areas.reshape(len(results), 2)
+
+        return ResultArrays(
+            results,
+            list(problem_ids.keys()),
+            np.array([r.status.value for r in results], dtype=np.int64),
+            ResultArrays._to_array([r.computation_time for r in results]),
+            ResultArrays._to_array([r.plan_quality for r in results]),
+            ResultArrays._to_array([r.config.timeout for r in results]),
+            ids,
+            best[ids],
+            areas[:, 0],
+            areas[:, 1],
+        )
+
+    @staticmethod
+    def _to_array(values: List) -> np.ndarray:
+        return np.array(
+            [np.nan if v is None else v for v in values],
+            dtype=np.float64,
+        )
+
+    @property
+    def solved(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: A mask of the solved results.
+        """
+        return self.statuses == PlannerResultStatus.SOLVED.value
+
+    def group_by(
+        self, key: Callable[[PlannerResult], Hashable]
+    ) -> Tuple[np.ndarray, List[Hashable]]:
+        """Groups the results by the given key.
+
+        Args:
+            key (Callable[[PlannerResult], Hashable]): The key of a result.
+
+        Returns:
+            Tuple[np.ndarray, List[Hashable]]: The group of each result and the key of
+                each group, by order of first appearance.
+        """
+        group_ids: Dict[Hashable, int] = {}
+        groups = [group_ids.setdefault(key(r), len(group_ids)) for r in self.results]
+        return np.array(groups, dtype=np.int64), list(group_ids.keys())
+
+    def take(self, indices: np.ndarray) -> "ResultArrays":
+        """Selects the results at the given indices.
+
+        Args:
+            indices (np.ndarray): The indices of the results to select.
+
+        Returns:
+            ResultArrays: The selected results, with the problems of all the results.
+        """
+        return ResultArrays(
+            [self.results[i] for i in indices] if self.results else [],
+            self.problems,
+            self.statuses[indices],
+            self.times[indices],
+            self.qualities[indices],
+            self.timeouts[indices],
+            self.problem_ids[indices],
+            self.best_qualities[indices],
+            self.inverse_quality_areas[indices],
+            self.zero_quality_times[indices],
+        )
+
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+
+def quality_curve_areas(result: PlannerResult) -> Tuple[float, float]:
+    """Integrates the inverse of the best quality found by the result over time.
+
+    The best quality found at any time is the one of the last solution of the quality
+    curve of the result, until the timeout. The area under the curve of a quality
+    relative to a best quality `b` is `b * inverse_area + zero_time`, since a best
+    quality of 0 can only be reached by the solutions of quality 0.
+
+    Args:
+        result (PlannerResult): The result to integrate, in one pass over its solutions.
+
+    Returns:
+        Tuple[float, float]: The area under the inverse of the positive qualities and
+            the time spent with a solution of quality 0.
+    """
+    timeout = result.config.timeout
+    curve = [(max(t, 0), q) for t, q in result.quality_curve() if t <= timeout]
+    inverse_area, zero_time = 0.0, 0.0
+    for (time, quality), (end, _) in zip(curve, curve[1:] + [(timeout, 0)]):
+        if quality > 0:
+            inverse_area += (end - time) / quality
+        elif quality == 0:
+            zero_time += end - time
+    return inverse_area, zero_time
+
+
+def group_mean(values: np.ndarray, groups: np.ndarray, num_groups: int) -> np.ndarray:
+    """Computes the mean of the values of each group as a percentage.
+
+    The values of a group are summed in order, so the result is the same as a sequential
+    sum over the results of the group. Empty groups have a mean of 0.
+
+    Args:
+        values (np.ndarray): The value of each result.
+        groups (np.ndarray): The group of each result, negative to ignore the result.
+        num_groups (int): The number of groups.
+
+    Returns:
+        np.ndarray: The mean of each group multiplied by 100.
+    """
+    kept = groups >= 0
+    totals = np.bincount(groups[kept], weights=values[kept], minlength=num_groups)
+    counts = np.bincount(groups[kept], minlength=num_groups)
+    means = np.divide(totals, counts, out=np.zeros(num_groups), where=counts > 0)
+    return means * 100
+
+
+def group_sample_means(
+    values: np.ndarray,
+    groups: np.ndarray,
+    num_groups: int,
+    problem_ids: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Computes the mean of the values of each group on weighted samples of the problems.
+
+    Args:
+        values (np.ndarray): The value of each result.
+        groups (np.ndarray): The group of each result, negative to ignore the result.
+        num_groups (int): The number of groups.
+        problem_ids (np.ndarray): The problem of each result.
+        weights (np.ndarray): The number of times each problem is drawn in each sample,
+            of shape (number of samples, number of problems).
+
+    Returns:
+        np.ndarray: The mean of each group in each sample multiplied by 100, of shape
+            (number of samples, number of groups).
+    """
+    # The results are summed by problem first, the samples only weight these sums.
+    kept = groups >= 0
+    cells = (problem_ids[kept], groups[kept])
+    problem_totals = np.zeros((weights.shape[1], num_groups))
+    problem_counts = np.zeros((weights.shape[1], num_groups))
+    np.add.at(problem_totals, cells, values[kept])
+    np.add.at(problem_counts, cells, 1)
+    totals = weights @ problem_totals
+    counts = weights @ problem_counts
+    means = np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+    return means * 100
+
+
+__all__ = [
+    "ResultArrays",
+    "group_mean",
+    "group_sample_means",
+    "quality_curve_areas",
+]
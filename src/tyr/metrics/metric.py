@@ -1,6 +1,9 @@
 import re
 from typing import List
 
+import numpy as np
+
+from tyr.metrics.engine import ResultArrays
 from tyr.patterns import AbstractSingletonMeta
 from tyr.patterns.abstract import Abstract
 from tyr.patterns.singleton import Singleton
@@ -37,6 +40,10 @@ class Metric(Abstract, Singleton, metaclass=AbstractSingletonMeta):
         """Whether the metric is in reversed order, i.e., the lower the better."""
         return False
 
+    def uses_solutions(self) -> bool:
+        """Whether the metric needs the intermediate solutions of the anytime results."""
+        return False
+
     def _evaluate(
         self,
         results: List[PlannerResult],
@@ -59,7 +66,15 @@ class Metric(Abstract, Singleton, metaclass=AbstractSingletonMeta):
         """
         if len(results) == 0:
             return "-"
-        value = self.evaluate_raw(results, all_results)
+        return self.format_value(self.evaluate_raw(results, all_results))
+
+    def format_value(self, value: float) -> str:
+        """
+        Format a value of the metric in string.
+
+        Args:
+            value: The value to format.
+        """
         if value == self.max_value():
             return str(int(value))
         return f"{value:.2f}"
@@ -78,5 +93,72 @@ class Metric(Abstract, Singleton, metaclass=AbstractSingletonMeta):
         """
         return self._evaluate(results, all_results)
 
+    def _evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results."""
+        grouped: List[List[PlannerResult]] = [[] for _ in range(num_groups)]
+        for result, group in zip(arrays.results, groups):
+            if group >= 0:
+                grouped[group].append(result)
+        return np.array(
+            [self._evaluate(results, arrays.results) for results in grouped],
+            dtype=np.float64,
+        )
+
+    def evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        """
+        Evaluate the performance of each group of results in one pass.
+
+        The value of a group is the same as `evaluate_raw` on the results of the group
+        with all the results as `all_results`.
+
+        Args:
+            arrays: All the results, in columnar format.
+            groups: The group of each result, negative to ignore the result.
+            num_groups: The number of groups.
+        """
+        return self._evaluate_groups(arrays, groups, num_groups)
+
+    def _evaluate_samples(  # pylint: disable = unused-argument
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results on each sample."""
+        return np.full((len(weights), num_groups), np.nan)
+
+    def evaluate_samples(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Evaluate the performance of each group of results on samples of the problems.
+
+        The arrays only contain the columns of the results, not the results themselves.
+        Metrics which cannot be evaluated on the columns return `nan` values.
+
+        Args:
+            arrays: The results to sample, in columnar format.
+            groups: The group of each result, negative to ignore the result.
+            num_groups: The number of groups.
+            weights: The number of times each problem of `arrays.problem_ids` is drawn
+                in each sample, of shape (number of samples, number of problems).
+        """
+        return self._evaluate_samples(arrays, groups, num_groups, weights)
+
 
 __all__ = ["Metric"]
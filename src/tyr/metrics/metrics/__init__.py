@@ -1,6 +1,12 @@
-from . import coverage, quality_score, time_score
+from . import anytime_quality_score, coverage, quality_score, time_score
+from .anytime_quality_score import *
 from .coverage import *
 from .quality_score import *
 from .time_score import *
 
-__all__ = coverage.__all__ + quality_score.__all__ + time_score.__all__
+__all__ = (
+    anytime_quality_score.__all__
+    + coverage.__all__
+    + quality_score.__all__
+    + time_score.__all__
+)
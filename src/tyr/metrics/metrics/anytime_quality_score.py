@@ -0,0 +1,82 @@
+from typing import List
+
+import numpy as np
+
+from tyr.metrics.best_quality import BestQualityIndex
+from tyr.metrics.engine import (
+    ResultArrays,
+    group_mean,
+    group_sample_means,
+    quality_curve_areas,
+)
+from tyr.metrics.metric import Metric
+from tyr.planners.model.result import PlannerResult
+
+
+class AnytimeQualityScoreMetric(Metric):
+    """
+    A metric to evaluate the quality score of a planner over time.
+
+    The quality score of the best solution found so far is integrated from the start of
+    the resolution to the timeout, and divided by the timeout. A planner finding the
+    best plan right away gets the full score, a planner finding it at half the timeout
+    gets at most half of it. Results without intermediate solutions are scored on
+    their final one.
+    """
+
+    def abbrev(self) -> str:
+        return "AQS"
+
+    def uses_solutions(self) -> bool:
+        return True
+
+    def _evaluate(
+        self,
+        results: List[PlannerResult],
+        all_results: List[PlannerResult],
+    ) -> float:
+        """Evaluate the performance of a planner."""
+        best_qualities = BestQualityIndex.from_results(all_results)
+        return best_qualities.mean_score(results, self._score) * 100
+
+    @staticmethod
+    def _score(result: PlannerResult, best_quality: float) -> float:
+        timeout = result.config.timeout
+        if best_quality == float("inf") or timeout <= 0:
+            return 0
+        inverse_area, zero_time = quality_curve_areas(result)
+        return min((best_quality * inverse_area + zero_time) / timeout, 1)
+
+    def _evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results."""
+        return group_mean(self._scores(arrays), groups, num_groups)
+
+    def _evaluate_samples(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results on each sample."""
+        return group_sample_means(
+            self._scores(arrays), groups, num_groups, arrays.problem_ids, weights
+        )
+
+    @staticmethod
+    def _scores(arrays: ResultArrays) -> np.ndarray:
+        best, timeouts = arrays.best_qualities, arrays.timeouts
+        scored = arrays.solved & ~np.isinf(best) & (timeouts > 0)
+        areas = best[scored] * arrays.inverse_quality_areas[scored]
+        areas += arrays.zero_quality_times[scored]
+        scores = np.zeros(len(arrays))
+        scores[scored] = np.minimum(areas / timeouts[scored], 1)
+        return scores
+
+
+__all__ = ["AnytimeQualityScoreMetric"]
@@ -1,5 +1,8 @@
 from typing import List
 
+import numpy as np
+
+from tyr.metrics.engine import ResultArrays, group_mean, group_sample_means
 from tyr.metrics.metric import Metric
 from tyr.planners.model.result import PlannerResult, PlannerResultStatus
 
@@ -21,5 +24,30 @@ class CoverageMetric(Metric):
             * 100
         )
 
+    def _evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results."""
+        return group_mean(self._scores(arrays), groups, num_groups)
+
+    def _evaluate_samples(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results on each sample."""
+        return group_sample_means(
+            self._scores(arrays), groups, num_groups, arrays.problem_ids, weights
+        )
+
+    @staticmethod
+    def _scores(arrays: ResultArrays) -> np.ndarray:
+        return arrays.solved.astype(np.float64)
+
 
 __all__ = ["CoverageMetric"]
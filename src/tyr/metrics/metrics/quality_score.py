@@ -1,7 +1,11 @@
 from typing import List
 
+import numpy as np
+
+from tyr.metrics.best_quality import BestQualityIndex
+from tyr.metrics.engine import ResultArrays, group_mean, group_sample_means
 from tyr.metrics.metric import Metric
-from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.planners.model.result import PlannerResult
 
 
 class QualityScoreMetric(Metric):
@@ -16,26 +20,50 @@ class QualityScoreMetric(Metric):
         all_results: List[PlannerResult],
     ) -> float:
         """Evaluate the performance of a planner."""
-        if len(results) == 0:
+        best_qualities = BestQualityIndex.from_results(all_results)
+        return best_qualities.mean_score(results, self._score) * 100
+
+    @staticmethod
+    def _score(result: PlannerResult, best_quality: float) -> float:
+        quality = result.plan_quality
+        if quality is None:
+            # Redundant with SOLVED but needed for typing and security
             return 0
-        total = self.min_value()
-        for result in results:
-            same_instances = [r for r in all_results if r.problem == result.problem]
-            best_quality = min(
-                float("inf") if r.plan_quality is None else r.plan_quality
-                for r in same_instances
-            )
-            quality = result.plan_quality
-            if result.status != PlannerResultStatus.SOLVED:
-                total += 0
-            elif quality is None:
-                # Redundant with SOLVED but needed for typing and security
-                total += 0
-            elif quality == best_quality:
-                total += 1
-            else:
-                total += best_quality / quality
-        return total / len(results) * 100
+        if quality == best_quality:
+            return 1
+        return best_quality / quality
+
+    def _evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results."""
+        return group_mean(self._scores(arrays), groups, num_groups)
+
+    def _evaluate_samples(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results on each sample."""
+        return group_sample_means(
+            self._scores(arrays), groups, num_groups, arrays.problem_ids, weights
+        )
+
+    @staticmethod
+    def _scores(arrays: ResultArrays) -> np.ndarray:
+        qualities, best = arrays.qualities, arrays.best_qualities
+        solved = arrays.solved & ~np.isnan(qualities)
+        optimal = solved & (qualities == best)
+        scored = solved & ~optimal
+        scores = np.zeros(len(arrays))
+        scores[optimal] = 1
+        scores[scored] = best[scored] / qualities[scored]
+        return scores
 
 
 __all__ = ["QualityScoreMetric"]
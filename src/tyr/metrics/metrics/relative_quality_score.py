@@ -1,5 +1,8 @@
 from typing import List
 
+import numpy as np
+
+from tyr.metrics.engine import ResultArrays
 from tyr.metrics.metric import Metric
 from tyr.metrics.metrics.coverage import CoverageMetric
 from tyr.metrics.metrics.quality_score import QualityScoreMetric
@@ -24,3 +27,30 @@ class RelativeQualityScoreMetric(Metric):
             return self.max_value()
         qs = QualityScoreMetric()._evaluate(results, all_results)
         return (1 - qs / cov) * 100
+
+    def _evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        cov = CoverageMetric()._evaluate_groups(arrays, groups, num_groups)
+        qs = QualityScoreMetric()._evaluate_groups(arrays, groups, num_groups)
+        return self._combine(cov, qs)
+
+    def _evaluate_samples(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        cov = CoverageMetric()._evaluate_samples(arrays, groups, num_groups, weights)
+        qs = QualityScoreMetric()._evaluate_samples(arrays, groups, num_groups, weights)
+        return self._combine(cov, qs)
+
+    def _combine(self, cov: np.ndarray, qs: np.ndarray) -> np.ndarray:
+        result = np.full(cov.shape, float(self.max_value()))
+        covered = cov != 0
+        result[covered] = (1 - qs[covered] / cov[covered]) * 100
+        return result
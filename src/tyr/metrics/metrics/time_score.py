@@ -1,6 +1,9 @@
 from math import log10
 from typing import List
 
+import numpy as np
+
+from tyr.metrics.engine import ResultArrays, group_mean, group_sample_means
 from tyr.metrics.metric import Metric
 from tyr.planners.model.result import PlannerResult, PlannerResultStatus
 
@@ -36,5 +39,40 @@ class TimeScoreMetric(Metric):
                 total += 1 - log10(computation_time) / log10(timeout)
         return total / len(results) * 100
 
+    def _evaluate_groups(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results."""
+        return group_mean(self._scores(arrays), groups, num_groups)
+
+    def _evaluate_samples(
+        self,
+        arrays: ResultArrays,
+        groups: np.ndarray,
+        num_groups: int,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate the performance of each group of results on each sample."""
+        return group_sample_means(
+            self._scores(arrays), groups, num_groups, arrays.problem_ids, weights
+        )
+
+    @staticmethod
+    def _scores(arrays: ResultArrays) -> np.ndarray:
+        times, timeouts = arrays.times, arrays.timeouts
+        solved = arrays.solved & ~np.isnan(times)
+        scored = solved & (times >= 1) & (times <= timeouts)
+        # The logarithms of `math` are used to get the same values as `_evaluate`.
+        scores = np.zeros(len(arrays))
+        scores[solved & (times < 1)] = 1
+        scores[scored] = 1 - _log10(times[scored]) / _log10(timeouts[scored])
+        return scores
+
+
+_log10 = np.vectorize(log10, otypes=[np.float64])
+
 
 __all__ = ["TimeScoreMetric"]
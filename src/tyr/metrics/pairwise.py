@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from tyr.metrics.engine import ResultArrays
+from tyr.planners.model.result import PlannerResult
+
+# The criteria on which the planners are compared, in their order in the matrices.
+CRITERIA = ("coverage", "time", "quality")
+
+
+@dataclass
+class PairwiseComparison:
+    """
+    Wins, ties and losses of each planner against each other one.
+
+    The counts are indexed by criterion, domain, planner and opponent: `wins[c, d, i, j]`
+    is the number of problems of the domain `d` on which the planner `i` beats the
+    planner `j` on the criterion `c`. A problem is compared for a pair of planners when
+    both have a result on it and at least one of them has solved it.
+    """
+
+    planners: List[str]
+    domains: List[str]
+    wins: np.ndarray
+    ties: np.ndarray
+
+    @property
+    def losses(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The number of losses of each planner against each other one.
+        """
+        return self.wins.swapaxes(-1, -2)
+
+    def counts(
+        self, criterion: str, domain: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the matrices of wins, ties and losses on a criterion.
+
+        Args:
+            criterion (str): The name of the criterion.
+            domain (Optional[str], optional): The name of the domain. Defaults to all
+                the domains.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The wins, ties and losses of
+                each planner against each other one.
+        """
+        c = CRITERIA.index(criterion)
+        if domain is None:
+            wins, ties = self.wins[c].sum(axis=0), self.ties[c].sum(axis=0)
+        else:
+            d = self.domains.index(domain)
+            wins, ties = self.wins[c, d], self.ties[c, d]
+        return wins, ties, wins.T
+
+
+# pylint: disable = too-many-locals
+def compare_planners(results: List[PlannerResult]) -> PairwiseComparison:
+    """Compares all the planners of the given results with each other.
+
+    The results of a planner on a problem are merged, then the value of each planner on
+    each problem is placed in a table for each criterion, in a single pass over the
+    results. All the pairs are compared at once by broadcasting the tables, and the
+    comparisons are summed by domain. Unsolved problems have an infinite value.
+
+    Args:
+        results (List[PlannerResult]): The results to compare.
+
+    Returns:
+        PairwiseComparison: The wins, ties and losses of each pair of planners.
+    """
+    arrays = ResultArrays.from_results(PlannerResult.merge_all(results))
+    planners = sorted({r.planner_name for r in arrays.results})
+    domains = sorted({r.problem.domain.name for r in arrays.results})
+    planner_index = {p: i for i, p in enumerate(planners)}
+    domain_index = {d: i for i, d in enumerate(domains)}
+    planner_ids = np.array(
+        [planner_index[r.planner_name] for r in arrays.results], dtype=np.int64
+    )
+    domain_ids = np.array(
+        [domain_index[r.problem.domain.name] for r in arrays.results], dtype=np.int64
+    )
+    num_problems, num_planners = len(arrays.problems), len(planners)
+
+    # The domain of each problem, the value of the planners on it, lower is better.
+    problem_domains = np.zeros(num_problems, dtype=np.int64)
+    problem_domains[arrays.problem_ids] = domain_ids
+    solved = arrays.solved
+    values = np.full((len(CRITERIA), num_problems, num_planners), np.nan)
+    cells = (arrays.problem_ids, planner_ids)
+    values[0][cells] = np.where(solved, 0, np.inf)
+    values[1][cells] = np.where(solved & ~np.isnan(arrays.times), arrays.times, np.inf)
+    values[2][cells] = np.where(
+        solved & ~np.isnan(arrays.qualities), arrays.qualities, np.inf
+    )
+
+    shape = (len(CRITERIA), len(domains), num_planners, num_planners)
+    wins, ties = np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.int64)
+    for c, table in enumerate(values):
+        a, b = table[:, :, None], table[:, None, :]
+        compared = ~np.isnan(a) & ~np.isnan(b) & ~(np.isinf(a) & np.isinf(b))
+        np.add.at(wins[c], problem_domains, compared & (a < b))
+        np.add.at(ties[c], problem_domains, compared & (a == b))
+
+    # A planner is not compared with itself.
+    diagonal = np.arange(num_planners)
+    ties[:, :, diagonal, diagonal] = 0
+    return PairwiseComparison(planners, domains, wins, ties)
+
+
+__all__ = ["CRITERIA", "PairwiseComparison", "compare_planners"]
@@ -1,24 +1,49 @@
+import threading
+import time
+import traceback
 from typing import Callable, Generic, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Marks a value which has not been built yet, `None` being a valid value.
+_UNSET = object()
+
 
 class Lazy(Generic[T]):
-    """A wrapper to make a value lazy."""
+    """
+    A wrapper to make a value lazy.
+
+    The value is built once, under a lock, on its first access. The outcome of the
+    factory is kept even when it is `None` or an exception, which is raised again on
+    the next accesses without calling the factory.
+    """
 
     def __init__(self, value_factory: Callable[[], T]) -> None:
         self._value_factory = value_factory
-        self._value: Optional[T] = None
+        self._value: object = _UNSET
+        self._exception: Optional[BaseException] = None
+        self._error: Optional[str] = None
+        self._build_time: Optional[float] = None
+        self._lock = threading.RLock()
 
     @property
     def value(self) -> T:
         """
         Returns:
             T: The value of the lazy object.
+
+        Raises:
+            Exception: The exception raised by the factory when the value was built.
         """
-        if self._value is None:
-            self._value = self.value_factory()
-        return self._value
+        value, exception = self._value, self._exception
+        if value is _UNSET:
+            with self._lock:
+                if self._value is _UNSET:
+                    self._build()
+                value, exception = self._value, self._exception
+        if exception is not None:
+            raise exception
+        return value  # type: ignore
 
     @property
     def value_factory(self) -> Callable[[], T]:
@@ -28,5 +53,57 @@ class Lazy(Generic[T]):
         """
         return self._value_factory
 
+    @property
+    def is_built(self) -> bool:
+        """
+        Returns:
+            bool: Whether the factory has been called, successfully or not.
+        """
+        return self._value is not _UNSET
+
+    @property
+    def failed(self) -> bool:
+        """
+        Returns:
+            bool: Whether the factory raised an exception.
+        """
+        return self._exception is not None
+
+    @property
+    def error(self) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: The traceback of the exception raised by the factory, if any.
+        """
+        return self._error
+
+    @property
+    def build_time(self) -> Optional[float]:
+        """
+        Returns:
+            Optional[float]: The seconds spent to build the value, `None` if not built.
+        """
+        return self._build_time
+
+    def reset(self) -> None:
+        """Forgets the built value, it is built again on the next access."""
+        with self._lock:
+            self._value = _UNSET
+            self._exception = None
+            self._error = None
+            self._build_time = None
+
+    def _build(self) -> None:
+        start = time.perf_counter()
+        try:
+            value: object = self.value_factory()
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            self._exception = exception
+            self._error = traceback.format_exc()
+            value = None
+        self._build_time = time.perf_counter() - start
+        # Set last so that other threads only see a complete outcome.
+        self._value = value
+
 
 __all__ = ["Lazy"]
@@ -1,11 +1,12 @@
 import datetime
+import json
 import multiprocessing
 import random
 import sqlite3
 import time
 from contextlib import contextmanager
 from dataclasses import replace
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from tyr.core.paths import TyrPaths
 from tyr.patterns.singleton import Singleton
@@ -212,5 +213,295 @@ class Database(Singleton):
             from_database=True,
         )
 
+    def load_anytime_solutions(
+        self, results: List["PlannerResult"]
+    ) -> List["PlannerResult"]:
+        """Loads the intermediate solutions of the solved anytime results.
+
+        The solutions of all the results are loaded in a single query. The solutions of
+        a result are the solved rows saved by the same run, in the time window used to
+        recover the last solved result of the run.
+
+        Args:
+            results (List[PlannerResult]): The results loaded from the database.
+
+        Returns:
+            List[PlannerResult]: The results, the solved anytime ones with their
+                solutions.
+        """
+        # pylint: disable = import-outside-toplevel
+        from tyr.planners.model.result import PlannerResultStatus
+
+        anytime = [
+            r
+            for r in results
+            if r.running_mode.name == "ANYTIME"
+            and r.status == PlannerResultStatus.SOLVED
+        ]
+        if not anytime:
+            return results
+
+        names = sorted({r.planner_name for r in anytime})
+        request = f"""
+                    SELECT "planner", "problem", "memout", "computation", "quality",
+                    "creation" FROM "results"
+                    WHERE "mode"="ANYTIME" AND "status"="SOLVED"
+                    AND "planner" IN ({", ".join("?" * len(names))})
+                    ORDER BY "computation";
+                    """
+        with self.database() as conn:
+            rows = conn.cursor().execute(request, names).fetchall()
+        runs: Dict[Tuple[str, str, int], List[tuple]] = {}
+        for planner, problem, memout, computation, quality, creation in rows:
+            runs.setdefault((planner, problem, memout), []).append(
+                (computation, quality, creation)
+            )
+
+        solutions = {}
+        for result in anytime:
+            key = (result.planner_name, result.problem.name, result.config.memout)
+            timeout = result.config.timeout
+            run = [r for r in runs.get(key, []) if r[0] is not None and r[0] <= timeout]
+            if not run:
+                continue
+            # The loaded result is the last solved one before the timeout.
+            end = max(creation for _, _, creation in run)
+            start = (
+                datetime.datetime.fromisoformat(end)
+                # + 10 seconds to avoid issues linked to retried savings
+                - datetime.timedelta(seconds=timeout + 10)
+            ).isoformat()
+            solutions[id(result)] = tuple(
+                (computation, quality)
+                for computation, quality, creation in run
+                if quality is not None and start <= creation <= end
+            )
+        return [
+            replace(r, solutions=solutions[id(r)]) if id(r) in solutions else r
+            for r in results
+        ]
+
+    def fingerprint(self) -> Tuple[str, int, int]:
+        """Computes a cheap fingerprint of the stored results.
+
+        The results are only ever appended to the database, so any new result changes
+        the number of results and the greatest identifier.
+
+        Returns:
+            Tuple[str, int, int]: The path of the database, the number of results and
+                the greatest identifier of a result.
+        """
+        with self.database() as conn:
+            count, max_id = (
+                conn.cursor()
+                .execute('SELECT COUNT(*), MAX("id") FROM "results";')
+                .fetchone()
+            )
+        return str(TyrPaths().db), count, max_id or 0
+
+    # ============================== Best Qualities ============================== #
+
+    def _create_best_qualities_table(self, conn: sqlite3.Connection):
+        conn.cursor().execute(
+            """
+            CREATE TABLE IF NOT EXISTS "best_qualities" (
+                "problem"	TEXT NOT NULL UNIQUE,
+                "quality"	REAL NOT NULL,
+                "update"	TEXT NOT NULL,
+                PRIMARY KEY("problem")
+            );
+            """
+        )
+
+    def save_best_qualities(self, qualities: Dict[str, float]):
+        """Stores the given best qualities, keeping the best one for each problem.
+
+        Args:
+            qualities (Dict[str, float]): The best qualities by problem name.
+        """
+        now = datetime.datetime.now().isoformat()
+        with self.database() as conn:
+            self._create_best_qualities_table(conn)
+            conn.cursor().executemany(
+                """
+                INSERT INTO "best_qualities" ("problem", "quality", "update")
+                VALUES (?, ?, ?)
+                ON CONFLICT("problem") DO UPDATE SET
+                    "quality"=excluded."quality", "update"=excluded."update"
+                WHERE excluded."quality" < "best_qualities"."quality";
+                """,
+                [(name, quality, now) for name, quality in qualities.items()],
+            )
+            conn.commit()
+
+    def load_best_qualities(self, problem_names: List[str]) -> Dict[str, float]:
+        """Loads the stored best qualities of the given problems.
+
+        Args:
+            problem_names (List[str]): The names of the problems.
+
+        Returns:
+            Dict[str, float]: The best qualities by problem name, for the problems
+                having one.
+        """
+        names = set(problem_names)
+        with self.database() as conn:
+            self._create_best_qualities_table(conn)
+            rows = conn.cursor().execute(
+                'SELECT "problem", "quality" FROM "best_qualities";'
+            )
+            return {name: quality for name, quality in rows if name in names}
+
+    # ============================== Virtual Results ============================= #
+
+    def _create_virtual_results_table(self, conn: sqlite3.Connection):
+        conn.cursor().execute(
+            """
+            CREATE TABLE IF NOT EXISTS "virtual_results" (
+                "planner"	TEXT NOT NULL,
+                "members"	TEXT NOT NULL,
+                "problem"	TEXT NOT NULL,
+                "mode"	TEXT NOT NULL,
+                "memout"	INTEGER NOT NULL,
+                "timeout"	INTEGER NOT NULL,
+                "status"	TEXT NOT NULL,
+                "computation"	REAL,
+                "quality"	REAL,
+                "error msg"	TEXT,
+                "solutions"	TEXT NOT NULL,
+                "last result"	INTEGER NOT NULL,
+                PRIMARY KEY("planner", "members", "problem", "mode", "memout", "timeout")
+            );
+            """
+        )
+
+    def last_result_id(self, planner_names: List[str]) -> int:
+        """
+        Args:
+            planner_names (List[str]): The names of the planners.
+
+        Returns:
+            int: The greatest identifier of a result of the planners, 0 without result.
+        """
+        request = f"""
+                    SELECT MAX("id") FROM "results"
+                    WHERE "planner" IN ({", ".join("?" * len(planner_names))});
+                    """
+        with self.database() as conn:
+            (last_id,) = conn.cursor().execute(request, planner_names).fetchone()
+        return last_id or 0
+
+    def save_virtual_results(
+        self,
+        members: List[str],
+        last_result: int,
+        results: List["PlannerResult"],
+    ) -> None:
+        """Stores the results of a virtual planner, replacing the previous ones.
+
+        Args:
+            members (List[str]): The names of the members of the virtual planner.
+            last_result (int): The greatest identifier of a result of the members when
+                the results have been synthesised.
+            results (List[PlannerResult]): The results of the virtual planner.
+        """
+        rows = [
+            (
+                r.planner_name,
+                json.dumps(sorted(members)),
+                r.problem.name,
+                r.running_mode.name,
+                r.config.memout,
+                r.config.timeout,
+                r.status.name,
+                r.computation_time,
+                r.plan_quality,
+                r.error_message,
+                json.dumps(r.solutions),
+                last_result,
+            )
+            for r in results
+        ]
+        if not rows:
+            return
+        with self.database() as conn:
+            self._create_virtual_results_table(conn)
+            conn.cursor().executemany(
+                """
+                INSERT OR REPLACE INTO "virtual_results" (
+                    "planner", "members", "problem", "mode", "memout", "timeout",
+                    "status", "computation", "quality", "error msg", "solutions",
+                    "last result"
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                rows,
+            )
+            conn.commit()
+
+    def load_virtual_results(
+        self,
+        planner_name: str,
+        members: List[str],
+        last_result: int,
+        results: List["PlannerResult"],
+    ) -> List["PlannerResult"]:
+        """Loads the stored results of a virtual planner on the groups of the given results.
+
+        The stored results are only valid when no result of the members has been saved
+        since they have been synthesised.
+
+        Args:
+            planner_name (str): The name of the virtual planner.
+            members (List[str]): The names of the members of the virtual planner.
+            last_result (int): The greatest identifier of a result of the members.
+            results (List[PlannerResult]): The results of the members, grouped by problem
+                and running mode.
+
+        Returns:
+            List[PlannerResult]: The stored results of the virtual planner on the groups
+                having one.
+        """
+        # pylint: disable = import-outside-toplevel
+        from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+        with self.database() as conn:
+            self._create_virtual_results_table(conn)
+            rows = conn.cursor().execute(
+                """
+                SELECT "problem", "mode", "memout", "timeout", "status", "computation",
+                "quality", "error msg", "solutions" FROM "virtual_results"
+                WHERE "planner"=? AND "members"=? AND "last result"=?;
+                """,
+                [planner_name, json.dumps(sorted(members)), last_result],
+            )
+            stored = {tuple(row[:4]): row[4:] for row in rows}
+
+        loaded = []
+        for result in results:
+            key = (
+                result.problem.name,
+                result.running_mode.name,
+                result.config.memout,
+                result.config.timeout,
+            )
+            if key not in stored:
+                continue
+            status, computation, quality, error_message, solutions = stored.pop(key)
+            loaded.append(
+                PlannerResult(
+                    planner_name,
+                    result.problem,
+                    result.running_mode,
+                    status=getattr(PlannerResultStatus, status),
+                    config=result.config,
+                    computation_time=computation,
+                    plan_quality=quality,
+                    error_message=error_message,
+                    from_database=True,
+                    solutions=tuple(tuple(s) for s in json.loads(solutions)),
+                )
+            )
+        return loaded
+
 
 __all__ = ["Database"]
@@ -1,14 +1,26 @@
-from . import apptainer_planner, config, pddl_planner, planner, result
+from . import (
+    apptainer_planner,
+    config,
+    pddl_planner,
+    planner,
+    portfolio_planner,
+    result,
+    virtual_planner,
+)
 from .apptainer_planner import *
 from .config import *
 from .pddl_planner import *
 from .planner import *
+from .portfolio_planner import *
 from .result import *
+from .virtual_planner import *
 
 __all__ = (
     apptainer_planner.__all__
     + config.__all__
     + pddl_planner.__all__
     + planner.__all__
+    + portfolio_planner.__all__
     + result.__all__
+    + virtual_planner.__all__
 )
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass(frozen=True)
-class PlannerConfig:
+class PlannerConfig:  # pylint: disable=too-many-instance-attributes
     """Represents the configuration of a planner."""
 
     name: str
@@ -13,6 +13,8 @@ class PlannerConfig:
     anytime_name: Optional[str] = None
     oneshot_name: Optional[str] = None
     upf_engine: Optional[str] = None
+    memout: Optional[int] = None
+    portfolio: List[str] = field(default_factory=list)
 
     def __hash__(self) -> int:
         return hash(self.name) + hash(str(self.problems))
@@ -9,7 +9,7 @@ from io import TextIOWrapper
 from multiprocessing import Process, Queue
 from pathlib import Path
 from queue import Empty
-from typing import Generator, Optional, Tuple
+from typing import Generator, List, Optional, Tuple
 
 import unified_planning.shortcuts as upf
 from unified_planning.engines import PlanGenerationResult, PlanGenerationResultStatus
@@ -126,6 +126,19 @@ class Planner:
         except KeyError:
             return None, None
 
+    def get_solve_config(self, config: SolveConfig) -> SolveConfig:
+        """Adapts the given configuration to the limits specific to the planner.
+
+        Args:
+            config (SolveConfig): The configuration of the solving process.
+
+        Returns:
+            SolveConfig: The configuration to use for the resolutions of the planner.
+        """
+        if self.config.memout is None:
+            return config
+        return replace(config, memout=self.config.memout)
+
     def supports_running_mode(self, running_mode: RunningMode) -> bool:
         """
         Checks if the planner supports the given running mode.
@@ -161,8 +174,20 @@ class Planner:
             Generator[PlannerResult, None, None]: The results of the resolution.
         """
         start = time.time()
+        solutions: List[Tuple[float, float]] = []
         try:
             for result in self._solve(problem, config, running_mode):
+                if (
+                    running_mode == RunningMode.ANYTIME
+                    and result.status == PlannerResultStatus.SOLVED
+                    and result.computation_time is not None
+                    and result.plan_quality is not None
+                ):
+                    # Keep track of the intermediate solutions of the resolution.
+                    solution = (result.computation_time, result.plan_quality)
+                    if not solutions or solutions[-1] != solution:
+                        solutions.append(solution)
+                    result = replace(result, solutions=tuple(solutions))
                 if config.no_db_save is False:
                     Database().save_planner_result(result)
                 yield result
@@ -176,7 +201,7 @@ class Planner:
             yield PlannerResult.error(
                 problem,
                 self,
-                config,
+                self.get_solve_config(config),
                 running_mode,
                 computation_time,
                 traceback.format_exc(),
@@ -219,6 +244,9 @@ class Planner:
         Returns:
             Generator[PlannerResult, None, None]: The results of the resolution.
         """
+        # Use the limits specific to the planner.
+        config = self.get_solve_config(config)
+
         # Check if the planner supports the running mode.
         if not self.supports_running_mode(running_mode):
             yield PlannerResult.unsupported(problem, self, config, running_mode)
@@ -260,7 +288,7 @@ class Planner:
 
         # Clear the logs and logs the version to solve.
         shutil.rmtree(self.get_log_file(problem, "", running_mode).parent, True)
-        self._log_problem_version(problem, version, running_mode)
+        self._log_problem_version(problem, version_name, version, running_mode)
 
         # Limits the virtual memory of the current process.
         resource.setrlimit(resource.RLIMIT_AS, (config.memout, resource.RLIM_INFINITY))
@@ -385,11 +413,21 @@ class Planner:
     def _log_problem_version(
         self,
         problem: ProblemInstance,
+        version_name: str,
         version: AbstractProblem,
         running_mode: RunningMode,
     ) -> None:
         # pylint: disable = broad-exception-caught
 
+        # Export the name of the version and the time spent to build it.
+        build_time = problem.versions[version_name].build_time
+        ver_path = self.get_log_file(problem, "version", running_mode)
+        ver_path.write_text(
+            f"{version_name}\nbuild time: "
+            + (f"{build_time:.3f}s" if isinstance(build_time, float) else "unknown")
+            + "\n"
+        )
+
         # Export the problem in PDDL format.
         try:
             dom_path = self.get_log_file(problem, "domain", running_mode, "pddl")
@@ -0,0 +1,285 @@
+import contextlib
+import os
+import shutil
+import signal
+import time
+import traceback
+from dataclasses import replace
+from multiprocessing import Process, Queue
+from queue import Empty
+from typing import Dict, Generator, List, Optional, Set, Tuple
+
+from unified_planning.shortcuts import AbstractProblem
+
+from tyr.planners.database import Database
+from tyr.planners.model.config import PlannerConfig, RunningMode, SolveConfig
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.problems import ProblemInstance
+
+# Status of the race when no racer found a plan, by decreasing priority.
+_FAILURE_STATUSES = [
+    PlannerResultStatus.UNSOLVABLE,
+    PlannerResultStatus.TIMEOUT,
+    PlannerResultStatus.MEMOUT,
+    PlannerResultStatus.ERROR,
+    PlannerResultStatus.UNSUPPORTED,
+]
+
+
+class PortfolioPlanner(Planner):
+    """
+    A virtual planner racing several planners on the same problem.
+
+    In oneshot mode, the first solved result wins and the other racers are stopped.
+    In anytime mode, the best quality found by any racer before the timeout is kept.
+    The outcome is stored under the name of the portfolio, which includes the sorted
+    names of its members so that races of other member sets are never reused. The name
+    has no regex metacharacter of its own, so that a filter on it selects it.
+    """
+
+    def __init__(self, config: PlannerConfig, members: List[Planner]) -> None:
+        super().__init__(config)
+        self._members = members
+
+    @property
+    def members(self) -> List[Planner]:
+        """
+        Returns:
+            List[Planner]: The planners racing in the portfolio.
+        """
+        return self._members
+
+    @property
+    def name(self) -> str:
+        """
+        Returns:
+            str: The name of the portfolio followed by the sorted names of its members,
+                such as `race@a,b`.
+        """
+        members = ",".join(sorted(m.name for m in self.members))
+        return f"{self.config.name}@{members}"
+
+    def get_version(
+        self, problem: ProblemInstance
+    ) -> Tuple[Optional[str], Optional[AbstractProblem]]:
+        """Search the version that the first member able to solve the problem has to solve.
+
+        Args:
+            problem (ProblemInstance): The problem to solve.
+
+        Returns:
+            Optional[AbstractProblem]: The version to solve and its name.
+                `None` for both if no member supports it.
+        """
+        for member in self.members:
+            version_name, version = member.get_version(problem)
+            if version_name is not None and version is not None:
+                return version_name, version
+        return None, None
+
+    def supports_running_mode(self, running_mode: RunningMode) -> bool:
+        """
+        Checks if at least one member supports the given running mode.
+
+        Args:
+            running_mode (RunningMode): The mode to check.
+
+        Returns:
+            bool: `True` if the portfolio supports the mode, `False` otherwise.
+        """
+        return any(m.supports_running_mode(running_mode) for m in self.members)
+
+    def _solve(
+        self,
+        problem: ProblemInstance,
+        config: SolveConfig,
+        running_mode: RunningMode,
+    ) -> Generator[PlannerResult, None, None]:
+        """Races the members on the given problem with the given configuration.
+
+        Args:
+            problem (ProblemInstance): The problem to solve.
+            config (SolveConfig): The configuration to use during the resolution.
+            running_mode (RunningMode): The mode to use to run the resolution.
+
+        Returns:
+            Generator[PlannerResult, None, None]: The results of the race.
+        """
+        # pylint: disable = duplicate-code
+        config = self.get_solve_config(config)
+
+        # Check if the portfolio supports the running mode.
+        if running_mode not in [RunningMode.ONESHOT, RunningMode.ANYTIME]:
+            raise NotImplementedError(f"Running mode {running_mode} is not supported.")
+        if not self.supports_running_mode(running_mode):
+            yield PlannerResult.unsupported(problem, self, config, running_mode)
+            return
+
+        # Check the database.
+        if config.no_db_load is False:
+            db = Database().load_planner_result(
+                self.name,
+                problem,
+                config,
+                running_mode,
+            )
+            if db is not None:
+                yield db
+                return
+            if config.db_only:
+                yield PlannerResult.not_run(problem, self, config, running_mode)
+                return
+
+        # Clear the logs of the previous race.
+        shutil.rmtree(self.get_log_file(problem, "", running_mode).parent, True)
+
+        racers = [m for m in self.members if m.supports_running_mode(running_mode)]
+        yield from self._race(problem, config, running_mode, racers)
+
+    # pylint: disable = too-many-locals, too-many-branches, too-many-statements
+    def _race(
+        self,
+        problem: ProblemInstance,
+        config: SolveConfig,
+        running_mode: RunningMode,
+        racers: List[Planner],
+    ) -> Generator[PlannerResult, None, None]:
+        # The racers must really run, their own results are not stored.
+        racer_config = replace(config, jobs=1, no_db_load=True, no_db_save=True)
+        queue: Queue = Queue()
+        processes = [
+            Process(
+                target=self._run_racer,
+                args=(idx, racer, problem, racer_config, running_mode, queue),
+            )
+            for idx, racer in enumerate(racers)
+        ]
+
+        deadline = config.timeout
+        if running_mode == RunningMode.ONESHOT:
+            deadline += config.timeout_offset
+
+        best: Optional[PlannerResult] = None
+        yielded: Optional[PlannerResult] = None
+        statuses: Dict[int, PlannerResultStatus] = {}
+        errors: List[str] = []
+        finished: Set[int] = set()
+
+        log_path = self.get_log_file(problem, "race", running_mode)
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            start = time.time()
+            for process in processes:
+                process.start()
+            try:
+                while len(finished) < len(racers) and time.time() - start < deadline:
+                    try:
+                        idx, status, quality, message = queue.get(timeout=0.1)
+                    except Empty:
+                        # Detect the racers which died without notification.
+                        for i, process in enumerate(processes):
+                            if i not in finished and not process.is_alive():
+                                if queue.empty():
+                                    statuses.setdefault(i, PlannerResultStatus.ERROR)
+                                    finished.add(i)
+                        continue
+
+                    elapsed = time.time() - start
+                    if status is None:
+                        finished.add(idx)
+                        continue
+                    log_file.write(
+                        f"{elapsed:.3f}\t{racers[idx].name}\t{status.name}\t{quality}\n"
+                    )
+                    log_file.flush()
+
+                    if status != PlannerResultStatus.SOLVED:
+                        statuses[idx] = status
+                        if status == PlannerResultStatus.ERROR and message:
+                            errors.append(f"{racers[idx].name}:\n{message}")
+                        continue
+
+                    result = PlannerResult(
+                        self.name,
+                        problem,
+                        running_mode,
+                        PlannerResultStatus.SOLVED,
+                        config,
+                        elapsed,
+                        quality,
+                    )
+                    if running_mode == RunningMode.ONESHOT:
+                        log_file.write(f"winner\t{racers[idx].name}\n")
+                        best = result
+                        break
+                    if best is None or (
+                        quality is not None
+                        and (best.plan_quality is None or quality < best.plan_quality)
+                    ):
+                        best = yielded = result
+                        yield best
+            finally:
+                for process in processes:
+                    self._stop_racer(process)
+
+        if best is not None:
+            if best is not yielded:
+                yield best
+            return
+        if len(finished) < len(racers):
+            yield PlannerResult.timeout(problem, self, config, running_mode)
+            return
+
+        status = next(
+            (s for s in _FAILURE_STATUSES if s in statuses.values()),
+            PlannerResultStatus.ERROR,
+        )
+        if status == PlannerResultStatus.TIMEOUT:
+            yield PlannerResult.timeout(problem, self, config, running_mode)
+        elif status == PlannerResultStatus.UNSUPPORTED:
+            yield PlannerResult.unsupported(problem, self, config, running_mode)
+        else:
+            yield PlannerResult(
+                self.name,
+                problem,
+                running_mode,
+                status,
+                config,
+                time.time() - start,
+                error_message="\n".join(errors),
+            )
+
+    @staticmethod
+    def _run_racer(  # pylint: disable = too-many-arguments
+        idx: int,
+        racer: Planner,
+        problem: ProblemInstance,
+        config: SolveConfig,
+        running_mode: RunningMode,
+        queue: Queue,
+    ) -> None:
+        # Own process group so that the racer and its children can be killed at once.
+        os.setpgrp()
+        try:
+            # pylint: disable = protected-access
+            for result in racer._solve(problem, config, running_mode):
+                queue.put(
+                    (idx, result.status, result.plan_quality, result.error_message)
+                )
+        except Exception:  # pylint: disable=broad-exception-caught
+            queue.put((idx, PlannerResultStatus.ERROR, None, traceback.format_exc()))
+        queue.put((idx, None, None, ""))
+
+    @staticmethod
+    def _stop_racer(process: Process) -> None:
+        if process.is_alive() and process.pid is not None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                # The racer has not created its group yet.
+                process.kill()
+        with contextlib.suppress(AssertionError):
+            process.join(2)
+
+
+__all__ = ["PortfolioPlanner"]
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, replace
 from enum import Enum, auto
 from fractions import Fraction
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from unified_planning.engines.results import (
     PlanGenerationResult,
@@ -63,6 +63,8 @@ class PlannerResult:  # pylint: disable = too-many-instance-attributes
     plan_quality: Optional[float] = None
     error_message: str = ""
     from_database: bool = False
+    # The computation time and the quality of the solutions found by an anytime run.
+    solutions: Tuple[Tuple[float, float], ...] = ()
 
     # pylint: disable = too-many-arguments
     @staticmethod
@@ -120,6 +122,29 @@ class PlannerResult:  # pylint: disable = too-many-instance-attributes
             plan_quality,
         )
 
+    def quality_curve(self) -> List[Tuple[float, float]]:
+        """Lists the improving solutions found during the resolution.
+
+        Returns:
+            List[Tuple[float, float]]: The computation time and the quality of each
+                solution improving the best quality found so far, by increasing time.
+                Results without intermediate solutions only have their final solution.
+        """
+        points = list(self.solutions)
+        if (
+            not points
+            and self.status == PlannerResultStatus.SOLVED
+            and self.computation_time is not None
+            and self.plan_quality is not None
+        ):
+            points = [(self.computation_time, self.plan_quality)]
+
+        curve: List[Tuple[float, float]] = []
+        for time, quality in sorted(points):
+            if not curve or quality < curve[-1][1]:
+                curve.append((time, quality))
+        return curve
+
     def merge(self, other: "PlannerResult") -> "PlannerResult":
         """Merges two results into one.
 
@@ -149,7 +174,14 @@ class PlannerResult:  # pylint: disable = too-many-instance-attributes
             default=None,
         )
 
-        args = {"running_mode": RunningMode.MERGED, "plan_quality": quality}
+        args: Dict[str, Any] = {
+            "running_mode": RunningMode.MERGED,
+            "plan_quality": quality,
+        }
+        # The merged solutions are the best of both resolutions at any time.
+        curves = (self.quality_curve(), other.quality_curve())
+        if all(curves):
+            args["solutions"] = tuple(sorted(set(curves[0] + curves[1])))
         if other.status != PlannerResultStatus.SOLVED:
             return replace(self, **args)  # type: ignore
         if self.status != PlannerResultStatus.SOLVED:
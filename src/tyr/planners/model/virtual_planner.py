@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, List, Tuple
+
+from tyr.planners.model.config import RunningMode
+from tyr.planners.model.planner import Planner
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+from tyr.problems import ProblemInstance
+
+# Names reserved for the virtual best and worst solvers, no planner should use them.
+VIRTUAL_BEST_NAME = "vbs"
+VIRTUAL_WORST_NAME = "vws"
+
+# Outcomes of the members from the best to the worst. A member which has not run the
+# problem has not solved it, but did not fail on it either. Unsupported results are
+# treated as missing ones.
+_STATUS_RANKS = {
+    status: rank
+    for rank, status in enumerate(
+        [
+            PlannerResultStatus.SOLVED,
+            PlannerResultStatus.UNSOLVABLE,
+            PlannerResultStatus.NOT_RUN,
+            PlannerResultStatus.TIMEOUT,
+            PlannerResultStatus.MEMOUT,
+            PlannerResultStatus.ERROR,
+        ]
+    )
+}
+
+
+@dataclass(frozen=True)
+class VirtualPlanner:
+    """
+    A pseudo planner whose results are synthesised from the results of its members.
+
+    The virtual best solver (VBS) gets, on each problem, the best outcome of its
+    members: solved when one of them solved it, with the smallest time, the smallest
+    quality and the lower envelope of their anytime solutions. The virtual worst solver
+    (VWS) only solves the problems solved by all its members, with the largest time and
+    the largest quality. Their results can be analysed as the ones of any planner, but
+    they never solve a problem themselves.
+    """
+
+    name: str
+    members: Tuple[Planner, ...]
+    best: bool
+
+    def combine(self, results: List[PlannerResult]) -> PlannerResult:
+        """Synthesises the result of the virtual planner from the results of its members.
+
+        The outcomes of the members are ranked from solved to errors. An unsupported
+        result counts as a missing one, and a missing member has not run the problem,
+        so the virtual worst solver does not solve it. The virtual planners only get an
+        unsupported result when no member supports the problem.
+
+        Args:
+            results (List[PlannerResult]): The results of the members on the same problem
+                in the same running mode, there must be at least one.
+
+        Returns:
+            PlannerResult: The best or the worst outcome of the results.
+        """
+        first = results[0]
+        results = [r for r in results if r.status in _STATUS_RANKS]
+        if not results:
+            return PlannerResult(
+                self.name,
+                first.problem,
+                first.running_mode,
+                PlannerResultStatus.UNSUPPORTED,
+                first.config,
+            )
+
+        statuses = [r.status for r in results]
+        names = {r.planner_name for r in results}
+        if not self.best and any(m.name not in names for m in self.members):
+            statuses.append(PlannerResultStatus.NOT_RUN)
+        pick = min if self.best else max
+        status = pick(statuses, key=_STATUS_RANKS.__getitem__)
+        if status != PlannerResultStatus.SOLVED:
+            return PlannerResult(
+                self.name, first.problem, first.running_mode, status, first.config
+            )
+
+        solved = [r for r in results if r.status == PlannerResultStatus.SOLVED]
+        times = [r.computation_time for r in solved if r.computation_time is not None]
+        qualities = [r.plan_quality for r in solved if r.plan_quality is not None]
+        solutions: Tuple[Tuple[float, float], ...] = ()
+        if self.best and first.running_mode == RunningMode.ANYTIME:
+            # The best quality found at any time is the best one among the members.
+            curves = chain.from_iterable(r.quality_curve() for r in solved)
+            solutions = tuple(sorted(set(curves)))
+        return PlannerResult(
+            self.name,
+            first.problem,
+            first.running_mode,
+            status,
+            first.config,
+            pick(times, default=None),
+            pick(qualities, default=None),
+            solutions=solutions,
+        )
+
+
+def virtual_planners(members: List[Planner]) -> List[VirtualPlanner]:
+    """Creates the virtual best and worst solvers of the given planners.
+
+    Args:
+        members (List[Planner]): The planners to combine.
+
+    Returns:
+        List[VirtualPlanner]: The virtual best and the virtual worst solvers.
+    """
+    return [
+        VirtualPlanner(VIRTUAL_BEST_NAME, tuple(members), True),
+        VirtualPlanner(VIRTUAL_WORST_NAME, tuple(members), False),
+    ]
+
+
+def synthesize_virtual_results(
+    planners: List[VirtualPlanner],
+    results: List[PlannerResult],
+) -> List[PlannerResult]:
+    """Synthesises the results of the virtual planners.
+
+    The results are grouped by problem and running mode in a single pass, then each
+    virtual planner combines the results of its members in each group.
+
+    Args:
+        planners (List[VirtualPlanner]): The virtual planners.
+        results (List[PlannerResult]): The results of the members.
+
+    Returns:
+        List[PlannerResult]: The results of the virtual planners on the groups where
+            at least one of their members has a result.
+    """
+    groups: Dict[Tuple[ProblemInstance, RunningMode], List[PlannerResult]] = {}
+    for result in results:
+        groups.setdefault((result.problem, result.running_mode), []).append(result)
+
+    synthesized = []
+    for planner in planners:
+        names = {m.name for m in planner.members}
+        for group in groups.values():
+            members = [r for r in group if r.planner_name in names]
+            if members:
+                synthesized.append(planner.combine(members))
+    return synthesized
+
+
+__all__ = [
+    "VIRTUAL_BEST_NAME",
+    "VIRTUAL_WORST_NAME",
+    "VirtualPlanner",
+    "synthesize_virtual_results",
+    "virtual_planners",
+]
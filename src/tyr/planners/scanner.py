@@ -1,18 +1,31 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from tyr.configuration.loader import load_config
 from tyr.planners.model.config import PlannerConfig
 from tyr.planners.model.planner import Planner
+from tyr.planners.model.portfolio_planner import PortfolioPlanner
+from tyr.planners.model.virtual_planner import VIRTUAL_BEST_NAME, VIRTUAL_WORST_NAME
+
+_planners_cache: Dict[str, Planner] = {}
 
 
 def get_all_planner_configs() -> List[PlannerConfig]:
     """
     Returns:
         List[PlannerConfig]: All planner configs defined in `tyr.configuration` module.
+
+    Raises:
+        ValueError: If a planner uses a name reserved for a virtual solver.
     """
     if (content := load_config("planners")) is None:
         return []
-    return [PlannerConfig(**p) for p in content]
+    configs = [PlannerConfig(**p) for p in content]
+    for config in configs:
+        if config.name in (VIRTUAL_BEST_NAME, VIRTUAL_WORST_NAME):
+            raise ValueError(
+                f"The planner name {config.name} is reserved for a virtual solver."
+            )
+    return configs
 
 
 def get_all_planners() -> List[Planner]:
@@ -20,7 +33,31 @@ def get_all_planners() -> List[Planner]:
     Returns:
         List[Planner]: All planners defined in `tyr.configuration` module.
     """
-    return [Planner(c) for c in get_all_planner_configs()]
+    configs = get_all_planner_configs()
+    planners = {c.name: Planner(c) for c in configs if len(c.portfolio) == 0}
+    portfolios = [
+        PortfolioPlanner(c, [planners[m] for m in c.portfolio if m in planners])
+        for c in configs
+        if len(c.portfolio) != 0
+    ]
+    return list(planners.values()) + portfolios
+
+
+def get_planner(name: str) -> Optional[Planner]:
+    """Retrieves a planner by its name.
+
+    The planners are indexed by name on the first call and the index is kept for the
+    next ones, so that repeated lookups in a worker do not parse the configuration again.
+
+    Args:
+        name (str): The name of the planner.
+
+    Returns:
+        Optional[Planner]: The planner, `None` if it doesn't exist.
+    """
+    if name not in _planners_cache:
+        _planners_cache.update({p.name: p for p in get_all_planners()})
+    return _planners_cache.get(name, None)
 
 
-__all__ = ["get_all_planners", "get_all_planner_configs"]
+__all__ = ["get_all_planners", "get_all_planner_configs", "get_planner"]
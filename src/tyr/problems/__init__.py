@@ -1,6 +1,14 @@
-from . import converter, model, scanner
+from . import cache, converter, eviction, model, scanner
+from .cache import *
 from .converter import *
+from .eviction import *
 from .model import *
 from .scanner import *
 
-__all__ = converter.__all__ + model.__all__ + scanner.__all__
+__all__ = (
+    cache.__all__
+    + converter.__all__
+    + eviction.__all__
+    + model.__all__
+    + scanner.__all__
+)
@@ -0,0 +1,230 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+import unified_planning
+import unified_planning.shortcuts as upf
+from unified_planning.environment import get_environment
+from unified_planning.grpc.generated import unified_planning_pb2 as proto
+from unified_planning.grpc.proto_reader import ProtobufReader
+from unified_planning.grpc.proto_writer import ProtobufWriter
+
+from tyr.__version__ import __version__
+from tyr.core.paths import TyrPaths
+from tyr.patterns.singleton import Singleton
+
+if TYPE_CHECKING:
+    from tyr.problems.model.instance import ProblemInstance
+
+
+class ProblemCache(Singleton):
+    """
+    Persistent cache of the problems parsed from files.
+
+    The problems are stored in the cache directory in the protobuf format of the unified
+    planning library. An entry is identified by the content of the domain and instance
+    files and by the versions of tyr and unified planning, so it never needs to be
+    invalidated by hand.
+
+    The versions of a problem are identified the same way, by its name, the name of the
+    version and the content of the source files of its domain.
+
+    The cache is disabled by default, the problems are then built without reading or
+    writing the cache directory. The commands building many problems enable it.
+    """
+
+    extension = "binpb"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._file_hashes: Dict[Tuple[Path, int, int], str] = {}
+        self._enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether the problems are loaded from and saved in the cache.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        """
+        Args:
+            enabled (bool): Whether to load the problems from and save them in the cache.
+        """
+        self._enabled = enabled
+
+    @property
+    def folder(self) -> Path:
+        """
+        Returns:
+            Path: The directory storing the cached problems.
+        """
+        return TyrPaths().cache / "problems"
+
+    # ================================== Access ================================== #
+
+    def get_key(self, problem_file: Path, domain_file: Path) -> str:
+        """Computes the key of the problem parsed from the given files.
+
+        Args:
+            problem_file (Path): The path of the problem file.
+            domain_file (Path): The path of the domain file.
+
+        Returns:
+            str: The key of the problem in the cache.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"tyr={__version__};up={unified_planning.__version__};".encode())
+        digest.update(self._hash_file(domain_file).encode())
+        digest.update(self._hash_file(problem_file).encode())
+        return digest.hexdigest()
+
+    def get_version_key(
+        self, problem: "ProblemInstance", version_name: str
+    ) -> Optional[str]:
+        """Computes the key of the given version of the problem.
+
+        Args:
+            problem (ProblemInstance): The problem owning the version.
+            version_name (str): The name of the version.
+
+        Returns:
+            Optional[str]: The key of the version in the cache.
+                `None` if the source files of the domain are unknown or missing.
+        """
+        source_files = problem.domain.get_source_files(problem.uid)
+        if len(source_files) == 0:
+            return None
+        digest = hashlib.sha256()
+        digest.update(f"tyr={__version__};up={unified_planning.__version__};".encode())
+        digest.update(f"{problem.name};{version_name};".encode())
+        for source_file in source_files:
+            if not source_file.exists():
+                return None
+            digest.update(self._hash_file(source_file).encode())
+        return digest.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        """
+        Args:
+            key (str): The key of a problem.
+
+        Returns:
+            Path: The file storing the problem with the given key.
+        """
+        return self.folder / f"{key}.{self.extension}"
+
+    def load(self, key: str) -> Optional[upf.AbstractProblem]:
+        """Loads the problem with the given key from the cache.
+
+        Args:
+            key (str): The key of the problem.
+
+        Returns:
+            Optional[upf.AbstractProblem]: The cached problem, `None` if it is absent or unreadable.
+        """
+        try:
+            message = proto.Problem()  # pylint: disable=no-member
+            message.ParseFromString(self.get_path(key).read_bytes())
+            return ProtobufReader().convert(message, get_environment())
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+    def save(self, key: str, problem: upf.AbstractProblem) -> bool:
+        """Saves the given problem in the cache.
+
+        The file is written atomically so that concurrent processes never read a partial entry.
+
+        Args:
+            key (str): The key of the problem.
+            problem (upf.AbstractProblem): The problem to save.
+
+        Returns:
+            bool: Whether the problem has been saved.
+        """
+        try:
+            content = ProtobufWriter().convert(problem).SerializeToString()
+            self.folder.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp_path, self.get_path(key))
+            return True
+        except Exception:  # pylint: disable=broad-exception-caught
+            return False
+
+    def get_or_parse(
+        self,
+        problem_file: Path,
+        domain_file: Path,
+        parse: Callable[[], upf.AbstractProblem],
+    ) -> Optional[upf.AbstractProblem]:
+        """Loads the problem parsed from the given files, parses and saves it on a miss.
+
+        Args:
+            problem_file (Path): The path of the problem file.
+            domain_file (Path): The path of the domain file.
+            parse (Callable[[], upf.AbstractProblem]): The function parsing the files.
+
+        Returns:
+            Optional[upf.AbstractProblem]: The parsed problem.
+        """
+        return self.get_or_build(self.get_key(problem_file, domain_file), parse)
+
+    def get_or_build(
+        self,
+        key: str,
+        build: Callable[[], Optional[upf.AbstractProblem]],
+    ) -> Optional[upf.AbstractProblem]:
+        """Loads the problem with the given key, builds and saves it on a miss.
+
+        The problem is only built when the cache is disabled.
+
+        Args:
+            key (str): The key of the problem.
+            build (Callable[[], Optional[upf.AbstractProblem]]): The function building
+                the problem.
+
+        Returns:
+            Optional[upf.AbstractProblem]: The problem, `None` if it cannot be built.
+        """
+        if not self.enabled:
+            return build()
+        if (problem := self.load(key)) is not None:
+            return problem
+        problem = build()
+        if problem is not None:
+            self.save(key, problem)
+        return problem
+
+    # ================================ Management ================================ #
+
+    def clear(self) -> int:
+        """Removes all the entries of the cache.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        if not self.folder.exists():
+            return 0
+        removed = 0
+        for file in self.folder.iterdir():
+            if file.suffix in [f".{self.extension}", ".tmp"]:
+                file.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _hash_file(self, path: Path) -> str:
+        stat = path.stat()
+        memo_key = (path.resolve(), stat.st_mtime_ns, stat.st_size)
+        if memo_key not in self._file_hashes:
+            self._file_hashes[memo_key] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self._file_hashes[memo_key]
+
+
+__all__ = ["ProblemCache"]
@@ -1,8 +1,12 @@
+import copy
 from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
 
+from unified_planning.environment import Environment
 from unified_planning.io import PDDLReader
+from unified_planning.io.utils import parse_string
 from unified_planning.model.htn import HierarchicalProblem
 from unified_planning.model.scheduling import SchedulingProblem
 from unified_planning.model.types import _IntType
@@ -24,6 +28,7 @@ from unified_planning.shortcuts import (
     Plus,
     Problem,
     StartTiming,
+    TimepointKind,
     UserType,
 )
 
@@ -69,6 +74,10 @@ def reduce_problem(problem: Problem, number: int) -> Problem:
 def reduce_version(problem: ProblemInstance, version: str, number: int) -> Problem:
     """Reduces the number of goals of the given problem.
 
+    The reduced version shares everything but its goals with the given version, like
+    the ones built by `reduce_problems`, so the versions of a problem reduced from the
+    same base do not clone it.
+
     Args:
         problem (ProblemInstance): The problem to reduce.
         version (str): The version of the problem to reduce.
@@ -80,7 +89,51 @@ def reduce_version(problem: ProblemInstance, version: str, number: int) -> Probl
     base = problem.versions[version].value
     if base is None:
         return None
-    return reduce_problem(base, number)
+    return reduce_problems(base, [number])[number]
+
+
+def reduce_problems(problem: Problem, numbers: Iterable[int]) -> Dict[int, Problem]:
+    """Reduces the number of goals of the given problem for several numbers at once.
+
+    The goals are flattened once and the reduced problems share everything but their
+    goals with the given one instead of cloning it. They must therefore be treated as
+    read-only, and the given problem must not be modified afterwards.
+    Use `reduce_problem` to get an independent problem.
+
+    Args:
+        problem (Problem): The problem to reduce.
+        numbers (Iterable[int]): The numbers of goals to keep.
+
+    Returns:
+        Dict[int, Problem]: The reduced problem versions by number of goals.
+    """
+    goals = get_goals(problem)
+    result = {}
+    for number in numbers:
+        reduced = copy.copy(problem)
+        reduced._goals = goals[:number]  # pylint: disable = protected-access
+        result[number] = reduced
+    return result
+
+
+def reduce_versions(
+    problem: ProblemInstance, version: str, numbers: Iterable[int]
+) -> Dict[int, Optional[Problem]]:
+    """Reduces the number of goals of the given problem for several numbers at once.
+
+    Args:
+        problem (ProblemInstance): The problem to reduce.
+        version (str): The version of the problem to reduce.
+        numbers (Iterable[int]): The numbers of goals to keep.
+
+    Returns:
+        Dict[int, Optional[Problem]]: The reduced problem versions by number of goals.
+            `None` for all of them if the version cannot be built.
+    """
+    base = problem.versions[version].value
+    if base is None:
+        return {number: None for number in numbers}
+    return reduce_problems(base, numbers)
 
 
 def remove_user_typing(problem: Problem) -> Problem:
@@ -94,34 +147,54 @@ def remove_user_typing(problem: Problem) -> Problem:
         Problem: The problem without user typing.
     """
 
-    def convert_fnode(fn: FNode):
+    def convert_node(fn: FNode, args: list):
         # pylint: disable = too-many-return-statements
         if fn.is_bool_constant() or fn.is_int_constant() or fn.is_real_constant():
             return fn
         if fn.is_fluent_exp():
-            nf = fluent_map[fn.fluent()]
-            na = [convert_fnode(a) for a in fn.args]
-            return nf(*na)
+            return em.FluentExp(fluent_map[fn.fluent()], args)
         if fn.is_object_exp():
-            return new_pb.object(fn.object().name)
+            return em.ObjectExp(new_pb.object(fn.object().name))
         if fn.is_parameter_exp():
-            return Parameter(fn.parameter().name, obj_tpe, env)
+            return em.ParameterExp(Parameter(fn.parameter().name, obj_tpe, env))
         if fn.is_not():
-            return Not(convert_fnode(fn.args[0]))
+            return Not(args[0])
         if fn.is_equals():
-            return Equals(convert_fnode(fn.args[0]), convert_fnode(fn.args[1]))
+            return Equals(args[0], args[1])
         if fn.is_le():
-            return LE(convert_fnode(fn.args[0]), convert_fnode(fn.args[1]))
+            return LE(args[0], args[1])
         if fn.is_lt():
-            return LT(convert_fnode(fn.args[0]), convert_fnode(fn.args[1]))
+            return LT(args[0], args[1])
         if fn.is_plus():
-            return Plus(*[convert_fnode(a) for a in fn.args])
+            return Plus(*args)
         if fn.is_minus():
-            assert len(fn.args) == 2  # nosec: B101
-            return Minus(convert_fnode(fn.args[0]), convert_fnode(fn.args[1]))
+            assert len(args) == 2  # nosec: B101
+            return Minus(args[0], args[1])
         raise NotImplementedError(f"Unsupported fluent node: {fn}")
 
+    def convert_fnode(root: FNode):
+        # The expressions are shared by the environment, so each one is converted once.
+        # The tree is walked with an explicit stack to support deep expressions.
+        if root in converted:
+            return converted[root]
+        stack = [root]
+        while stack:
+            fn = stack[-1]
+            if fn in converted:
+                stack.pop()
+                continue
+            pending = [a for a in fn.args if a not in converted]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            converted[fn] = convert_node(fn, [converted[a] for a in fn.args])
+        return converted[root]
+
+    converted: Dict[FNode, FNode] = {}
+
     env = problem.environment
+    em = env.expression_manager
     tm = env.type_manager
     new_pb = Problem(problem.name, env)
 
@@ -254,6 +327,62 @@ def remove_user_typing(problem: Problem) -> Problem:
     return new_pb
 
 
+@lru_cache(maxsize=32)
+def _get_hier_template(
+    hier_dom_file: Path,
+    mtime: int,  # pylint: disable = unused-argument
+    environment: Environment,
+) -> Tuple[PDDLReader, Any, str]:
+    """Parses the syntax of the hierarchical domain described by the given file.
+
+    The result is cached, the modification time of the file being part of the key so
+    that an edited domain is parsed again. The domain is built from the cached syntax
+    by `_build_hier_domain` on each call, as the parsing dominates its cost.
+
+    Args:
+        hier_dom_file (Path): The file describing the hierarchical domain.
+        mtime (int): The modification time of the file in nanoseconds.
+        environment (Environment): The environment of the parsed domain.
+
+    Returns:
+        Tuple[PDDLReader, Any, str]: The reader of the environment, the parsed syntax
+            of the domain and its normalized content.
+    """
+    reader = PDDLReader(environment=environment)
+    content = hier_dom_file.read_text(encoding="utf-8-sig").replace("\t", " ").lower()
+    # pylint: disable = protected-access
+    return reader, parse_string(reader._pp_domain, content, parse_all=True), content
+
+
+def _build_hier_domain(
+    hier_dom_file: Path, environment: Environment
+) -> HierarchicalProblem:
+    """Builds the hierarchical domain described by the given file.
+
+    The domain is built from its cached syntax exactly like the reader builds a parsed
+    file, so its subtasks get fresh identifiers on each call.
+
+    Args:
+        hier_dom_file (Path): The file describing the hierarchical domain.
+        environment (Environment): The environment of the built domain.
+
+    Raises:
+        ValueError: When the given file describes a non hierarchical domain.
+
+    Returns:
+        HierarchicalProblem: The built hierarchical domain.
+    """
+    hier_dom_file = Path(hier_dom_file).resolve()
+    reader, syntax, content = _get_hier_template(
+        hier_dom_file, hier_dom_file.stat().st_mtime_ns, environment
+    )
+    # pylint: disable = protected-access
+    hier_pb = reader._parse_problem(syntax, content, None, None)
+    if not isinstance(hier_pb, HierarchicalProblem):
+        raise ValueError(f"{hier_dom_file} does not defined a hierarchical problem")
+    return hier_pb
+
+
 def goals_to_tasks(
     base_pb: Problem,
     hier_dom_file: Path,
@@ -276,10 +405,8 @@ def goals_to_tasks(
         HierarchicalProblem: The generated hierarchical problem.
     """
 
-    # Create the hierarchical domain.
-    hier_pb = PDDLReader(environment=base_pb.environment).parse_problem(hier_dom_file)
-    if not isinstance(hier_pb, HierarchicalProblem):
-        raise ValueError(f"{hier_dom_file} does not defined a hierarchical problem")
+    # Create the hierarchical domain from its cached syntax.
+    hier_pb = _build_hier_domain(hier_dom_file, base_pb.environment)
 
     # Get the fluents and the tasks from their names.
     trans = {k: hier_pb.get_task(v) for k, v in mapping.items()}
@@ -309,12 +436,55 @@ def goals_to_tasks(
     return hier_pb
 
 
+class _NameIndexedProblem(Problem):  # pylint: disable = too-many-ancestors
+    """
+    A problem looking up the names of its fluents and actions in sets.
+
+    Unified planning checks that the name of each added element is free by scanning all
+    the elements of the problem, which is quadratic for large scheduling problems.
+    The elements are still added through the public methods, which check their types
+    and register their user types. The built problem is then cloned into a `Problem`.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self._fluent_names: Set[str] = set()
+        self._action_names: Set[str] = set()
+        super().__init__(name)
+
+    def has_fluent(self, name: str) -> bool:
+        return name in self._fluent_names
+
+    def has_action(self, name: str) -> bool:
+        return name in self._action_names
+
+    def add_fluent(  # type: ignore
+        self,
+        fluent_or_name: Union[Fluent, str],
+        typename=None,
+        *,
+        default_initial_value=None,
+        **kwargs,
+    ) -> Fluent:
+        fluent = super().add_fluent(
+            fluent_or_name,
+            typename,
+            default_initial_value=default_initial_value,
+            **kwargs,
+        )
+        self._fluent_names.add(fluent.name)
+        return fluent
+
+    def add_action(self, action) -> None:
+        super().add_action(action)
+        self._action_names.add(action.name)
+
+
 # pylint: disable = too-many-locals, too-many-branches
 def scheduling_to_actions(schd_pb: SchedulingProblem) -> Problem:
     """Converts the scheduling problem to a PDDL problem."""
 
     # Create problem with same name
-    pddl_pb = Problem(schd_pb.name)
+    pddl_pb = _NameIndexedProblem(schd_pb.name)
 
     # Copy the fluents
     for fluent in schd_pb.fluents:
@@ -326,6 +496,10 @@ def scheduling_to_actions(schd_pb: SchedulingProblem) -> Problem:
             if (ub := fluent.type.upper_bound) is not None:
                 pddl_pb.add_goal(LE(fluent, ub))
 
+    # The actions and the presence fluents of the activities by name of activity
+    actions: Dict[str, DurativeAction] = {}
+    presences: Dict[str, Fluent] = {}
+
     for activity in schd_pb.activities:
         # Convert each activity to a durative action
         action = DurativeAction(activity.name)
@@ -369,42 +543,44 @@ def scheduling_to_actions(schd_pb: SchedulingProblem) -> Problem:
                         action.add_condition(timing, LE(effect.fluent, ub))
 
         # Add a fluent to force the presence of the action (all activities must be present)
-        fluent = pddl_pb.add_fluent(f"{action.name}_pres", default_initial_value=False)
+        fluent = Fluent(f"{action.name}_pres")
         action.add_condition(StartTiming(), Not(fluent))
         action.add_effect(EndTiming(), fluent, True)
         pddl_pb.add_goal(fluent)
 
         # Save the generated action
-        pddl_pb.add_action(action)
+        actions[activity.name] = action
+        presences[activity.name] = fluent
+
+    for fluent in presences.values():
+        pddl_pb.add_fluent(fluent, default_initial_value=False)
+    pddl_pb.add_actions(actions.values())
 
     # Add constraints between the actions
     for constraint, _act in schd_pb.all_constraints():
-        # Only support `<=` constraints
+        # Only support `end(lhs) <= start(rhs)` constraints
         assert constraint.is_le()  # nosec: B101
+        assert all(arg.is_timing_exp() for arg in constraint.args)  # nosec: B101
+        lhs, rhs = (arg.timing().timepoint for arg in constraint.args)
+        assert lhs.kind == TimepointKind.END  # nosec: B101
+        assert rhs.kind == TimepointKind.START  # nosec: B101
 
-        # Get left and right arguments
-        # Suppose the format `end(t_0_0)` for the left and `start(t_0_0)` for the right
-        lhs, rhs = tuple(map(str, constraint.args))
-        lhs_moment, lhs_action_name = lhs[:-1].split("(")
-        rhs_moment, rhs_action_name = rhs[:-1].split("(")
-        assert lhs_moment == "end"  # nosec: B101
-        assert rhs_moment == "start"  # nosec: B101
-
-        # Get the fluent representing the precence of `lhs` and add it in the conditions of `rhs`
-        fluent = pddl_pb.fluent(f"{lhs_action_name}_pres")
-        pddl_pb.action(rhs_action_name).add_condition(StartTiming(), fluent)
+        # Add the fluent representing the presence of `lhs` in the conditions of `rhs`
+        actions[rhs.container].add_condition(StartTiming(), presences[lhs.container])
 
     # Add problem metrics
     for metric in schd_pb.quality_metrics:
         pddl_pb.add_quality_metric(metric)
 
-    # Return the generated problem
-    return pddl_pb
+    # Return the generated problem as a plain problem
+    return pddl_pb.clone()
 
 
 __all__ = [
     "get_goals",
+    "reduce_problems",
     "reduce_version",
+    "reduce_versions",
     "goals_to_tasks",
     "scheduling_to_actions",
 ]
@@ -0,0 +1,175 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from unified_planning.shortcuts import AbstractProblem
+
+from tyr.patterns.lazy import Lazy
+from tyr.patterns.singleton import Singleton
+
+# Approximate number of bytes used by an element (fluent, object, action, ...) of a problem.
+ELEMENT_SIZE = 1024
+
+# Collections of a problem which are counted to approximate its size.
+_SIZED_ATTRIBUTES = [
+    "fluents",
+    "actions",
+    "all_objects",
+    "goals",
+    "initial_values",
+    "timed_effects",
+    "timed_goals",
+    "methods",
+    "tasks",
+    "base_constraints",
+    "activities",
+]
+
+
+def estimate_size(problem: AbstractProblem) -> int:
+    """Approximates the memory used by the given problem.
+
+    The elements of its main collections are counted, each one accounting for
+    `ELEMENT_SIZE` bytes.
+
+    Args:
+        problem (AbstractProblem): The problem to measure.
+
+    Returns:
+        int: The approximate size of the problem in bytes.
+    """
+    num_elements = 1
+    for attribute in _SIZED_ATTRIBUTES:
+        try:
+            num_elements += len(getattr(problem, attribute))
+        except Exception:  # pylint: disable=broad-exception-caught
+            continue
+    return num_elements * ELEMENT_SIZE
+
+
+class VersionEvictor(Singleton):
+    """
+    Bounds the memory used by the built versions of the problems.
+
+    The built versions are tracked in least recently used order with their approximate
+    size. When the total size exceeds the budget, the least recently used versions are
+    reset and are built again on their next access. No version is tracked without budget.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._budget: Optional[int] = None
+        self._used = 0
+        self._versions: "OrderedDict[int, Tuple[Lazy, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def budget(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The number of bytes the built versions can use.
+                `None` if they are never evicted.
+        """
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: Optional[int]) -> None:
+        """Sets the budget and evicts the versions exceeding it.
+
+        Args:
+            budget (Optional[int]): The new budget in bytes. `None` to disable eviction.
+
+        Raises:
+            ValueError: When the budget is not positive.
+        """
+        if budget is not None and budget <= 0:
+            raise ValueError(f"The budget must be positive, got {budget}.")
+        with self._lock:
+            self._budget = budget
+            if budget is None:
+                self._versions.clear()
+                self._used = 0
+            evicted = self._evict()
+        self._reset(evicted)
+
+    @property
+    def used(self) -> int:
+        """
+        Returns:
+            int: The approximate number of bytes used by the tracked versions.
+        """
+        return self._used
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def touch(self, lazy: Lazy, size: Callable[[], int]) -> None:
+        """Marks the given built version as the most recently used one.
+
+        Args:
+            lazy (Lazy): The lazy value holding the version.
+            size (Callable[[], int]): Computes the size of the version when first seen.
+        """
+        if self._budget is None:
+            return
+        key = id(lazy)
+        with self._lock:
+            if key in self._versions:
+                self._versions.move_to_end(key)
+                return
+        # The size is computed outside of the lock as it may access other versions.
+        version_size = size()
+        with self._lock:
+            if key in self._versions:
+                self._versions.move_to_end(key)
+                return
+            self._versions[key] = (lazy, version_size)
+            self._used += version_size
+            evicted = self._evict()
+        self._reset(evicted)
+
+    def clear(self) -> None:
+        """Evicts all the tracked versions."""
+        with self._lock:
+            evicted = [lazy for lazy, _ in self._versions.values()]
+            self._versions.clear()
+            self._used = 0
+        self._reset(evicted)
+
+    def _evict(self) -> List[Lazy]:
+        # The most recently used version is always kept, even if it exceeds the budget.
+        evicted = []
+        while (
+            self._budget is not None
+            and self._used > self._budget
+            and len(self._versions) > 1
+        ):
+            _, (lazy, size) = self._versions.popitem(last=False)
+            evicted.append(lazy)
+            self._used -= size
+        return evicted
+
+    @staticmethod
+    def _reset(evicted: List[Lazy]) -> None:
+        # Reset outside of the lock, a version being built holds its own lock and may
+        # need this one to access the versions it is built from.
+        for lazy in evicted:
+            lazy.reset()
+
+
+class EvictableLazy(Lazy[AbstractProblem]):
+    """A lazy problem version whose value can be evicted by the `VersionEvictor`."""
+
+    @property
+    def value(self) -> AbstractProblem:
+        """
+        Returns:
+            AbstractProblem: The version, built again if it has been evicted.
+        """
+        value = super().value
+        if value is not None:
+            VersionEvictor().touch(self, lambda: estimate_size(value))
+        return value
+
+
+__all__ = ["ELEMENT_SIZE", "EvictableLazy", "VersionEvictor", "estimate_size"]
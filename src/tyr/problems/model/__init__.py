@@ -1,5 +1,5 @@
 from . import domain, instance
-from .domain import AbstractDomain, FolderAbstractDomain
+from .domain import AbstractDomain, FolderAbstractDomain, FolderIndex
 from .instance import ProblemInstance
 
-__all__ = ["AbstractDomain", "FolderAbstractDomain", "ProblemInstance"]
+__all__ = ["AbstractDomain", "FolderAbstractDomain", "FolderIndex", "ProblemInstance"]
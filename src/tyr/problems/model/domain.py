@@ -1,15 +1,91 @@
 import functools
+import inspect
+import os
 import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from unified_planning.io import PDDLReader
 from unified_planning.plans import Plan
 from unified_planning.shortcuts import AbstractProblem
 
-from tyr.patterns import Abstract, AbstractSingletonMeta, Lazy, Singleton
+from tyr.patterns import Abstract, AbstractSingletonMeta, Singleton
+from tyr.problems.cache import ProblemCache
+from tyr.problems.eviction import EvictableLazy
 from tyr.problems.model.instance import ProblemInstance
 
+# Listings of the folders used to load problems, with the modification time they match.
+_folder_listings: Dict[Path, Tuple[int, List[Path]]] = {}
+
+
+def _list_folder(folder_path: Path) -> List[Path]:
+    """Lists the given folder, the listing is kept while the folder is not modified.
+
+    Args:
+        folder_path (Path): The folder to list.
+
+    Returns:
+        List[Path]: The entries of the folder, in the order of `Path.iterdir`.
+    """
+    mtime = folder_path.stat().st_mtime_ns
+    listing = _folder_listings.get(folder_path)
+    if listing is None or listing[0] != mtime:
+        listing = (mtime, list(folder_path.iterdir()))
+        _folder_listings[folder_path] = listing
+    return listing[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_module_files(module_name: str) -> Tuple[Path, ...]:
+    """Lists the source files of the given module and of the modules it imports.
+
+    The imports are followed transitively inside tyr and inside the top level package
+    of the given module, the other libraries are not listed.
+
+    Args:
+        module_name (str): The name of an imported module.
+
+    Returns:
+        Tuple[Path, ...]: The source files of the module and of its dependencies.
+    """
+    packages = {"tyr", module_name.split(".")[0]}
+    files: List[Path] = []
+    pending = [module_name]
+    seen: Set[str] = set()
+    while pending:
+        name = pending.pop()
+        module = sys.modules.get(name)
+        if name in seen or getattr(module, "__file__", None) is None:
+            continue
+        seen.add(name)
+        files.append(Path(module.__file__))  # type: ignore
+        for value in vars(module).values():
+            dependency = getattr(
+                value, "__name__" if inspect.ismodule(value) else "__module__", None
+            )
+            if isinstance(dependency, str) and dependency.split(".")[0] in packages:
+                pending.append(dependency)
+    return tuple(sorted(files))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_data_files(folder_path: Path) -> Tuple[Path, ...]:
+    """Lists the files of the given folder which are not Python sources.
+
+    Args:
+        folder_path (Path): The folder to list.
+
+    Returns:
+        Tuple[Path, ...]: The data files of the folder.
+    """
+    return tuple(
+        file
+        for file in _list_folder(folder_path)
+        if file.suffix not in [".py", ".pyc"] and file.is_file()
+    )
+
 
 class AbstractDomain(Abstract, Singleton, metaclass=AbstractSingletonMeta):
     """
@@ -76,10 +152,88 @@ class AbstractDomain(Abstract, Singleton, metaclass=AbstractSingletonMeta):
         problem = ProblemInstance(self, problem_id)
         for factory in problem_factories:
             version_name = factory.__name__[factory.__name__.find("problem_") + 8 :]
-            problem.add_version(version_name, Lazy(functools.partial(factory, problem)))
+            problem.add_version(
+                version_name,
+                EvictableLazy(
+                    functools.partial(
+                        self.build_version, factory, problem, version_name
+                    )
+                ),
+            )
 
         return problem
 
+    def build_version(
+        self,
+        factory: Callable[[ProblemInstance], Optional[AbstractProblem]],
+        problem: ProblemInstance,
+        version_name: str,
+    ) -> Optional[AbstractProblem]:
+        """Builds a version of the problem, loads it from the problem cache when present.
+
+        The built version is not saved, the cache is filled by warming it beforehand.
+        The cache is not read when it is disabled.
+
+        Args:
+            factory (Callable[[ProblemInstance], Optional[AbstractProblem]]): The builder
+                of the version.
+            problem (ProblemInstance): The problem owning the version.
+            version_name (str): The name of the version.
+
+        Returns:
+            Optional[AbstractProblem]: The built version.
+        """
+        if ProblemCache().enabled:
+            key = ProblemCache().get_version_key(problem, version_name)
+            if key is not None and (version := ProblemCache().load(key)) is not None:
+                return version
+        return factory(problem)
+
+    def get_source_files(self, problem_id: int) -> List[Path]:
+        """Lists the files the versions of the given problem are built from.
+
+        They are the modules the domain is defined with, including the helper modules
+        it imports, and the data files read by its builders. They identify the versions
+        in the problem cache, a change in one of them invalidates the cached versions.
+
+        Args:
+            problem_id (int): The id of the problem.
+
+        Returns:
+            List[Path]: The source files, empty if they are unknown.
+        """
+        module_files = _get_module_files(self.__class__.__module__)
+        if len(module_files) == 0:
+            return []
+        return list(dict.fromkeys([*module_files, *self.get_data_files(problem_id)]))
+
+    # pylint: disable = unused-argument
+    def get_data_files(self, problem_id: int) -> List[Path]:
+        """Lists the data files read by the builders of the given problem's versions.
+
+        By default, they are the files next to the module of the domain which are not
+        Python sources, like the hierarchical domains given to `goals_to_tasks`. Domains
+        reading files elsewhere must list them by overriding this method.
+
+        Args:
+            problem_id (int): The id of the problem.
+
+        Returns:
+            List[Path]: The data files.
+        """
+        try:
+            module_folder = Path(inspect.getfile(self.__class__)).parent
+        except TypeError:
+            return []
+        return list(_get_data_files(module_folder))
+
+    def refresh(self) -> None:
+        """Takes into account the changes in the files of the domain.
+
+        It is called once per collection of the problems, the domains which index their
+        files check them here. Does nothing by default.
+        """
+
     def get_problem(self, problem_id: int) -> Optional[ProblemInstance]:
         """Builds the problem with the given id.
 
@@ -165,7 +319,7 @@ class AbstractDomain(Abstract, Singleton, metaclass=AbstractSingletonMeta):
         folder_path = folder_path.resolve()
 
         domain_file, problem_file = None, None
-        for file in folder_path.iterdir():
+        for file in _list_folder(folder_path):
             if file.name.startswith("domain"):
                 domain_file = file
             if file.name.startswith(f"instance-{problem_id}"):
@@ -184,6 +338,9 @@ class AbstractDomain(Abstract, Singleton, metaclass=AbstractSingletonMeta):
         """
         Builds a unified planning problem based on the given files.
 
+        The parsed problem is stored in the persistent problem cache and loaded from it
+        while the files are unchanged.
+
         Args:
             problem_file (Path): The path of the problem file.
             domain_file (Path): The path of the domain file.
@@ -192,9 +349,13 @@ class AbstractDomain(Abstract, Singleton, metaclass=AbstractSingletonMeta):
             Optional[AbstractProblem]: The optional problem. `None` if no files found.
         """
         if domain_file.exists() and problem_file.exists():
-            return PDDLReader().parse_problem(
-                domain_file.as_posix(),
-                problem_file.as_posix(),
+            return ProblemCache().get_or_parse(
+                problem_file,
+                domain_file,
+                lambda: PDDLReader().parse_problem(
+                    domain_file.as_posix(),
+                    problem_file.as_posix(),
+                ),
             )
         return None
 
@@ -210,6 +371,18 @@ class AbstractDomain(Abstract, Singleton, metaclass=AbstractSingletonMeta):
             self.problems[problem.uid] = problem
 
 
+@dataclass(frozen=True)
+class FolderIndex:
+    """The files of a folder domain, found by a single scan of its directories."""
+
+    mtimes: Tuple[int, ...]
+    suffix: str = ""
+    domain: Optional[Path] = None
+    instances: Dict[int, Path] = field(default_factory=dict)
+    domains: Dict[int, Path] = field(default_factory=dict)
+    files: List[Path] = field(default_factory=list)
+
+
 class FolderAbstractDomain(AbstractDomain):
     """
     Represents the base class for all domains created from a structured folder.
@@ -221,18 +394,40 @@ class FolderAbstractDomain(AbstractDomain):
     or `domain.hddl`.
     In some cases, a proper domain is provided for each instance, in which case the domain
     descriptions are stored in a `domains` subdirectory.
+
+    The directories are scanned once into an index. The index is checked against the
+    modification times of the directories when the domain is refreshed, which is done once
+    per collection of the problems, and the accesses to the files never touch the disk.
     """
 
     folder: Path
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._index: Optional[FolderIndex] = None
+
+    @property
+    def index(self) -> FolderIndex:
+        """
+        Returns:
+            FolderIndex: The index of the files of the domain, scanned on the first access.
+        """
+        if self._index is None:
+            self._index = self._scan(self._get_mtimes())
+        return self._index
+
+    def refresh(self) -> None:
+        """Scans the directories again if one of them has been modified since the last scan."""
+        if self._index is not None and self._index.mtimes != self._get_mtimes():
+            self._index = None
+
     @property
     def suffix(self) -> str:
         """
         Returns:
             str: The suffix of the domain and instances.
         """
-        instance = next(self.instances_folder.iterdir())
-        return instance.suffix
+        return self.index.suffix
 
     @property
     def instances_folder(self) -> Path:
@@ -242,25 +437,101 @@ class FolderAbstractDomain(AbstractDomain):
         """
         return self.folder / "instances"
 
+    @property
+    def domains_folder(self) -> Path:
+        """
+        Returns:
+            Path: The path of the folder of the domains specific to each instance.
+        """
+        return self.folder / "domains"
+
+    def get_instance_path(self, problem_id: int) -> Path:
+        """
+        Returns the path of the instance file for the given problem id.
+        """
+        index = self.index
+        if problem_id in index.instances:
+            return index.instances[problem_id]
+        return self.instances_folder / f"instance-{problem_id}{index.suffix}"
+
     def get_domain_path(self, problem_id: int) -> Path:
         """
         Returns the path of the domain file for the given problem id.
         """
-        if (self.folder / f"domain{self.suffix}").exists():
-            return self.folder / f"domain{self.suffix}"
-        return self.folder / "domains" / f"domain-{problem_id}{self.suffix}"
+        index = self.index
+        if index.domain is not None:
+            return index.domain
+        if problem_id in index.domains:
+            return index.domains[problem_id]
+        return self.domains_folder / f"domain-{problem_id}{index.suffix}"
 
     def get_num_problems(self) -> int:
-        return len(list(self.instances_folder.iterdir()))
+        return len(self.index.instances)
+
+    def get_data_files(self, problem_id: int) -> List[Path]:
+        """Lists the files of the folder, the instance file and the domain file.
+
+        The files at the root of the folder include the auxiliary files read by the
+        builders, like the hierarchical domains given to `goals_to_tasks`.
+        """
+        return super().get_data_files(problem_id) + [
+            *self.index.files,
+            self.get_instance_path(problem_id),
+            self.get_domain_path(problem_id),
+        ]
 
     def build_problem_base(self, problem: ProblemInstance) -> Optional[AbstractProblem]:
         """
         Builds the base problem for the given instance.
         """
         return self.load_from_files(
-            self.instances_folder / f"instance-{problem.uid}{self.suffix}",
+            self.get_instance_path(problem.uid),
             self.get_domain_path(problem.uid),
         )
 
+    # =================================== Index ================================== #
+
+    def _get_mtimes(self) -> Tuple[int, ...]:
+        mtimes = []
+        for folder in [self.folder, self.instances_folder, self.domains_folder]:
+            try:
+                mtimes.append(os.stat(folder).st_mtime_ns)
+            except OSError:
+                mtimes.append(-1)
+        return tuple(mtimes)
+
+    def _scan(self, mtimes: Tuple[int, ...]) -> FolderIndex:
+        instances: Dict[int, Path] = {}
+        suffix = ""
+        for entry in self._scan_folder(self.instances_folder):
+            stem, extension = os.path.splitext(entry.name)
+            uid = stem[len("instance-") :]
+            if stem.startswith("instance-") and uid.isdigit():
+                instances[int(uid)] = Path(entry.path)
+                suffix = suffix or extension
+
+        domain, domains, files = None, {}, []
+        for entry in self._scan_folder(self.folder):
+            if entry.name == f"domain{suffix}":
+                domain = Path(entry.path)
+            if entry.is_file():
+                files.append(Path(entry.path))
+        if domain is None:
+            for entry in self._scan_folder(self.domains_folder):
+                stem = os.path.splitext(entry.name)[0]
+                uid = stem[len("domain-") :]
+                if stem.startswith("domain-") and uid.isdigit():
+                    domains[int(uid)] = Path(entry.path)
+
+        return FolderIndex(mtimes, suffix, domain, instances, domains, files)
+
+    @staticmethod
+    def _scan_folder(folder: Path) -> List[os.DirEntry]:
+        try:
+            with os.scandir(folder) as entries:
+                return sorted(entries, key=lambda e: e.name)
+        except OSError:
+            return []
+
 
-__all__ = ["AbstractDomain", "FolderAbstractDomain"]
+__all__ = ["AbstractDomain", "FolderAbstractDomain", "FolderIndex"]
@@ -87,6 +87,8 @@ class ProblemInstance:
             Optional[float]: The quality of the plan if any.
         """
         version = self.versions[version_name].value
+        if version is None:
+            return None
 
         if (num_metrics := len(version.quality_metrics)) == 0:
             return self._get_makespan_of_plan(plan, version)
@@ -1,8 +1,11 @@
 from importlib import import_module
 from pkgutil import walk_packages
-from typing import List
+from typing import Dict, List, Optional
 
 from tyr.problems.model.domain import AbstractDomain
+from tyr.problems.model.instance import ProblemInstance
+
+_domains_cache: Dict[str, AbstractDomain] = {}
 
 
 def get_all_domains() -> List[AbstractDomain]:
@@ -29,4 +32,38 @@ def get_all_domains() -> List[AbstractDomain]:
     return list(set(domains))  # Remove duplicates, note that domains are singleton
 
 
-__all__ = ["get_all_domains"]
+def get_domain(name: str) -> Optional[AbstractDomain]:
+    """Retrieves a domain by its name.
+
+    The domains are indexed by name on the first call and the index is kept for the
+    next ones, so that repeated lookups in a worker do not scan the modules again.
+
+    Args:
+        name (str): The name of the domain.
+
+    Returns:
+        Optional[AbstractDomain]: The domain, `None` if it doesn't exist.
+    """
+    if name not in _domains_cache:
+        _domains_cache.update({d.name: d for d in get_all_domains()})
+    return _domains_cache.get(name, None)
+
+
+def get_problem(name: str) -> Optional[ProblemInstance]:
+    """Retrieves a problem by its name, formatted as `DOMAIN:UID`.
+
+    The problem is served by the cache of its domain, built on the first call.
+
+    Args:
+        name (str): The name of the problem.
+
+    Returns:
+        Optional[ProblemInstance]: The problem, `None` if it doesn't exist.
+    """
+    domain_name, _, uid = name.rpartition(":")
+    if not uid.isdigit() or (domain := get_domain(domain_name)) is None:
+        return None
+    return domain.get_problem(int(uid))
+
+
+__all__ = ["get_all_domains", "get_domain", "get_problem"]
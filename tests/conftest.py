@@ -0,0 +1,15 @@
+from pathlib import Path
+
+import pytest
+
+from tyr.core.paths import TyrPaths
+from tyr.problems.cache import ProblemCache
+
+
+@pytest.fixture(autouse=True)
+def cache_folder(tmp_path: Path):
+    previous = TyrPaths().cache
+    TyrPaths().cache = tmp_path / "cache"
+    yield TyrPaths().cache
+    TyrPaths().cache = previous
+    ProblemCache().enabled = False
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tyr.cli.analysis_cache import AnalysisCache
+from tyr.core.paths import TyrPaths
+
+
+class TestAnalysisCache:
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def cache_folder(tmp_path: Path):
+        previous = TyrPaths().cache
+        TyrPaths().cache = tmp_path
+        yield tmp_path / "analyses"
+        TyrPaths().cache = previous
+        AnalysisCache().enabled = True
+
+    def test_singleton(self):
+        assert AnalysisCache() is AnalysisCache()
+
+    def test_folder(self, cache_folder: Path):
+        assert AnalysisCache().folder == cache_folder
+
+    # ==================================== Key =================================== #
+
+    def test_key_is_stable(self):
+        key = AnalysisCache().get_key("results", ("db", 3, 5), ["a", "b"])
+        assert key == AnalysisCache().get_key("results", ("db", 3, 5), ["a", "b"])
+
+    def test_key_depends_on_parts(self):
+        key = AnalysisCache().get_key("results", ("db", 3, 5), ["a", "b"])
+        assert key != AnalysisCache().get_key("results", ("db", 4, 6), ["a", "b"])
+        assert key != AnalysisCache().get_key("results", ("db", 3, 5), ["a"])
+        assert key != AnalysisCache().get_key("metrics", ("db", 3, 5), ["a", "b"])
+
+    # ================================== Access ================================== #
+
+    def test_load_absent(self):
+        assert AnalysisCache().load("absent") is None
+
+    def test_load_corrupted(self, cache_folder: Path):
+        cache_folder.mkdir(parents=True)
+        AnalysisCache().get_path("corrupted").write_bytes(b"not an analysis")
+        assert AnalysisCache().load("corrupted") is None
+
+    def test_save_and_load(self):
+        value = (["a", "b"], {"coverage": np.array([50.0, 100.0])})
+        assert AnalysisCache().save("key", value)
+        assert AnalysisCache().get_path("key").exists()
+        loaded = AnalysisCache().load("key")
+        assert loaded[0] == ["a", "b"]
+        assert loaded[1]["coverage"].tolist() == [50.0, 100.0]
+
+    def test_disabled(self):
+        AnalysisCache().save("key", 1)
+        AnalysisCache().enabled = False
+        assert AnalysisCache().load("key") is None
+        assert not AnalysisCache().save("other", 2)
+        assert not AnalysisCache().get_path("other").exists()
+
+    # ================================ Management ================================ #
+
+    def test_clear(self, cache_folder: Path):
+        AnalysisCache().save("first", 1)
+        AnalysisCache().save("second", 2)
+        (cache_folder / "other.txt").write_text("kept")
+        assert AnalysisCache().clear() == 2
+        assert AnalysisCache().load("first") is None
+        assert (cache_folder / "other.txt").exists()
+
+    def test_clear_absent(self):
+        assert AnalysisCache().clear() == 0
@@ -7,12 +7,14 @@ from tyr import (
     AbstractDomain,
     Metric,
     Planner,
+    PlannerConfig,
     Plotter,
     Singleton,
     collect_metrics,
     collect_planners,
     collect_plotters,
     collect_problems,
+    collect_virtual_planners,
 )
 
 
@@ -175,6 +177,30 @@ class TestCollectors:
         assert set(result.deselected) == set(deselected)
         assert len(set(result.skipped)) == 0
 
+    @patch("tyr.planners.scanner.get_all_planner_configs")
+    def test_collect_planners_portfolio_name(self, mocked_configs: Mock):
+        mocked_configs.return_value = [
+            PlannerConfig(name="a"),
+            PlannerConfig(name="b"),
+            PlannerConfig(name="race", portfolio=["a", "b"]),
+            PlannerConfig(name="solo", portfolio=["a"]),
+        ]
+        for name in ["race@a,b", "solo@a"]:
+            # The slurm scripts select a planner by its name followed by `$`.
+            result = collect_planners(f"{name}$")
+            assert [p.name for p in result.selected] == [name]
+
+    def test_collect_virtual_planners(self, all_planners: List[Planner]):
+        best, worst = collect_virtual_planners(all_planners, ".*[4-5]", ".*8")
+        members = [p for p in all_planners if int(p.name[-1]) in [4, 5, 8]]
+        assert (best.name, worst.name) == ("vbs", "vws")
+        assert best.members == worst.members == tuple(members)
+
+    def test_collect_virtual_planners_without_filters(
+        self, all_planners: List[Planner]
+    ):
+        assert collect_virtual_planners(all_planners) == []
+
     # ================================= Plotters ================================= #
 
     @patch("tyr.plotters.scanner.get_all_plotters")
@@ -243,6 +269,14 @@ class TestCollectors:
         assert len(set(result.deselected)) == 0
         assert len(set(result.skipped)) == 0
 
+    @patch("tyr.problems.scanner.get_all_domains")
+    def test_collect_problems_refreshes_domains(self, mocked_get_all_domain: Mock):
+        domain = MagicMock()
+        domain.get_num_problems.return_value = 0
+        mocked_get_all_domain.return_value = [domain]
+        collect_problems()
+        domain.refresh.assert_called_once_with()
+
     @patch("tyr.problems.scanner.get_all_domains")
     def test_collect_problems_one_filter_domain(
         self,
@@ -262,7 +296,7 @@ class TestCollectors:
 
         result = collect_problems(filter1)
         assert set(result.selected) == set(selected)
-        assert set(result.deselected) == set(deselected)
+        assert set(result.deselected) == {p.name for p in deselected}
         assert len(set(result.skipped)) == 0
 
     @patch("tyr.problems.scanner.get_all_domains")
@@ -285,7 +319,7 @@ class TestCollectors:
 
         result = collect_problems(filter1, filter2)
         assert set(result.selected) == set(selected)
-        assert set(result.deselected) == set(deselected)
+        assert set(result.deselected) == {p.name for p in deselected}
         assert len(set(result.skipped)) == 0
 
     @patch("tyr.problems.scanner.get_all_domains")
@@ -307,7 +341,7 @@ class TestCollectors:
 
         result = collect_problems(filter1)
         assert set(result.selected) == set(selected)
-        assert set(result.deselected) == set(deselected)
+        assert set(result.deselected) == {p.name for p in deselected}
         assert len(set(result.skipped)) == 0
 
     @patch("tyr.problems.scanner.get_all_domains")
@@ -330,7 +364,7 @@ class TestCollectors:
 
         result = collect_problems(filter1, filter2)
         assert set(result.selected) == set(selected)
-        assert set(result.deselected) == set(deselected)
+        assert set(result.deselected) == {p.name for p in deselected}
         assert len(set(result.skipped)) == 0
 
     @patch("tyr.problems.scanner.get_all_domains")
@@ -353,3 +387,22 @@ class TestCollectors:
         assert len(set(result.selected)) == 0
         assert len(set(result.deselected)) == 0
         assert set(result.skipped) == set(problems)
+
+    @patch("tyr.problems.scanner.get_all_domains")
+    def test_collect_problems_builds_selected_only(
+        self,
+        mocked_get_all_domain: Mock,
+        all_domains: List[AbstractDomain],
+    ):
+        for domain in all_domains:
+            domain.get_problem = MagicMock(side_effect=domain.get_problem)
+        mocked_get_all_domain.return_value = all_domains
+
+        result = collect_problems("domain-3:7$")
+        assert [p.name for p in result.selected] == ["domain-3:7"]
+        assert len(result.deselected) == 99
+        for domain in all_domains:
+            if domain.name == "domain-3":
+                domain.get_problem.assert_called_once_with(7)
+            else:
+                domain.get_problem.assert_not_called()
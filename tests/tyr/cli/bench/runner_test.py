@@ -0,0 +1,65 @@
+from queue import Queue
+from unittest.mock import MagicMock
+
+from tyr import PlannerResult, PlannerResultStatus, RunningMode, SolveConfig
+from tyr.cli.bench.runner import BenchEvent, _render_events
+from tyr.cli.bench.scheduler import MemoryBudget
+
+
+class TestBenchRunner:
+    @staticmethod
+    def solve_config():
+        return SolveConfig(2, 1024, 300, 10, False, False, False, False)
+
+    def test_event_round_trip(self):
+        planner = MagicMock()
+        planner.name = "planner"
+        problem = MagicMock()
+        result = PlannerResult(
+            "planner",
+            problem,
+            RunningMode.ANYTIME,
+            PlannerResultStatus.SOLVED,
+            self.solve_config(),
+            12.5,
+            42,
+            "",
+            True,
+        )
+        event = BenchEvent.from_planner(3, result)
+        assert event.job_id == 3
+        rebuilt = event.to_planner_result(
+            planner, problem, self.solve_config(), RunningMode.ANYTIME
+        )
+        assert rebuilt == result
+
+    def test_render_events(self):
+        tw = MagicMock()
+        jobs = []
+        for i in range(3):
+            planner = MagicMock()
+            planner.name = f"planner-{i}"
+            planner.get_solve_config.return_value = self.solve_config()
+            jobs.append((planner, MagicMock(), RunningMode.ONESHOT))
+
+        events: "Queue" = Queue()
+        for job_id in [2, 0, 1]:
+            events.put(
+                BenchEvent(job_id, PlannerResultStatus.TIMEOUT, 300, None, False, "")
+            )
+        events.put(None)
+        budget = MemoryBudget(4096)
+        for _ in range(3):
+            budget.acquire(1024)
+        _render_events(tw, events, jobs, self.solve_config(), budget)
+        assert budget.reserved == 0
+
+        calls = tw.report_planner_result.call_args_list
+        assert len(calls) == 3
+        for call, job_id in zip(calls, [2, 0, 1]):
+            planner, problem, _ = jobs[job_id]
+            domain, called_planner, result = call.args
+            assert domain is problem.domain
+            assert called_planner is planner
+            assert result.planner_name == planner.name
+            assert result.status == PlannerResultStatus.TIMEOUT
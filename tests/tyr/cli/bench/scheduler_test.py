@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+from tyr.cli.bench.scheduler import MemoryBudget
+
+
+class TestMemoryBudget:
+    @pytest.mark.parametrize("budget", [0, -1])
+    def test_invalid_budget(self, budget):
+        with pytest.raises(ValueError):
+            MemoryBudget(budget)
+
+    def test_no_budget(self):
+        budget = MemoryBudget()
+        for _ in range(10):
+            budget.acquire(1024)
+        assert budget.reserved == 10 * 1024
+
+    def test_acquire_release(self):
+        budget = MemoryBudget(10)
+        budget.acquire(4)
+        budget.acquire(6)
+        assert budget.reserved == 10
+        budget.release(4)
+        assert budget.reserved == 6
+
+    def test_large_job_admitted_alone(self):
+        budget = MemoryBudget(10)
+        budget.acquire(50)
+        assert budget.reserved == 50
+
+    def test_acquire_waits_for_release(self):
+        budget = MemoryBudget(10)
+        budget.acquire(8)
+        admitted = threading.Event()
+
+        def target():
+            budget.acquire(4)
+            admitted.set()
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        time.sleep(0.1)
+        assert not admitted.is_set()
+        budget.release(8)
+        assert admitted.wait(1)
+        assert budget.reserved == 4
+        thread.join(1)
+
+    def test_close_admits_waiting(self):
+        budget = MemoryBudget(10)
+        budget.acquire(8)
+        thread = threading.Thread(target=budget.acquire, args=(4,), daemon=True)
+        thread.start()
+        budget.close()
+        thread.join(1)
+        assert not thread.is_alive()
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock, patch
+
+from tyr import PlannerConfig, PortfolioPlanner
+from tyr.cli.cache.runner import _warm_version, get_needed_versions
+
+
+class TestCacheRunner:
+    @staticmethod
+    def planner(name: str, problems: dict) -> MagicMock:
+        planner = MagicMock()
+        planner.config = PlannerConfig(name, problems=problems)
+        return planner
+
+    @staticmethod
+    def problem(domain_name: str, uid: int) -> MagicMock:
+        problem = MagicMock()
+        problem.domain.name = domain_name
+        problem.name = f"{domain_name}:{uid}"
+        return problem
+
+    # =================================== Warm =================================== #
+
+    @patch("tyr.cli.cache.runner.ProblemCache")
+    @patch("tyr.cli.cache.runner.domain_scanner.get_problem")
+    def test_warm_version(self, get_problem_mock: MagicMock, cache_mock: MagicMock):
+        get_problem_mock.return_value.versions = {"base": MagicMock()}
+        cache = cache_mock.return_value
+        problem_name, version_name, success, duration = _warm_version(
+            "domain:1", "base"
+        )
+        get_problem_mock.assert_called_once_with("domain:1")
+        cache.get_version_key.assert_called_once_with(
+            get_problem_mock.return_value, "base"
+        )
+        assert (
+            cache.get_or_build.call_args.args[0] == cache.get_version_key.return_value
+        )
+        assert (problem_name, version_name, success) == ("domain:1", "base", True)
+        assert duration >= 0
+
+    @patch("tyr.cli.cache.runner.domain_scanner.get_problem", return_value=None)
+    def test_warm_absent_problem(self, _):
+        assert not _warm_version("domain:1", "base")[2]
+
+    @patch("tyr.cli.cache.runner.domain_scanner.get_problem")
+    def test_warm_absent_version(self, get_problem_mock: MagicMock):
+        get_problem_mock.return_value.versions = {"base": MagicMock()}
+        assert not _warm_version("domain:1", "other")[2]
+
+    @patch("tyr.cli.cache.runner.ProblemCache")
+    @patch("tyr.cli.cache.runner.domain_scanner.get_problem")
+    def test_warm_failing_version(self, get_problem_mock: MagicMock, cache_mock):
+        get_problem_mock.return_value.versions = {"base": MagicMock()}
+        cache_mock.return_value.get_or_build.side_effect = ValueError
+        assert not _warm_version("domain:1", "base")[2]
+
+    # ================================= Versions ================================= #
+
+    def test_get_needed_versions(self):
+        planners = [
+            self.planner("a", {}),
+            self.planner("b", {"domain": "other"}),
+        ]
+        problems = [self.problem("domain", 1), self.problem("second", 2)]
+        assert get_needed_versions(planners, problems) == [
+            ("domain:1", "base"),
+            ("domain:1", "other"),
+            ("second:2", "base"),
+        ]
+
+    def test_get_needed_versions_portfolio(self):
+        members = [self.planner("a", {"domain": "other"})]
+        portfolio = PortfolioPlanner(PlannerConfig("p", portfolio=["a"]), members)
+        problems = [self.problem("domain", 1)]
+        assert get_needed_versions([portfolio], problems) == [("domain:1", "other")]
@@ -0,0 +1,60 @@
+import io
+
+import numpy as np
+
+from tyr.cli.compare.terminal_writter import CompareTerminalWritter
+from tyr.metrics.pairwise import PairwiseComparison
+from tyr.planners.model.config import SolveConfig
+
+
+def comparison() -> PairwiseComparison:
+    # Three criteria, two domains, two planners.
+    wins = np.zeros((3, 2, 2, 2), dtype=np.int64)
+    ties = np.zeros((3, 2, 2, 2), dtype=np.int64)
+    wins[0, 0, 0, 1] = 3
+    wins[0, 1, 1, 0] = 1
+    ties[0, 0, 0, 1] = ties[0, 0, 1, 0] = 2
+    return PairwiseComparison(["aries", "lpg"], ["depot", "rovers"], wins, ties)
+
+
+def report(**kwargs) -> str:
+    out = io.StringIO()
+    config = SolveConfig(1, 1, 300, 0, False, False, False, False)
+    CompareTerminalWritter(config, out, **kwargs).report_comparison(comparison())
+    return out.getvalue()
+
+
+class TestCompareTerminalWritter:
+    def test_heat(self):
+        assert CompareTerminalWritter.heat(0, 0, 0) == 0
+        assert CompareTerminalWritter.heat(3, 1, 0) == 0.75
+        assert CompareTerminalWritter.heat(1, 0, 3) == -0.5
+
+    def test_terminal(self):
+        lines = report().splitlines()
+        start = lines.index("coverage (all domains): wins/ties/losses")
+        assert lines[start + 1].split("│")[1:] == ["   1   ", "   2   ", " total"]
+        assert lines[start + 2] == "1. aries │     - │ 3/2/1 │ 3/2/1"
+        assert lines[start + 3] == "2. lpg   │ 1/2/3 │     - │ 1/2/3"
+        assert "coverage (rovers): wins/ties/losses" not in lines
+
+    def test_per_domain(self):
+        lines = report(per_domain=True).splitlines()
+        start = lines.index("coverage (rovers): wins/ties/losses")
+        assert lines[start + 2] == "1. aries │     - │ 0/0/1 │ 0/0/1"
+        assert lines.index("coverage (depot): wins/ties/losses") < start
+        assert lines.index("coverage (all domains): wins/ties/losses") > start
+
+    def test_colored(self, monkeypatch):
+        monkeypatch.setenv("PY_COLORS", "1")
+        output = report(colored=True, per_domain=True)
+        assert "│ \x1b[32m3/2/1\x1b[0m │" in output
+        assert "│ \x1b[31m1/2/3\x1b[0m │" in output
+        assert "│ \x1b[31m\x1b[1m0/0/1\x1b[0m │" in output
+
+    def test_latex(self):
+        output = report(latex=True, colored=True)
+        assert output.count("\\begin{tabular}{lccc}") == 3
+        assert "1. aries & - & \\cellcolor{green!17}3/2/1 & 3/2/1 \\\\" in output
+        assert "2. lpg & \\cellcolor{red!17}1/2/3 & - & 1/2/3 \\\\" in output
+        assert "\\label{tab:compare-quality-all}" in output
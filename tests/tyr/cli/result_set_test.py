@@ -0,0 +1,259 @@
+import random
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tyr import PlannerResult, PlannerResultStatus, RunningMode, SolveConfig
+from tyr.cli.analysis_cache import AnalysisCache
+from tyr.cli.result_set import (
+    InconsistentGroup,
+    ResultSet,
+    add_virtual_results,
+    drop_not_run,
+    find_inconsistencies,
+    load_result_set,
+)
+from tyr.core.paths import TyrPaths
+from tyr.planners.database import Database
+from tyr.planners.model.virtual_planner import (
+    synthesize_virtual_results,
+    virtual_planners,
+)
+
+CONFIG = SolveConfig(1, 1, 300, 0, False, False, False, False)
+
+
+def named(name: str, **kwargs):
+    mock = MagicMock(**kwargs)
+    mock.name = name
+    return mock
+
+
+def make_results(seed: int, statuses):
+    rng = random.Random(seed)
+    domains = [named(f"domain-{i}") for i in range(3)]
+    problems = [named(f"{d.name}:{i}", domain=d) for d in domains for i in range(4)]
+    return [
+        PlannerResult(f"planner-{p}", problem, mode, rng.choice(statuses), CONFIG)
+        for p in range(3)
+        for problem in problems
+        for mode in RunningMode
+    ]
+
+
+def quadratic_drop_not_run(results):
+    return [
+        r
+        for r in results
+        if not any(
+            r1.status == PlannerResultStatus.NOT_RUN
+            for r1 in results
+            if r1.problem.name == r.problem.name and r1.running_mode == r.running_mode
+        )
+    ]
+
+
+class TestResultSet:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_drop_not_run_parity(self, seed):
+        statuses = [PlannerResultStatus.SOLVED] * 10 + [PlannerResultStatus.NOT_RUN]
+        results = make_results(seed, statuses)
+        assert drop_not_run(results) == quadratic_drop_not_run(results)
+
+    def test_consistent(self):
+        domain = named("domain")
+        problems = [named(f"domain:{i}", domain=domain) for i in range(3)]
+        unsupported = PlannerResultStatus.UNSUPPORTED
+        results = [
+            PlannerResult("a", p, RunningMode.ONESHOT, unsupported, CONFIG)
+            for p in problems
+        ] + [
+            PlannerResult(
+                "b", p, RunningMode.ONESHOT, PlannerResultStatus.SOLVED, CONFIG
+            )
+            for p in problems
+        ]
+        assert find_inconsistencies(results) == []
+        assert ResultSet(results).is_consistent
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_reports_all_inconsistencies(self, seed):
+        statuses = [PlannerResultStatus.SOLVED, PlannerResultStatus.UNSUPPORTED]
+        results = make_results(seed, statuses)
+        expected = []
+        for r in results:
+            group = [
+                r1.status
+                for r1 in results
+                if r1.problem.domain == r.problem.domain
+                and r1.planner_name == r.planner_name
+                and r1.running_mode == r.running_mode
+            ]
+            inconsistency = InconsistentGroup(
+                r.problem.domain, r.planner_name, r.running_mode
+            )
+            if len(set(group)) > 1 and inconsistency not in expected:
+                expected.append(inconsistency)
+        assert find_inconsistencies(results) == expected
+
+    def test_message(self):
+        inconsistency = InconsistentGroup(
+            named("domain"), "planner", RunningMode.ANYTIME
+        )
+        message = inconsistency.message()
+        assert "domain" in message
+        assert "planner" in message
+        assert "anytime" in message
+
+
+class TestLoadResultSet:
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def paths(tmp_path: Path):
+        previous = TyrPaths().db, TyrPaths().cache
+        TyrPaths().db = tmp_path / "db.sqlite3"
+        TyrPaths().cache = tmp_path / "cache"
+        Database.clear_singleton()
+        yield
+        TyrPaths().db, TyrPaths().cache = previous
+        Database.clear_singleton()
+
+    @staticmethod
+    def planner(name: str):
+        planner = named(name)
+        planner.get_solve_config.return_value = CONFIG
+        return planner
+
+    def test_cached_until_database_changes(self):
+        domain = named("domain")
+        problems = [named(f"domain:{i}", domain=domain) for i in range(3)]
+        planners = [self.planner("a"), self.planner("b")]
+        results = [
+            PlannerResult(p.name, problem, mode, PlannerResultStatus.SOLVED, CONFIG, 1)
+            for p in planners
+            for problem in problems
+            for mode in RunningMode
+        ]
+        with patch(
+            "tyr.cli.result_set.load_results", return_value=results
+        ) as load_mock:
+            first = load_result_set(planners, problems, CONFIG)
+            second = load_result_set(planners, problems, CONFIG)
+            assert load_mock.call_count == 1
+            assert first.key == second.key
+            assert second.results == results
+            assert all(r.problem is e.problem for r, e in zip(second.results, results))
+
+            load_result_set(planners, problems[:2], CONFIG)
+            assert load_mock.call_count == 2
+
+            Database()._save_planner_result(results[0])
+            third = load_result_set(planners, problems, CONFIG)
+            assert load_mock.call_count == 3
+            assert third.key != first.key
+
+    def test_with_solutions(self):
+        problems = [named("domain:1", domain=named("domain"))]
+        planners = [self.planner("a")]
+        with patch("tyr.cli.result_set.load_results", return_value=[]), patch.object(
+            Database(), "load_anytime_solutions", return_value=[]
+        ) as solutions_mock:
+            plain = load_result_set(planners, problems, CONFIG)
+            assert solutions_mock.call_count == 0
+            with_solutions = load_result_set(
+                planners, problems, CONFIG, with_solutions=True
+            )
+            assert solutions_mock.call_count == 1
+            assert plain.key != with_solutions.key
+
+    def test_no_cache(self):
+        problems = [named("domain:1", domain=named("domain"))]
+        planners = [self.planner("a")]
+        with patch("tyr.cli.result_set.load_results", return_value=[]) as load_mock:
+            AnalysisCache().enabled = False
+            try:
+                load_result_set(planners, problems, CONFIG)
+                load_result_set(planners, problems, CONFIG)
+            finally:
+                AnalysisCache().enabled = True
+            assert load_mock.call_count == 2
+
+    def test_add_virtual_results(self):
+        problems = [named("domain:1", domain=named("domain"))]
+        planners = [self.planner("a"), self.planner("b")]
+        solved, mode = PlannerResultStatus.SOLVED, RunningMode.ONESHOT
+        results = [
+            PlannerResult(p.name, problems[0], mode, solved, CONFIG, 1, 2)
+            for p in planners
+        ]
+        with patch("tyr.cli.result_set.load_results", return_value=results):
+            result_set = load_result_set(planners, problems, CONFIG)
+        virtual = virtual_planners(planners)
+        assert add_virtual_results(result_set, []) is result_set
+
+        with_virtual = add_virtual_results(result_set, virtual)
+        names = [r.planner_name for r in with_virtual.results]
+        assert names == ["a", "b", "vbs", "vws"]
+        assert with_virtual.key not in (None, result_set.key)
+        assert with_virtual.key != add_virtual_results(result_set, virtual[:1]).key
+        assert Database().fingerprint()[1] == 0
+
+    def test_virtual_inconsistencies(self):
+        domain = named("domain")
+        problems = [named(f"domain:{i}", domain=domain) for i in range(2)]
+        planners = [self.planner("a"), self.planner("b")]
+        mode = RunningMode.ONESHOT
+        results = [
+            PlannerResult(p.name, problem, mode, status, CONFIG)
+            for p in planners
+            for problem, status in zip(
+                problems,
+                [PlannerResultStatus.UNSUPPORTED, PlannerResultStatus.TIMEOUT],
+            )
+        ]
+        result_set = ResultSet(results, find_inconsistencies(results))
+        with_virtual = add_virtual_results(result_set, virtual_planners(planners))
+        assert [i.planner_name for i in with_virtual.inconsistencies] == [
+            "a",
+            "b",
+            "vbs",
+            "vws",
+        ]
+
+    def test_save_virtual_results(self):
+        problems = [named("domain:1", domain=named("domain"))]
+        planners = [self.planner("a"), self.planner("b")]
+        solved, mode = PlannerResultStatus.SOLVED, RunningMode.ONESHOT
+        results = [
+            PlannerResult(p.name, problems[0], mode, solved, CONFIG, t, q)
+            for p, t, q in zip(planners, [1, 3], [5, 2])
+        ]
+        result_set = ResultSet(results)
+        virtual = virtual_planners(planners)
+        path = "tyr.cli.result_set.synthesize_virtual_results"
+        with patch(path, wraps=synthesize_virtual_results) as synthesize:
+            first = add_virtual_results(result_set, virtual, save=True)
+            second = add_virtual_results(result_set, virtual, save=True)
+            assert synthesize.call_count == 2
+            assert Database().fingerprint()[1] == 0
+            assert second.results[2:] == [
+                replace(r, from_database=True) for r in first.results[2:]
+            ]
+            assert [(r.computation_time, r.plan_quality) for r in second.results] == [
+                (1, 5),
+                (3, 2),
+                (1, 2),
+                (3, 5),
+            ]
+
+            # Other members or a new result of a member synthesise the results again.
+            alone = add_virtual_results(
+                result_set, virtual_planners(planners[:1]), save=True
+            )
+            assert synthesize.call_count == 4
+            assert [r.plan_quality for r in alone.results[2:]] == [5, 5]
+            Database()._save_planner_result(results[0])
+            add_virtual_results(result_set, virtual, save=True)
+            assert synthesize.call_count == 6
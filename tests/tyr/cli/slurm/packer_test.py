@@ -0,0 +1,136 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tyr import RunningMode, SolveConfig
+from tyr.cli.slurm.packer import SlurmJob, estimate_time, pack_jobs, write_manifest
+from tyr.planners.model.result import PlannerResultStatus
+
+
+def job(
+    expected_time: float, planner_name="planner", problem_name="domain:1", memout=1024
+):
+    planner = MagicMock()
+    planner.name = planner_name
+    problem = MagicMock()
+    problem.name = problem_name
+    return SlurmJob(planner, problem, RunningMode.ONESHOT, expected_time, memout)
+
+
+def db_result(status_name: str, computation_time):
+    result = MagicMock()
+    result.status = getattr(PlannerResultStatus, status_name.upper())
+    result.computation_time = computation_time
+    return result
+
+
+class TestPacker:
+    @staticmethod
+    @pytest.fixture()
+    def solve_config():
+        yield SolveConfig(1, 1024, 300, 10, False, False, False, False)
+
+    # =============================== Estimate time ============================== #
+
+    @pytest.mark.parametrize(
+        "status, computation_time, running_mode, expected",
+        [
+            ("solved", 12.5, RunningMode.ONESHOT, 12.5),
+            ("solved", 12.5, RunningMode.ANYTIME, 300),
+            ("solved", 500, RunningMode.ONESHOT, 300),
+            ("solved", None, RunningMode.ONESHOT, 310),
+            ("unsolvable", 3, RunningMode.ANYTIME, 3),
+            ("error", 1, RunningMode.ONESHOT, 1),
+            ("timeout", 300, RunningMode.ONESHOT, 310),
+            ("unsupported", None, RunningMode.ONESHOT, 0),
+        ],
+    )
+    @patch("tyr.cli.slurm.packer.Database")
+    def test_estimate_time_from_history(
+        self,
+        database,
+        solve_config,
+        status,
+        computation_time,
+        running_mode,
+        expected,
+    ):
+        database().load_planner_result.return_value = db_result(
+            status, computation_time
+        )
+        planner = MagicMock()
+        assert (
+            estimate_time(planner, MagicMock(), solve_config, running_mode) == expected
+        )
+
+    @patch("tyr.cli.slurm.packer.Database")
+    def test_estimate_time_without_history(self, database, solve_config):
+        database().load_planner_result.return_value = None
+        planner = MagicMock()
+        result = estimate_time(planner, MagicMock(), solve_config, RunningMode.ONESHOT)
+        assert result == 310
+
+    @patch("tyr.cli.slurm.packer.Database")
+    def test_estimate_time_unsupported_mode(self, database, solve_config):
+        planner = MagicMock()
+        planner.supports_running_mode.return_value = False
+        result = estimate_time(planner, MagicMock(), solve_config, RunningMode.ONESHOT)
+        assert result == 0
+        database().load_planner_result.assert_not_called()
+
+    # ================================= Pack jobs ================================ #
+
+    def test_pack_no_jobs(self):
+        assert pack_jobs([], 100) == []
+
+    @pytest.mark.parametrize("budget", [0, -10])
+    def test_pack_invalid_budget(self, budget):
+        with pytest.raises(ValueError):
+            pack_jobs([job(1)], budget)
+
+    def test_pack_all_jobs_once(self):
+        jobs = [job(t, problem_name=f"domain:{i}") for i, t in enumerate(range(1, 30))]
+        tasks = pack_jobs(jobs, 50)
+        packed = [j for t in tasks for j in t.jobs]
+        assert sorted(packed, key=lambda j: j.problem.name) == sorted(
+            jobs, key=lambda j: j.problem.name
+        )
+
+    def test_pack_under_budget(self):
+        jobs = [job(t, problem_name=f"domain:{i}") for i, t in enumerate(range(1, 30))]
+        tasks = pack_jobs(jobs, 50)
+        assert all(t.expected_time <= 50 for t in tasks)
+
+    def test_pack_balanced(self):
+        jobs = [job(10, problem_name=f"domain:{i}") for i in range(12)]
+        tasks = pack_jobs(jobs, 40)
+        assert len(tasks) == 3
+        assert [t.expected_time for t in tasks] == [40, 40, 40]
+
+    def test_pack_long_job_alone(self):
+        jobs = [job(500, problem_name="domain:1")] + [
+            job(10, problem_name=f"domain:{i}") for i in range(2, 6)
+        ]
+        tasks = pack_jobs(jobs, 40)
+        long_tasks = [t for t in tasks if t.expected_time > 40]
+        assert len(long_tasks) == 1
+        assert len(long_tasks[0].jobs) == 1
+
+    # ================================= Manifest ================================= #
+
+    def test_write_manifest(self, tmp_path):
+        jobs = [job(10, "aries", f"domain:{i}", 2048 * i) for i in range(4)]
+        tasks = pack_jobs(jobs, 20)
+        manifest = tmp_path / "manifest.tsv"
+        write_manifest(tasks, manifest)
+
+        lines = manifest.read_text().splitlines()
+        assert len(lines) == 4
+        for line in lines:
+            task_id, planner, problem, mode, memout = line.split("\t")
+            assert planner == "aries"
+            assert mode == "oneshot"
+            assert any(
+                j.problem.name == problem and j.memout == int(memout)
+                for j in tasks[int(task_id)].jobs
+            )
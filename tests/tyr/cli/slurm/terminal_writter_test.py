@@ -0,0 +1,32 @@
+import io
+from unittest.mock import MagicMock
+
+from tyr import RunningMode, SolveConfig
+from tyr.cli.slurm.packer import SlurmJob, SlurmTask
+from tyr.cli.slurm.terminal_writter import SlurmTerminalWritter
+
+
+def task(*memouts: int) -> SlurmTask:
+    return SlurmTask(
+        [SlurmJob(MagicMock(), MagicMock(), RunningMode.ONESHOT, 1, m) for m in memouts]
+    )
+
+
+class TestSlurmTerminalWritter:
+    def test_packed_script_uses_job_memouts(self, tmp_path):
+        out = io.StringIO()
+        config = SolveConfig(1, 1024**2, 300, 10, False, False, False, False)
+        tw = SlurmTerminalWritter(config, out)
+        tw.script(
+            None, [], [RunningMode.ONESHOT], [task(4 * 1024**2), task(2048)], tmp_path
+        )
+
+        script = out.getvalue()
+        assert "#SBATCH --mem-per-cpu=4096K" in script
+        assert "read -r -u 3 TASK PLANNER PROBLEM MODE MEMOUT; do" in script
+        assert '--memout "$MEMOUT"' in script
+        assert f"--memout {1024**2}" not in script
+
+    def test_mem_kilo_without_tasks(self):
+        config = SolveConfig(1, 1024**2, 300, 10, False, False, False, False)
+        assert SlurmTerminalWritter(config, io.StringIO()).mem_kilo() == 1024
@@ -0,0 +1,121 @@
+import io
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tyr import PlannerResult, PlannerResultStatus, RunningMode, SolveConfig
+from tyr.cli.collector import CollectionResult
+from tyr.cli.table.terminal_writter import (
+    Adjust,
+    Cell,
+    CellRow,
+    Sep,
+    TableTerminalWritter,
+)
+from tyr.core.paths import TyrPaths
+from tyr.metrics.metrics.coverage import CoverageMetric
+from tyr.metrics.metrics.time_score import TimeScoreMetric
+
+
+def named(name: str, **kwargs):
+    mock = MagicMock(**kwargs)
+    mock.name = name
+    return mock
+
+
+def table_inputs(seed: int):
+    rng = random.Random(seed)
+    domains = [named(f"domain-{i}") for i in range(4)]
+    problems = [named(f"{d.name}:{i}", domain=d) for d in domains for i in range(5)]
+    planners = [named(f"planner-{i}") for i in range(3)]
+    config = SolveConfig(1, 1, 300, 0, False, False, False, False)
+    results = [
+        PlannerResult(
+            planner.name,
+            problem,
+            RunningMode.ONESHOT,
+            rng.choice([PlannerResultStatus.SOLVED, PlannerResultStatus.TIMEOUT]),
+            config,
+            rng.uniform(0, 300),
+            rng.randint(1, 9),
+        )
+        for planner in planners
+        for problem in problems
+    ]
+    return domains, problems, planners, config, results
+
+
+def analyse(config, planners, problems, metrics, results, cache_key=None) -> str:
+    out = io.StringIO()
+    tw = TableTerminalWritter(config, out)
+    tw.report_collect(
+        CollectionResult(planners, []),
+        CollectionResult(problems, []),
+        CollectionResult(metrics, []),
+    )
+    tw.set_results(results, cache_key=cache_key)
+    tw.analyse()
+    return out.getvalue()
+
+
+class TestCellRow:
+    def test_columns(self):
+        cells = [
+            Cell("a", Adjust.LEFT),
+            Cell("b", Adjust.LEFT, 3),
+            Cell("c", Adjust.LEFT),
+        ]
+        row = CellRow(
+            [Sep.DOUBLE, cells[0], Sep.SIMPLE, cells[1], Sep.SIMPLE, cells[2]]
+        )
+        columns = row.columns()
+        assert [columns[id(c)] for c in cells] == [0, 1, 4]
+        assert [row.column_of(c) for c in cells] == [0, 1, 4]
+
+
+class TestTableTerminalWritter:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_analyse_values(self, seed):
+        domains, problems, planners, config, results = table_inputs(seed)
+        metrics = [CoverageMetric(), TimeScoreMetric()]
+        output = analyse(config, planners, problems, metrics, results)
+
+        lines = {
+            line.split("║")[1].strip(): [v.strip() for v in line.split("║")[2:-1]]
+            for line in output.splitlines()
+            if line.startswith("║ domain-")
+        }
+        assert sorted(lines) == [d.name for d in domains]
+        for domain in domains:
+            cells = [v for group in lines[domain.name] for v in group.split("│")]
+            expected = [
+                metric.evaluate(
+                    [
+                        r
+                        for r in results
+                        if r.problem.domain is domain and r.planner_name == p.name
+                    ],
+                    results,
+                )
+                for p in planners
+                for metric in sorted(metrics, key=lambda m: m.abbrev())
+            ]
+            assert [c.strip() for c in cells] == expected
+
+    def test_analyse_cached_values(self, tmp_path):
+        _, problems, planners, config, results = table_inputs(0)
+        metrics = [CoverageMetric(), TimeScoreMetric()]
+        previous = TyrPaths().cache
+        TyrPaths().cache = tmp_path
+        try:
+            first = analyse(config, planners, problems, metrics, results, "key")
+            with patch.object(
+                CoverageMetric, "evaluate_groups", side_effect=AssertionError
+            ):
+                second = analyse(config, planners, problems, metrics, results, "key")
+                with pytest.raises(AssertionError):
+                    analyse(config, planners, problems, metrics, results, "other")
+        finally:
+            TyrPaths().cache = previous
+        assert first == second
@@ -1,9 +1,17 @@
 from pathlib import Path
 
+import pytest
+
 from tyr.core.paths import TyrPaths
 
 
 class TestPaths:
+    @staticmethod
+    @pytest.fixture()
+    def cache_folder():
+        # Keep the default cache folder, nothing is written in it.
+        yield TyrPaths().cache
+
     def test_singleton(self):
         assert TyrPaths() is TyrPaths()
 
@@ -13,6 +21,9 @@ class TestPaths:
     def test_db_default(self):
         assert TyrPaths().db == TyrPaths().ROOT_DIR / "db.sqlite3"
 
+    def test_cache_default(self):
+        assert TyrPaths().cache == TyrPaths().ROOT_DIR / "cache"
+
     def test_logs_setter(self):
         try:
             paths = TyrPaths()
@@ -30,3 +41,12 @@ class TestPaths:
         finally:
             # Reset the default logs path
             paths._db = TyrPaths().ROOT_DIR / "db.sqlite3"
+
+    def test_cache_setter(self):
+        try:
+            paths = TyrPaths()
+            paths.cache = "new_cache"
+            assert paths.cache == Path("new_cache").absolute()
+        finally:
+            # Reset the default cache path
+            paths._cache = TyrPaths().ROOT_DIR / "cache"
@@ -0,0 +1,52 @@
+import pytest
+
+from tests.tyr.metrics.engine_test import planner_result, random_results
+from tyr.metrics.accumulator import MetricAccumulator
+from tyr.metrics.metrics.coverage import CoverageMetric
+from tyr.metrics.metrics.quality_score import QualityScoreMetric
+from tyr.metrics.metrics.time_score import TimeScoreMetric
+from tyr.planners.model.result import PlannerResultStatus
+
+
+class TestMetricAccumulator:
+    def test_empty(self):
+        accumulator = MetricAccumulator(lambda r: r.planner_name)
+        assert len(accumulator) == 0
+        assert accumulator.keys() == []
+        scores = accumulator.scores(["a"])
+        assert (scores.num_results, scores.coverage) == (0, 0)
+
+    def test_best_quality_improvement(self):
+        solved = PlannerResultStatus.SOLVED
+        accumulator = MetricAccumulator(lambda r: r.planner_name)
+        accumulator.add(planner_result("a", "p1", solved, 0.5, 10))
+        assert accumulator.scores(["a"]).quality_score == 100
+        accumulator.add(planner_result("b", "p1", solved, 0.5, 5))
+        assert accumulator.scores(["a"]).quality_score == 50
+        assert accumulator.scores(["b"]).quality_score == 100
+        accumulator.add(planner_result("c", "p1", solved, 0.5, 0))
+        assert accumulator.scores(["a"]).quality_score == 0
+        assert accumulator.scores(["b"]).quality_score == 0
+        assert accumulator.scores(["c"]).quality_score == 100
+        assert accumulator.scores(["a", "b", "c", "d"]).num_results == 3
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_parity(self, seed):
+        results = random_results(seed, 500)
+        accumulator = MetricAccumulator(lambda r: r.planner_name)
+        for i, result in enumerate(results):
+            accumulator.add(result)
+            if i % 100 != 99:
+                continue
+            seen = results[: i + 1]
+            for key in accumulator.keys():
+                group = [r for r in seen if r.planner_name == key]
+                scores = accumulator.scores([key])
+                assert scores.num_results == len(group)
+                assert scores.coverage == CoverageMetric()._evaluate(group, seen)
+                assert scores.time_score == pytest.approx(
+                    TimeScoreMetric()._evaluate(group, seen)
+                )
+                assert scores.quality_score == pytest.approx(
+                    QualityScoreMetric()._evaluate(group, seen)
+                )
@@ -0,0 +1,89 @@
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tyr.core.paths import TyrPaths
+from tyr.metrics.best_quality import BestQualityIndex
+from tyr.planners.database import Database
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+
+def planner_result(problem, quality):
+    return PlannerResult(
+        "foo",
+        problem,
+        MagicMock(),
+        PlannerResultStatus.SOLVED,
+        MagicMock(),
+        MagicMock(),
+        quality,
+    )
+
+
+def problem_instance(name: str):
+    problem = MagicMock()
+    problem.name = name
+    return problem
+
+
+class TestBestQualityIndex:
+    @staticmethod
+    @pytest.fixture()
+    def db_path(tmp_path: Path):
+        previous = TyrPaths().db
+        TyrPaths().db = tmp_path / "db.sqlite3"
+        yield TyrPaths().db
+        TyrPaths().db = previous
+
+    def test_from_results(self):
+        results = [
+            planner_result("a", 5),
+            planner_result("b", None),
+            planner_result("a", 3),
+            planner_result("c", 7),
+            planner_result("a", 4),
+        ]
+        index = BestQualityIndex.from_results(results)
+        assert index.get("a") == 3
+        assert index.get("b") == float("inf")
+        assert index.get("c") == 7
+        assert "b" not in index
+        assert len(index) == 2
+
+    def test_add_keeps_best(self):
+        index = BestQualityIndex()
+        index.add("a", 4)
+        index.add("a", 6)
+        index.add("a", None)
+        assert index.get("a") == 4
+        index.add("a", 2)
+        assert dict(index.items()) == {"a": 2}
+
+    def test_mean_score(self):
+        results = [planner_result("a", 4), planner_result("a", 8)]
+        results.append(replace(results[0], status=PlannerResultStatus.TIMEOUT))
+        index = BestQualityIndex.from_results(results[:1])
+        score = index.mean_score(results, lambda r, best: best / r.plan_quality)
+        assert score == pytest.approx(1.5 / 3)
+        assert index.mean_score([], lambda r, best: 1) == 0
+
+    def test_sync(self, db_path):
+        first, second = problem_instance("d:1"), problem_instance("d:2")
+        index = BestQualityIndex.from_results(
+            [planner_result(first, 10), planner_result(second, 8)]
+        )
+        index.sync([first, second])
+        assert Database().load_best_qualities(["d:1", "d:2"]) == {"d:1": 10, "d:2": 8}
+
+        # A partial set of results keeps the best stored quality.
+        index = BestQualityIndex.from_results([planner_result(first, 12)])
+        index.sync([first, second])
+        assert index.get(first) == 10
+        assert index.get(second) == 8
+
+        index = BestQualityIndex.from_results([planner_result(first, 6)])
+        index.sync([first])
+        assert Database().load_best_qualities(["d:1", "d:2"]) == {"d:1": 6, "d:2": 8}
+        assert Database().load_best_qualities(["d:2"]) == {"d:2": 8}
@@ -0,0 +1,126 @@
+import random
+
+import numpy as np
+import pytest
+
+from tests.tyr.metrics.engine_test import planner_result, random_results
+from tyr.metrics.bootstrap import bootstrap_intervals
+from tyr.metrics.engine import ResultArrays, group_sample_means
+from tyr.metrics.metric import Metric
+from tyr.metrics.metrics.coverage import CoverageMetric
+from tyr.metrics.metrics.quality_score import QualityScoreMetric
+from tyr.metrics.metrics.relative_quality_score import RelativeQualityScoreMetric
+from tyr.metrics.metrics.time_score import TimeScoreMetric
+from tyr.planners.model.result import PlannerResultStatus
+
+METRICS = [
+    CoverageMetric(),
+    QualityScoreMetric(),
+    RelativeQualityScoreMetric(),
+    TimeScoreMetric(),
+]
+
+
+class FakeMetric(Metric):
+    def _evaluate(self, results, all_results):
+        return 0
+
+
+def domain_results(seed: int):
+    rng = random.Random(seed)
+    statuses = [PlannerResultStatus.SOLVED, PlannerResultStatus.TIMEOUT]
+    return [
+        planner_result(
+            f"planner-{p}",
+            f"domain-{d}:{i}",
+            rng.choice(statuses),
+            rng.uniform(0, 300),
+            rng.randint(1, 50),
+            300,
+        )
+        for d in range(3)
+        for i in range(10)
+        for p in range(4)
+    ]
+
+
+def group_arrays(results):
+    arrays = ResultArrays.from_results(results)
+    groups, keys = arrays.group_by(lambda r: (r.problem.split(":")[0], r.planner_name))
+    strata, _ = arrays.group_by(lambda r: r.problem.split(":")[0])
+    return arrays, groups, len(keys), strata
+
+
+class TestGroupSampleMeans:
+    def test_weights(self):
+        values = np.array([1.0, 0.0, 0.5, 1.0])
+        groups = np.array([0, 0, 1, -1])
+        problem_ids = np.array([0, 1, 1, 0])
+        weights = np.array([[1.0, 1.0], [2.0, 0.0], [0.0, 3.0]])
+        means = group_sample_means(values, groups, 2, problem_ids, weights)
+        assert means.tolist() == [[50, 50], [100, 0], [0, 50]]
+
+    @pytest.mark.parametrize("metric", METRICS, ids=lambda m: m.name)
+    @pytest.mark.parametrize("seed", range(3))
+    def test_unit_weights_parity(self, metric, seed):
+        arrays = ResultArrays.from_results(random_results(seed, 300))
+        groups, keys = arrays.group_by(lambda r: r.planner_name)
+        weights = np.ones((2, len(arrays.problems)))
+        samples = metric.evaluate_samples(arrays, groups, len(keys), weights)
+        expected = metric.evaluate_groups(arrays, groups, len(keys))
+        assert samples.shape == (2, len(keys))
+        assert samples[0] == pytest.approx(expected)
+        assert samples[1] == pytest.approx(expected)
+
+
+class TestBootstrapIntervals:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_contains_values(self, seed):
+        arrays, groups, num_groups, strata = group_arrays(domain_results(seed))
+        intervals = bootstrap_intervals(
+            METRICS, arrays, groups, num_groups, strata, 95, 500
+        )
+        for metric in METRICS:
+            values = metric.evaluate_groups(arrays, groups, num_groups)
+            bounds = intervals[metric]
+            assert bounds.shape == (num_groups, 2)
+            assert np.all(bounds[:, 0] <= bounds[:, 1])
+            assert np.all(bounds[:, 0] <= values + 1e-9)
+            assert np.all(values <= bounds[:, 1] + 1e-9)
+
+    def test_reproducible(self):
+        arrays, groups, num_groups, strata = group_arrays(domain_results(0))
+        first = bootstrap_intervals(
+            METRICS, arrays, groups, num_groups, strata, 90, 200, seed=3
+        )
+        second = bootstrap_intervals(
+            METRICS, arrays, groups, num_groups, strata, 90, 200, jobs=2, seed=3
+        )
+        for metric in METRICS:
+            assert first[metric].tolist() == second[metric].tolist()
+
+    def test_confidence_level(self):
+        arrays, groups, num_groups, strata = group_arrays(domain_results(0))
+        narrow = bootstrap_intervals(
+            [CoverageMetric()], arrays, groups, num_groups, strata, 50, 500
+        )[CoverageMetric()]
+        wide = bootstrap_intervals(
+            [CoverageMetric()], arrays, groups, num_groups, strata, 99, 500
+        )[CoverageMetric()]
+        assert np.all(wide[:, 0] <= narrow[:, 0])
+        assert np.all(narrow[:, 1] <= wide[:, 1])
+
+    @pytest.mark.parametrize("confidence", [0, 100, -5, 150])
+    def test_invalid_confidence(self, confidence):
+        arrays, groups, num_groups, strata = group_arrays(domain_results(0))
+        with pytest.raises(ValueError):
+            bootstrap_intervals(
+                METRICS, arrays, groups, num_groups, strata, confidence, 10
+            )
+
+    def test_not_sampled_metric(self):
+        arrays, groups, num_groups, strata = group_arrays(domain_results(0))
+        intervals = bootstrap_intervals(
+            [FakeMetric()], arrays, groups, num_groups, strata, 95, 10
+        )
+        assert np.isnan(intervals[FakeMetric()]).all()
@@ -0,0 +1,125 @@
+import random
+
+import numpy as np
+import pytest
+
+from tyr.metrics.engine import ResultArrays, group_mean
+from tyr.metrics.metric import Metric
+from tyr.metrics.metrics.anytime_quality_score import AnytimeQualityScoreMetric
+from tyr.metrics.metrics.coverage import CoverageMetric
+from tyr.metrics.metrics.quality_score import QualityScoreMetric
+from tyr.metrics.metrics.relative_quality_score import RelativeQualityScoreMetric
+from tyr.metrics.metrics.time_score import TimeScoreMetric
+from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+
+def planner_result(planner_name, problem, status, time=None, quality=None, timeout=5):
+    return PlannerResult(
+        planner_name,
+        problem,
+        RunningMode.ONESHOT,
+        status,
+        SolveConfig(1, 1, timeout, 0, False, False, False, False),
+        time,
+        quality,
+    )
+
+
+def random_results(seed: int, num_results: int):
+    rng = random.Random(seed)
+    results = []
+    for _ in range(num_results):
+        status = rng.choice(list(PlannerResultStatus))
+        time = rng.choice([None, 0, rng.random(), 1, rng.uniform(1, 400)])
+        quality = rng.choice([None, 0, rng.randint(1, 50), rng.uniform(1, 50)])
+        results.append(
+            planner_result(
+                f"planner-{rng.randint(0, 3)}",
+                f"problem-{rng.randint(0, 9)}",
+                status,
+                time,
+                quality,
+                rng.choice([5, 60, 300]),
+            )
+        )
+    return results
+
+
+class TestResultArrays:
+    def test_from_results(self):
+        solved = PlannerResultStatus.SOLVED
+        results = [
+            planner_result("a", "p1", solved, 2.5, 10),
+            planner_result("a", "p2", PlannerResultStatus.TIMEOUT),
+            planner_result("b", "p1", solved, 0.5, 4, timeout=60),
+        ]
+        arrays = ResultArrays.from_results(results)
+        assert len(arrays) == 3
+        assert arrays.problems == ["p1", "p2"]
+        assert arrays.problem_ids.tolist() == [0, 1, 0]
+        assert arrays.solved.tolist() == [True, False, True]
+        assert arrays.times[[0, 2]].tolist() == [2.5, 0.5]
+        assert np.isnan(arrays.times[1])
+        assert np.isnan(arrays.qualities[1])
+        assert arrays.timeouts.tolist() == [5, 5, 60]
+        assert arrays.best_qualities.tolist() == [4, np.inf, 4]
+
+    def test_group_by(self):
+        results = [
+            planner_result(name, "p", PlannerResultStatus.SOLVED)
+            for name in ["b", "a", "b", "c"]
+        ]
+        groups, keys = ResultArrays.from_results(results).group_by(
+            lambda r: r.planner_name
+        )
+        assert groups.tolist() == [0, 1, 0, 2]
+        assert keys == ["b", "a", "c"]
+
+    def test_empty(self):
+        arrays = ResultArrays.from_results([])
+        assert len(arrays) == 0
+        assert CoverageMetric().evaluate_groups(
+            arrays, arrays.problem_ids, 2
+        ).tolist() == [0, 0]
+
+    def test_group_mean(self):
+        values = np.array([1.0, 0.5, 0.25, 1.0])
+        groups = np.array([0, 0, -1, 2])
+        assert group_mean(values, groups, 3).tolist() == [75, 0, 100]
+
+
+class TestMetricsParity:
+    """The grouped evaluation must give exactly the values of `_evaluate`."""
+
+    @pytest.mark.parametrize(
+        "metric",
+        [
+            AnytimeQualityScoreMetric(),
+            CoverageMetric(),
+            QualityScoreMetric(),
+            RelativeQualityScoreMetric(),
+            TimeScoreMetric(),
+        ],
+        ids=lambda m: m.name,
+    )
+    @pytest.mark.parametrize("seed", range(5))
+    def test_parity(self, metric, seed):
+        results = random_results(seed, 500)
+        arrays = ResultArrays.from_results(results)
+        groups, keys = arrays.group_by(lambda r: (r.planner_name, r.problem[-1] < "5"))
+        values = metric.evaluate_groups(arrays, groups, len(keys))
+        for i, key in enumerate(keys):
+            group = [r for r in results if (r.planner_name, r.problem[-1] < "5") == key]
+            assert values[i] == metric._evaluate(group, results)
+            assert metric.format_value(values[i]) == metric.evaluate(group, results)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_fallback_parity(self, seed):
+        results = random_results(seed, 200)
+        arrays = ResultArrays.from_results(results)
+        groups, keys = arrays.group_by(lambda r: r.planner_name)
+        metric = TimeScoreMetric()
+        expected = metric.evaluate_groups(arrays, groups, len(keys))
+        fallback = Metric._evaluate_groups(metric, arrays, groups, len(keys))
+        assert fallback.tolist() == expected.tolist()
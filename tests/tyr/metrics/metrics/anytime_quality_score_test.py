@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from tyr.metrics.engine import ResultArrays, quality_curve_areas
+from tyr.metrics.metrics.anytime_quality_score import AnytimeQualityScoreMetric
+from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+
+def planner_result(status_name: str, solutions, problem="bar", planner="foo"):
+    final_time, final_quality = solutions[-1] if solutions else (None, None)
+    return PlannerResult(
+        planner,
+        problem,
+        RunningMode.ANYTIME,
+        getattr(PlannerResultStatus, status_name.upper()),
+        SolveConfig(1, 1, 100, 0, False, False, False, False),
+        final_time,
+        final_quality,
+        solutions=tuple(solutions),
+    )
+
+
+class TestAnytimeQualityScoreMetric:
+    def test_abbrev(self):
+        assert AnytimeQualityScoreMetric().abbrev() == "AQS"
+
+    def test_uses_solutions(self):
+        assert AnytimeQualityScoreMetric().uses_solutions()
+
+    @pytest.mark.parametrize(
+        "solutions, expected",
+        [
+            ([(0, 4)], "100"),
+            ([(50, 4)], "50.00"),
+            ([(0, 8), (50, 4)], "75.00"),
+            ([(0, 8), (20, 5), (50, 4)], "84.00"),
+            ([(0, 8), (150, 4)], "50.00"),
+        ],
+    )
+    def test_single_result(self, solutions, expected):
+        results = [planner_result("solved", solutions)]
+        all_results = results + [planner_result("solved", [(99, 4)], planner="baz")]
+        assert AnytimeQualityScoreMetric().evaluate(results, all_results) == expected
+
+    @pytest.mark.parametrize("status", PlannerResultStatus)
+    def test_not_solved(self, status):
+        if status == PlannerResultStatus.SOLVED:
+            return
+        results = [planner_result(status.name, [(0, 4)])]
+        assert AnytimeQualityScoreMetric().evaluate(results, results) == "0.00"
+
+    def test_same_final_quality_earlier(self):
+        early = planner_result("solved", [(1, 4)], planner="early")
+        late = planner_result("solved", [(99, 4)], planner="late")
+        metric = AnytimeQualityScoreMetric()
+        assert metric.evaluate_raw([early], [early, late]) == 99
+        assert metric.evaluate_raw([late], [early, late]) == pytest.approx(1)
+
+    def test_best_is_zero(self):
+        results = [planner_result("solved", [(0, 3), (50, 0)])]
+        assert AnytimeQualityScoreMetric().evaluate(results, results) == "50.00"
+
+    def test_oneshot_result(self):
+        result = PlannerResult(
+            "foo",
+            "bar",
+            RunningMode.ONESHOT,
+            PlannerResultStatus.SOLVED,
+            SolveConfig(1, 1, 100, 0, False, False, False, False),
+            25,
+            2,
+        )
+        assert quality_curve_areas(result) == (37.5, 0)
+        assert AnytimeQualityScoreMetric().evaluate([result], [result]) == "75.00"
+
+    def test_empty_results(self):
+        assert AnytimeQualityScoreMetric().evaluate([], []) == "-"
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_parity(self, seed):
+        rng = random.Random(seed)
+        results = []
+        for i in range(300):
+            times = sorted(rng.uniform(0, 120) for _ in range(rng.randint(0, 4)))
+            qualities = sorted((rng.randint(0, 50) for _ in times), reverse=True)
+            results.append(
+                planner_result(
+                    rng.choice(["solved", "solved", "timeout"]),
+                    list(zip(times, qualities)),
+                    f"problem-{i % 20}",
+                    f"planner-{rng.randint(0, 3)}",
+                )
+            )
+        metric = AnytimeQualityScoreMetric()
+        arrays = ResultArrays.from_results(results)
+        groups, keys = arrays.group_by(lambda r: r.planner_name)
+        values = metric.evaluate_groups(arrays, groups, len(keys))
+        for i, key in enumerate(keys):
+            group = [r for r in results if r.planner_name == key]
+            assert values[i] == metric._evaluate(group, results)
@@ -0,0 +1,157 @@
+import random
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from tyr.metrics.pairwise import CRITERIA, compare_planners
+from tyr.planners.model.config import RunningMode, SolveConfig
+from tyr.planners.model.result import PlannerResult, PlannerResultStatus
+
+
+def problem_instance(domain: str, name: str):
+    problem = MagicMock()
+    problem.name = f"{domain}:{name}"
+    problem.domain.name = domain
+    return problem
+
+
+def planner_result(planner_name, problem, status, time=None, quality=None):
+    return PlannerResult(
+        planner_name,
+        problem,
+        RunningMode.ONESHOT,
+        status,
+        SolveConfig(1, 1, 300, 0, False, False, False, False),
+        time,
+        quality,
+    )
+
+
+def value(result, criterion):
+    if result.status != PlannerResultStatus.SOLVED:
+        return float("inf")
+    if criterion == "coverage":
+        return 0
+    raw = result.computation_time if criterion == "time" else result.plan_quality
+    return float("inf") if raw is None else raw
+
+
+def brute_force(results, criterion, domain, planner, opponent):
+    by_key = {(r.problem, r.planner_name): r for r in results}
+    wins = ties = 0
+    for (problem, name), result in by_key.items():
+        if name != planner or problem.domain.name != domain:
+            continue
+        other = by_key.get((problem, opponent))
+        if other is None:
+            continue
+        a, b = value(result, criterion), value(other, criterion)
+        if a == float("inf") and b == float("inf"):
+            continue
+        wins += a < b
+        ties += a == b
+    return wins, ties
+
+
+class TestCompare:
+    solved = PlannerResultStatus.SOLVED
+    timeout = PlannerResultStatus.TIMEOUT
+
+    def test_two_planners(self):
+        p1, p2, p3 = (problem_instance("rovers", f"p{i}") for i in range(3))
+        results = [
+            planner_result("a", p1, self.solved, 1, 10),
+            planner_result("b", p1, self.solved, 2, 10),
+            planner_result("a", p2, self.timeout),
+            planner_result("b", p2, self.solved, 5, 3),
+            planner_result("a", p3, self.timeout),
+            planner_result("b", p3, self.timeout),
+        ]
+        comparison = compare_planners(results)
+        assert comparison.planners == ["a", "b"]
+        assert comparison.domains == ["rovers"]
+
+        wins, ties, losses = comparison.counts("coverage")
+        assert wins.tolist() == [[0, 0], [1, 0]]
+        assert ties.tolist() == [[0, 1], [1, 0]]
+        assert losses.tolist() == [[0, 1], [0, 0]]
+
+        wins, ties, losses = comparison.counts("time")
+        assert wins.tolist() == [[0, 1], [1, 0]]
+        assert ties.tolist() == [[0, 0], [0, 0]]
+
+        wins, ties, losses = comparison.counts("quality")
+        assert wins.tolist() == [[0, 0], [1, 0]]
+        assert ties.tolist() == [[0, 1], [1, 0]]
+
+    def test_missing_result_is_not_compared(self):
+        p1 = problem_instance("rovers", "p1")
+        results = [planner_result("a", p1, self.solved, 1, 1)]
+        results.append(
+            planner_result("b", problem_instance("rovers", "p2"), self.solved)
+        )
+        wins, ties, losses = compare_planners(results).counts("coverage")
+        assert wins.sum() == ties.sum() == losses.sum() == 0
+
+    def test_results_are_merged(self):
+        p1 = problem_instance("rovers", "p1")
+        results = [
+            planner_result("a", p1, self.timeout),
+            planner_result("a", p1, self.solved, 3, 2),
+            planner_result("b", p1, self.solved, 1, 5),
+        ]
+        wins, _, _ = compare_planners(results).counts("quality")
+        assert wins.tolist() == [[0, 1], [0, 0]]
+
+    def test_per_domain(self):
+        rovers, depot = problem_instance("rovers", "p1"), problem_instance(
+            "depot", "p1"
+        )
+        results = [
+            planner_result("a", rovers, self.solved, 1, 1),
+            planner_result("b", rovers, self.timeout),
+            planner_result("a", depot, self.timeout),
+            planner_result("b", depot, self.solved, 1, 1),
+        ]
+        comparison = compare_planners(results)
+        assert comparison.domains == ["depot", "rovers"]
+        assert comparison.counts("coverage", "rovers")[0].tolist() == [[0, 1], [0, 0]]
+        assert comparison.counts("coverage", "depot")[0].tolist() == [[0, 0], [1, 0]]
+        assert comparison.counts("coverage")[0].tolist() == [[0, 1], [1, 0]]
+
+    def test_empty(self):
+        comparison = compare_planners([])
+        assert comparison.planners == [] and comparison.domains == []
+        assert comparison.counts("time")[0].shape == (0, 0)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_parity(self, seed):
+        rng = random.Random(seed)
+        problems = [problem_instance(f"domain-{i % 3}", f"p{i}") for i in range(12)]
+        results = []
+        for problem in problems:
+            for planner in range(6):
+                if rng.random() < 0.1:
+                    continue
+                status = rng.choice([self.solved, self.solved, self.timeout])
+                time = rng.choice([None, 1, 2, rng.uniform(0, 10)])
+                quality = rng.choice([None, 3, 4, rng.randint(0, 10)])
+                results.append(
+                    planner_result(f"planner-{planner}", problem, status, time, quality)
+                )
+
+        comparison = compare_planners(results)
+        for c, criterion in enumerate(CRITERIA):
+            for d, domain in enumerate(comparison.domains):
+                for i, planner in enumerate(comparison.planners):
+                    for j, opponent in enumerate(comparison.planners):
+                        if i == j:
+                            continue
+                        expected = brute_force(
+                            results, criterion, domain, planner, opponent
+                        )
+                        wins = comparison.wins[c, d, i, j]
+                        ties = comparison.ties[c, d, i, j]
+                        assert (wins, ties) == expected
+        assert np.array_equal(comparison.losses, comparison.wins.swapaxes(2, 3))
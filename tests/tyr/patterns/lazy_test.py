@@ -1,3 +1,9 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
 from tyr import Lazy
 
 
@@ -12,7 +18,7 @@ class TestLazy:
             return value
 
         lazy = Lazy(init_callback)
-        assert lazy._value is None
+        assert not lazy.is_built
         assert called == 0
         assert lazy.value == value
         assert called == 1
@@ -20,3 +26,67 @@ class TestLazy:
         assert called == 1
         assert lazy.value == value
         assert called == 1
+
+    def test_lazy_reset(self):
+        called = 0
+
+        def init_callback():
+            nonlocal called
+            called = called + 1
+            return called
+
+        lazy = Lazy(init_callback)
+        assert lazy.value == 1
+        lazy.reset()
+        assert not lazy.is_built
+        assert lazy.value == 2
+        assert lazy.value == 2
+
+    def test_lazy_caches_none(self):
+        factory = MagicMock(return_value=None)
+        lazy = Lazy(factory)
+        assert lazy.value is None
+        assert lazy.value is None
+        assert lazy.is_built
+        assert factory.call_count == 1
+
+    def test_lazy_caches_failure(self):
+        factory = MagicMock(side_effect=ValueError("cannot build"))
+        lazy = Lazy(factory)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _ = lazy.value
+        assert factory.call_count == 1
+        assert lazy.failed
+        assert "cannot build" in lazy.error
+
+    def test_lazy_reset_failure(self):
+        factory = MagicMock(side_effect=[ValueError, 42])
+        lazy = Lazy(factory)
+        with pytest.raises(ValueError):
+            _ = lazy.value
+        lazy.reset()
+        assert not lazy.failed
+        assert lazy.error is None
+        assert lazy.value == 42
+
+    def test_lazy_build_time(self):
+        lazy = Lazy(lambda: time.sleep(0.05))
+        assert lazy.build_time is None
+        _ = lazy.value
+        assert lazy.build_time >= 0.05
+
+    def test_lazy_builds_once_with_threads(self):
+        called = 0
+
+        def init_callback():
+            nonlocal called
+            called = called + 1
+            time.sleep(0.05)
+            return called
+
+        lazy = Lazy(init_callback)
+        with ThreadPoolExecutor(8) as executor:
+            values = list(executor.map(lambda _: lazy.value, range(8)))
+        assert values == [1] * 8
+        assert called == 1
@@ -1,10 +1,12 @@
 import sqlite3
+from dataclasses import replace
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
+from tyr.core.paths import TyrPaths
 from tyr.planners.database import Database
-from tyr.planners.model.config import RunningMode
+from tyr.planners.model.config import RunningMode, SolveConfig
 from tyr.planners.model.result import PlannerResult, PlannerResultStatus
 
 
@@ -627,3 +629,127 @@ class TestDatabase:
         )
 
         assert result is None
+
+    def test_fingerprint(self, tmp_path, result_mock):
+        previous = TyrPaths().db
+        TyrPaths().db = tmp_path / "db.sqlite3"
+        Database.clear_singleton()
+        try:
+            assert Database().fingerprint() == (str(TyrPaths().db), 0, 0)
+            result_mock.planner_name = "planner"
+            result_mock.problem.name = "domain:1"
+            result_mock.status = PlannerResultStatus.SOLVED
+            result_mock.computation_time = 1.5
+            result_mock.plan_quality = 3
+            result_mock.error_message = ""
+            result_mock.config.jobs = 1
+            result_mock.config.memout = 1024
+            Database()._save_planner_result(result_mock)
+            Database()._save_planner_result(result_mock)
+            assert Database().fingerprint() == (str(TyrPaths().db), 2, 2)
+        finally:
+            TyrPaths().db = previous
+            Database.clear_singleton()
+
+    def test_virtual_results(self, tmp_path):
+        previous = TyrPaths().db
+        TyrPaths().db = tmp_path / "db.sqlite3"
+        Database.clear_singleton()
+        try:
+            config = SolveConfig(1, 1024, 100, 0, False, False, False, False)
+            problem = MagicMock()
+            problem.name = "domain:1"
+            members = [
+                PlannerResult(
+                    name,
+                    problem,
+                    RunningMode.ANYTIME,
+                    PlannerResultStatus.SOLVED,
+                    config,
+                )
+                for name in ["b", "a"]
+            ]
+            vbs = PlannerResult(
+                "vbs",
+                problem,
+                RunningMode.ANYTIME,
+                PlannerResultStatus.SOLVED,
+                config,
+                2.5,
+                3,
+                solutions=((1.0, 8.0), (2.5, 3.0)),
+            )
+            assert Database().last_result_id(["a", "b"]) == 0
+            Database()._save_planner_result(members[0])
+            assert Database().last_result_id(["a", "b"]) == 1
+            assert Database().last_result_id(["a"]) == 0
+
+            Database().save_virtual_results(["b", "a"], 1, [vbs])
+            Database().save_virtual_results(["b", "a"], 1, [vbs])
+            loaded = Database().load_virtual_results("vbs", ["a", "b"], 1, members)
+            assert loaded == [replace(vbs, from_database=True)]
+            assert not Database().load_virtual_results("vws", ["a", "b"], 1, members)
+            assert not Database().load_virtual_results("vbs", ["a"], 1, members)
+            assert not Database().load_virtual_results("vbs", ["a", "b"], 2, members)
+            assert Database().fingerprint()[1] == 1
+
+            Database().save_virtual_results(
+                ["a", "b"], 2, [replace(vbs, plan_quality=4)]
+            )
+            assert not Database().load_virtual_results("vbs", ["a", "b"], 1, members)
+            loaded = Database().load_virtual_results("vbs", ["a", "b"], 2, members)
+            assert [r.plan_quality for r in loaded] == [4]
+        finally:
+            TyrPaths().db = previous
+            Database.clear_singleton()
+
+    def test_load_anytime_solutions(self, tmp_path):
+        previous = TyrPaths().db
+        TyrPaths().db = tmp_path / "db.sqlite3"
+        Database.clear_singleton()
+        try:
+            config = SolveConfig(1, 1024, 100, 0, False, False, False, False)
+            problem = MagicMock()
+            problem.name = "domain:1"
+            for computation, quality in [(1.5, 9), (4, 7), (30, 5)]:
+                Database()._save_planner_result(
+                    PlannerResult(
+                        "planner",
+                        problem,
+                        RunningMode.ANYTIME,
+                        PlannerResultStatus.SOLVED,
+                        config,
+                        computation,
+                        quality,
+                    )
+                )
+            result = Database().load_planner_result(
+                "planner", problem, config, RunningMode.ANYTIME
+            )
+            assert result.plan_quality == 5
+            assert result.solutions == ()
+            oneshot = Database().load_planner_result(
+                "planner", problem, config, RunningMode.ONESHOT
+            )
+            assert oneshot is None
+
+            other = MagicMock()
+            other.name = "domain:2"
+            timeout = PlannerResult.timeout(
+                other, "planner", config, RunningMode.ANYTIME
+            )
+            oneshot = PlannerResult.timeout(
+                problem, "planner", config, RunningMode.ONESHOT
+            )
+            with patch.object(
+                Database(), "database", wraps=Database().database
+            ) as database:
+                loaded = Database().load_anytime_solutions([result, timeout, oneshot])
+            assert database.call_count == 1
+            assert loaded[0].solutions == ((1.5, 9), (4, 7), (30, 5))
+            assert loaded[0].quality_curve() == [(1.5, 9), (4, 7), (30, 5)]
+            assert loaded[1:] == [timeout, oneshot]
+            assert Database().load_anytime_solutions([timeout]) == [timeout]
+        finally:
+            TyrPaths().db = previous
+            Database.clear_singleton()
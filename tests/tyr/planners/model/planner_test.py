@@ -310,6 +310,35 @@ class TestPlanner(ModelTest):
             save_mock.assert_has_calls([first_call, final_call])
             assert save_mock.call_count == 2
 
+    def test_solve_anytime_solutions(
+        self,
+        mock_planner: Planner,
+        problem: ProblemInstance,
+        solve_config: SolveConfig,
+    ):
+        solve_config = replace(solve_config, no_db_save=True)
+        results = [
+            PlannerResult(
+                mock_planner.name,
+                problem,
+                RunningMode.ANYTIME,
+                PlannerResultStatus.SOLVED,
+                solve_config,
+                computation_time,
+                quality,
+            )
+            for computation_time, quality in [(1, 8), (3, 5), (3, 5)]
+        ]
+        mock_planner._solve.return_value = results
+        solved = list(
+            Planner.solve(mock_planner, problem, solve_config, RunningMode.ANYTIME)
+        )
+        assert [r.solutions for r in solved] == [
+            ((1, 8),),
+            ((1, 8), (3, 5)),
+            ((1, 8), (3, 5)),
+        ]
+
     # =================================== Solve ================================== #
 
     @pytest.mark.parametrize(
@@ -382,6 +411,17 @@ class TestPlanner(ModelTest):
             result = list(planner.solve(problem, solve_config, RunningMode.ONESHOT))[-1]
         assert result == expected
 
+    def test_solve_error_planner_memout(
+        self,
+        problem: ProblemInstance,
+        solve_config: SolveConfig,
+    ):
+        planner = Planner(replace(self.config(), memout=1024))
+        with patch.object(planner, "_solve", side_effect=RuntimeError):
+            result = list(planner.solve(problem, solve_config, RunningMode.ONESHOT))[-1]
+        assert result.status == PlannerResultStatus.ERROR
+        assert result.config == replace(solve_config, memout=1024)
+
     @patch("builtins.open")
     @patch("unified_planning.shortcuts.OneshotPlanner", autospec=True)
     def test_solve_error_write_in_logs(
@@ -474,6 +514,25 @@ class TestPlanner(ModelTest):
             resource.RLIMIT_AS, (memout, resource.RLIM_INFINITY)
         )
 
+    @patch("resource.setrlimit")
+    def test_solve_planner_memout(
+        self,
+        mock_resource: Mock,
+        problem: ProblemInstance,
+        solve_config: SolveConfig,
+    ):
+        planner = Planner(replace(self.config(), memout=1024))
+        list(planner.solve(problem, solve_config, RunningMode.ONESHOT))[-1]
+        mock_resource.assert_called_once_with(
+            resource.RLIMIT_AS, (1024, resource.RLIM_INFINITY)
+        )
+
+    def test_get_solve_config(self, planner: Planner, solve_config: SolveConfig):
+        assert planner.get_solve_config(solve_config) == solve_config
+        planner = Planner(replace(self.config(), memout=1024))
+        expected = replace(solve_config, memout=1024)
+        assert planner.get_solve_config(solve_config) == expected
+
     @patch("unified_planning.shortcuts.OneshotPlanner", autospec=True)
     def test_solve_skip_checks(
         self,
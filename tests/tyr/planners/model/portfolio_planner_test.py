@@ -0,0 +1,170 @@
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tyr import (
+    AbstractDomain,
+    Planner,
+    PlannerConfig,
+    PlannerResult,
+    PortfolioPlanner,
+    ProblemInstance,
+    SolveConfig,
+)
+from tyr.core.paths import TyrPaths
+from tyr.planners.database import Database
+from tyr.planners.model.config import RunningMode
+from tyr.planners.model.result import PlannerResultStatus
+
+
+class PortfoliodomainDomain(AbstractDomain):
+    def build_problem_base(self, problem: ProblemInstance):
+        result = MagicMock()
+        result.uid = problem.uid
+        return result
+
+
+class RacerPlanner(Planner):
+    """A planner yielding predefined results after some delays."""
+
+    def __init__(
+        self,
+        name: str,
+        steps: List[Tuple[float, PlannerResultStatus, Optional[float]]],
+        anytime: bool = True,
+    ) -> None:
+        super().__init__(
+            PlannerConfig(name, anytime_name=None if anytime else "unsupported-mode")
+        )
+        self._steps = steps
+
+    def _solve(self, problem, config, running_mode):
+        for delay, status, quality in self._steps:
+            time.sleep(delay)
+            yield PlannerResult(
+                self.name, problem, running_mode, status, config, delay, quality
+            )
+
+
+class TestPortfolioPlanner:
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def logs(tmp_path: Path):
+        previous = TyrPaths().logs
+        TyrPaths().logs = tmp_path / "logs"
+        yield TyrPaths().logs
+        TyrPaths().logs = previous
+
+    @staticmethod
+    @pytest.fixture()
+    def problem():
+        yield PortfoliodomainDomain().get_problem(1)
+
+    @staticmethod
+    @pytest.fixture()
+    def solve_config():
+        yield SolveConfig(
+            jobs=1,
+            memout=4 * 1024 * 1024 * 1024,  # 4GB
+            timeout=2,
+            timeout_offset=0,
+            db_only=False,
+            no_db_load=True,
+            no_db_save=True,
+            unify_epsilons=False,
+        )
+
+    @staticmethod
+    def portfolio(*members: Planner) -> PortfolioPlanner:
+        config = PlannerConfig("portfolio", portfolio=[m.name for m in members])
+        return PortfolioPlanner(config, list(members))
+
+    # ================================ Properties ================================ #
+
+    def test_members(self):
+        members = [RacerPlanner("a", []), RacerPlanner("b", [])]
+        assert self.portfolio(*members).members == members
+
+    def test_name_includes_sorted_members(self):
+        portfolio = self.portfolio(RacerPlanner("b", []), RacerPlanner("a", []))
+        assert portfolio.name == "portfolio@a,b"
+        assert portfolio.name != self.portfolio(RacerPlanner("a", [])).name
+
+    def test_supports_running_mode(self):
+        oneshot_only = RacerPlanner("a", [], anytime=False)
+        portfolio = self.portfolio(oneshot_only)
+        assert portfolio.supports_running_mode(RunningMode.ONESHOT)
+        assert not portfolio.supports_running_mode(RunningMode.ANYTIME)
+        portfolio = self.portfolio(oneshot_only, RacerPlanner("b", []))
+        assert portfolio.supports_running_mode(RunningMode.ANYTIME)
+
+    def test_get_version(self, problem: ProblemInstance):
+        unsupported = RacerPlanner("a", [])
+        unsupported.config.problems["portfoliodomain"] = "inexistant"
+        portfolio = self.portfolio(unsupported, RacerPlanner("b", []))
+        name, version = portfolio.get_version(problem)
+        assert name == "base"
+        assert version.uid == problem.uid
+
+    # =================================== Race =================================== #
+
+    def test_oneshot_first_solved_wins(self, problem, solve_config):
+        solved = PlannerResultStatus.SOLVED
+        portfolio = self.portfolio(
+            RacerPlanner("slow", [(30, solved, 1)]),
+            RacerPlanner("fast", [(0.2, solved, 10)]),
+        )
+        start = time.time()
+        result = portfolio.solve_single(problem, solve_config, RunningMode.ONESHOT)
+        assert time.time() - start < 5
+        assert result.planner_name == "portfolio@fast,slow"
+        assert result.status == PlannerResultStatus.SOLVED
+        assert result.plan_quality == 10
+        assert result.computation_time < 2
+
+    def test_oneshot_failures(self, problem, solve_config):
+        portfolio = self.portfolio(
+            RacerPlanner("error", [(0, PlannerResultStatus.ERROR, None)]),
+            RacerPlanner("unsolvable", [(0.1, PlannerResultStatus.UNSOLVABLE, None)]),
+        )
+        result = portfolio.solve_single(problem, solve_config, RunningMode.ONESHOT)
+        assert result.status == PlannerResultStatus.UNSOLVABLE
+
+    def test_oneshot_timeout(self, problem, solve_config):
+        solve_config = replace(solve_config, timeout=1)
+        portfolio = self.portfolio(
+            RacerPlanner("slow", [(30, PlannerResultStatus.SOLVED, 1)]),
+        )
+        start = time.time()
+        result = portfolio.solve_single(problem, solve_config, RunningMode.ONESHOT)
+        assert time.time() - start < 5
+        assert result.status == PlannerResultStatus.TIMEOUT
+
+    def test_anytime_best_quality(self, problem, solve_config):
+        solved = PlannerResultStatus.SOLVED
+        portfolio = self.portfolio(
+            RacerPlanner("a", [(0.1, solved, 10), (0.3, solved, 4), (30, solved, 1)]),
+            RacerPlanner("b", [(0.2, solved, 6), (0.1, solved, 8)]),
+        )
+        results = list(portfolio.solve(problem, solve_config, RunningMode.ANYTIME))
+        assert [r.plan_quality for r in results] == [10, 6, 4]
+        assert all(r.status == PlannerResultStatus.SOLVED for r in results)
+
+    def test_unsupported(self, problem, solve_config):
+        portfolio = self.portfolio(RacerPlanner("a", [], anytime=False))
+        result = portfolio.solve_single(problem, solve_config, RunningMode.ANYTIME)
+        assert result.status == PlannerResultStatus.UNSUPPORTED
+
+    # ================================= Database ================================= #
+
+    def test_database_result(self, problem, solve_config):
+        solve_config = replace(solve_config, no_db_load=False)
+        portfolio = self.portfolio(RacerPlanner("a", []))
+        with patch.object(Database(), "load_planner_result") as load_mock:
+            result = portfolio.solve_single(problem, solve_config, RunningMode.ONESHOT)
+            assert result == load_mock.return_value
+            assert load_mock.call_args.args[0] == "portfolio@a"
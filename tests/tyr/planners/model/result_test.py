@@ -188,6 +188,7 @@ class TestPlannerResult:
         assert merged_result.computation_time == 5.0
         assert merged_result.plan_quality == 0.5
         assert merged_result.status == PlannerResultStatus.SOLVED
+        assert merged_result.quality_curve() == [(5.0, 0.8), (10.0, 0.5)]
 
     def test_merge_different_config(self):
         result1 = PlannerResult(
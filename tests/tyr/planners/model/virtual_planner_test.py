@@ -0,0 +1,139 @@
+import pytest
+
+from tyr import Planner, PlannerConfig, PlannerResult, SolveConfig
+from tyr.planners.model.config import RunningMode
+from tyr.planners.model.result import PlannerResultStatus
+from tyr.planners.model.virtual_planner import (
+    VIRTUAL_BEST_NAME,
+    VIRTUAL_WORST_NAME,
+    synthesize_virtual_results,
+    virtual_planners,
+)
+
+CONFIG = SolveConfig(1, 1, 300, 0, False, False, False, False)
+SOLVED = PlannerResultStatus.SOLVED
+TIMEOUT = PlannerResultStatus.TIMEOUT
+NOT_RUN = PlannerResultStatus.NOT_RUN
+ERROR = PlannerResultStatus.ERROR
+MEMOUT = PlannerResultStatus.MEMOUT
+UNSOLVABLE = PlannerResultStatus.UNSOLVABLE
+UNSUPPORTED = PlannerResultStatus.UNSUPPORTED
+
+
+def result(planner, problem, status, time=None, quality=None, **kwargs):
+    mode = kwargs.pop("mode", RunningMode.ONESHOT)
+    return PlannerResult(
+        planner, problem, mode, status, CONFIG, time, quality, **kwargs
+    )
+
+
+class TestVirtualPlanner:
+    @staticmethod
+    @pytest.fixture()
+    def planners():
+        members = [Planner(PlannerConfig(name)) for name in ["a", "b", "c"]]
+        yield virtual_planners(members[:2])
+
+    def test_names(self, planners):
+        best, worst = planners
+        assert best.name == VIRTUAL_BEST_NAME and best.best
+        assert worst.name == VIRTUAL_WORST_NAME and not worst.best
+        assert [m.name for m in best.members] == ["a", "b"]
+
+    def test_is_not_a_planner(self, planners):
+        assert not any(isinstance(p, Planner) for p in planners)
+
+    def test_all_solved(self, planners):
+        best, worst = planners
+        results = [result("a", "p", SOLVED, 1, 9), result("b", "p", SOLVED, 5, 4)]
+        vbs, vws = best.combine(results), worst.combine(results)
+        assert (vbs.planner_name, vbs.status) == (VIRTUAL_BEST_NAME, SOLVED)
+        assert (vbs.computation_time, vbs.plan_quality) == (1, 4)
+        assert (vws.planner_name, vws.status) == (VIRTUAL_WORST_NAME, SOLVED)
+        assert (vws.computation_time, vws.plan_quality) == (5, 9)
+        assert vbs.solutions == vws.solutions == ()
+
+    def test_some_solved(self, planners):
+        best, worst = planners
+        results = [result("a", "p", TIMEOUT), result("b", "p", SOLVED, 5, 4)]
+        vbs, vws = best.combine(results), worst.combine(results)
+        assert (vbs.status, vbs.computation_time, vbs.plan_quality) == (SOLVED, 5, 4)
+        assert (vws.status, vws.computation_time, vws.plan_quality) == (
+            TIMEOUT,
+            None,
+            None,
+        )
+
+    def test_none_solved(self, planners):
+        best, worst = planners
+        results = [
+            result("a", "p", PlannerResultStatus.MEMOUT),
+            result("b", "p", PlannerResultStatus.UNSOLVABLE),
+        ]
+        assert best.combine(results).status == PlannerResultStatus.UNSOLVABLE
+        assert worst.combine(results).status == PlannerResultStatus.MEMOUT
+
+    @pytest.mark.parametrize(
+        "statuses, expected",
+        [
+            ((ERROR, TIMEOUT), (TIMEOUT, ERROR)),
+            ((MEMOUT, TIMEOUT), (TIMEOUT, MEMOUT)),
+            ((ERROR, MEMOUT), (MEMOUT, ERROR)),
+            ((UNSOLVABLE, TIMEOUT), (UNSOLVABLE, TIMEOUT)),
+        ],
+    )
+    def test_failures_are_ranked(self, planners, statuses, expected):
+        best, worst = planners
+        results = [result(n, "p", s) for n, s in zip(["a", "b"], statuses)]
+        assert (best.combine(results).status, worst.combine(results).status) == expected
+
+    def test_unsupported_is_missing(self, planners):
+        best, worst = planners
+        results = [result("a", "p", UNSUPPORTED), result("b", "p", TIMEOUT)]
+        assert best.combine(results).status == TIMEOUT
+        assert worst.combine(results).status == TIMEOUT
+        results = [result("a", "p", UNSUPPORTED), result("b", "p", SOLVED, 1, 1)]
+        assert best.combine(results).status == SOLVED
+        assert worst.combine(results).status == NOT_RUN
+        results = [result("a", "p", UNSUPPORTED), result("b", "p", UNSUPPORTED)]
+        assert best.combine(results).status == UNSUPPORTED
+        assert worst.combine(results).status == UNSUPPORTED
+
+    def test_missing_member(self, planners):
+        best, worst = planners
+        results = [result("a", "p", SOLVED, 1, 9)]
+        vbs, vws = best.combine(results), worst.combine(results)
+        assert (vbs.status, vbs.computation_time, vbs.plan_quality) == (SOLVED, 1, 9)
+        assert vws.status == NOT_RUN
+
+    def test_anytime_solutions(self, planners):
+        best, worst = planners
+        anytime = RunningMode.ANYTIME
+        results = [
+            result("a", "p", SOLVED, 20, 5, mode=anytime, solutions=((1, 9), (20, 5))),
+            result("b", "p", SOLVED, 8, 6, mode=anytime, solutions=((4, 7), (8, 6))),
+        ]
+        vbs, vws = best.combine(results), worst.combine(results)
+        assert vbs.quality_curve() == [(1, 9), (4, 7), (8, 6), (20, 5)]
+        assert vws.quality_curve() == [(20, 6)]
+
+    def test_synthesize(self, planners):
+        results = [
+            result("a", "p1", SOLVED, 1, 9),
+            result("b", "p1", TIMEOUT),
+            result("c", "p1", SOLVED, 0.5, 1),
+            result("a", "p1", SOLVED, 2, 3, mode=RunningMode.ANYTIME),
+            result("c", "p2", SOLVED, 1, 1),
+        ]
+        synthesized = synthesize_virtual_results(planners, results)
+        assert [(r.planner_name, r.problem, r.running_mode) for r in synthesized] == [
+            (VIRTUAL_BEST_NAME, "p1", RunningMode.ONESHOT),
+            (VIRTUAL_BEST_NAME, "p1", RunningMode.ANYTIME),
+            (VIRTUAL_WORST_NAME, "p1", RunningMode.ONESHOT),
+            (VIRTUAL_WORST_NAME, "p1", RunningMode.ANYTIME),
+        ]
+        assert [r.status for r in synthesized] == [SOLVED, SOLVED, TIMEOUT, NOT_RUN]
+        assert synthesized[0].plan_quality == 9
+
+    def test_synthesize_without_planners(self):
+        assert not synthesize_virtual_results([], [result("a", "p", SOLVED, 1, 1)])
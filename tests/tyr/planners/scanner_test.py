@@ -1,8 +1,18 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import tests.tyr.planners.fixtures.configuration as config_module
-from tyr import Planner, PlannerConfig, get_all_planner_configs, get_all_planners
+import tyr.planners.scanner as scanner
+from tyr import (
+    Planner,
+    PlannerConfig,
+    PortfolioPlanner,
+    get_all_planner_configs,
+    get_all_planners,
+    get_planner,
+)
 
 
 class TestScanner:
@@ -56,6 +66,13 @@ class TestScanner:
         get_all_planner_configs()
         mock_open.assert_called_once_with(file, "r", encoding="utf-8")
 
+    @pytest.mark.parametrize("name", ["vbs", "vws"])
+    @patch("tyr.planners.scanner.load_config")
+    def test_get_all_planner_configs_reserved_name(self, mocked_config, name):
+        mocked_config.return_value = [{"name": "a"}, {"name": name}]
+        with pytest.raises(ValueError, match=name):
+            get_all_planner_configs()
+
     def test_get_all_planner_configs_real(self):
         # Check no crash
         get_all_planner_configs()
@@ -70,3 +87,27 @@ class TestScanner:
     def test_get_all_planners_real(self):
         # Check no crash
         get_all_planners()
+
+    @patch("tyr.configuration")
+    def test_get_planner_mocked(self, mocked_module):
+        mocked_module.__path__ = config_module.__path__
+        scanner._planners_cache.clear()  # pylint: disable = protected-access
+        try:
+            planner = get_planner("mock-planner")
+            assert planner.config.env == {"MY_ENV_PARAM": "bar", "MY_BOOL_PARAM": True}
+            assert get_planner("mock-planner") is planner
+            assert get_planner("unknown") is None
+        finally:
+            scanner._planners_cache.clear()  # pylint: disable = protected-access
+
+    @patch("tyr.planners.scanner.get_all_planner_configs")
+    def test_get_all_planners_portfolio(self, mocked_configs):
+        mocked_configs.return_value = [
+            PlannerConfig(name="a"),
+            PlannerConfig(name="b"),
+            PlannerConfig(name="race", portfolio=["a", "b"]),
+        ]
+        planners = {p.name: p for p in get_all_planners()}
+        assert isinstance(planners["race@a,b"], PortfolioPlanner)
+        assert planners["race@a,b"].members == [planners["a"], planners["b"]]
+        assert not isinstance(planners["a"], PortfolioPlanner)
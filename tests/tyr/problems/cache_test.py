@@ -0,0 +1,138 @@
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from unified_planning.io import PDDLReader
+
+from tyr.core.paths import TyrPaths
+from tyr.problems.cache import ProblemCache
+
+FILES_PATH = Path(__file__).parents[2] / "integration" / "problems"
+
+
+class TestProblemCache:
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def cache_folder(tmp_path: Path):
+        previous = TyrPaths().cache
+        TyrPaths().cache = tmp_path
+        ProblemCache().enabled = True
+        yield tmp_path / "problems"
+        TyrPaths().cache = previous
+        ProblemCache().enabled = False
+
+    @staticmethod
+    @pytest.fixture(params=["hddl", "pddl"])
+    def files(request):
+        folder = FILES_PATH / request.param
+        yield (
+            folder / f"instance-1.{request.param}",
+            folder / f"domain.{request.param}",
+        )
+
+    @staticmethod
+    def parser(problem_file: Path, domain_file: Path) -> Mock:
+        return Mock(
+            side_effect=lambda: PDDLReader().parse_problem(
+                domain_file.as_posix(), problem_file.as_posix()
+            )
+        )
+
+    def test_singleton(self):
+        assert ProblemCache() is ProblemCache()
+
+    def test_folder(self, cache_folder: Path):
+        assert ProblemCache().folder == cache_folder
+
+    # ==================================== Key =================================== #
+
+    def test_key_is_stable(self, files):
+        assert ProblemCache().get_key(*files) == ProblemCache().get_key(*files)
+
+    def test_key_depends_on_files(self):
+        domain = FILES_PATH / "pddl" / "domain.pddl"
+        key_1 = ProblemCache().get_key(FILES_PATH / "pddl" / "instance-1.pddl", domain)
+        key_2 = ProblemCache().get_key(FILES_PATH / "pddl" / "instance-2.pddl", domain)
+        assert key_1 != key_2
+
+    def test_key_depends_on_content(self, tmp_path: Path, files):
+        problem_file, domain_file = files
+        copy = tmp_path / problem_file.name
+        copy.write_text(problem_file.read_text())
+        key = ProblemCache().get_key(copy, domain_file)
+        assert key == ProblemCache().get_key(problem_file, domain_file)
+        copy.write_text(problem_file.read_text() + "\n; modified\n")
+        assert key != ProblemCache().get_key(copy, domain_file)
+
+    def test_version_key(self, tmp_path: Path):
+        source = tmp_path / "source.py"
+        source.write_text("first")
+        problem = MagicMock()
+        problem.name = "domain:1"
+        problem.domain.get_source_files.return_value = [source]
+        key = ProblemCache().get_version_key(problem, "base")
+        assert key is not None
+        assert key == ProblemCache().get_version_key(problem, "base")
+        assert key != ProblemCache().get_version_key(problem, "other")
+        source.write_text("second")
+        assert key != ProblemCache().get_version_key(problem, "base")
+
+    def test_version_key_unknown_sources(self, tmp_path: Path):
+        problem = MagicMock()
+        problem.domain.get_source_files.return_value = []
+        assert ProblemCache().get_version_key(problem, "base") is None
+        problem.domain.get_source_files.return_value = [tmp_path / "absent.py"]
+        assert ProblemCache().get_version_key(problem, "base") is None
+
+    # ================================== Access ================================== #
+
+    def test_load_absent(self):
+        assert ProblemCache().load("absent") is None
+
+    def test_load_corrupted(self, cache_folder: Path):
+        cache_folder.mkdir(parents=True)
+        ProblemCache().get_path("corrupted").write_bytes(b"not a problem")
+        assert ProblemCache().load("corrupted") is None
+
+    def test_save_and_load(self, files):
+        problem = self.parser(*files)()
+        key = ProblemCache().get_key(*files)
+        assert ProblemCache().save(key, problem)
+        assert ProblemCache().get_path(key).exists()
+        assert ProblemCache().load(key) == problem
+
+    def test_get_or_parse(self, files):
+        parse = self.parser(*files)
+        first = ProblemCache().get_or_parse(*files, parse)
+        second = ProblemCache().get_or_parse(*files, parse)
+        assert parse.call_count == 1
+        assert first == second
+
+    def test_get_or_parse_unsaved(self, files):
+        parse = Mock(return_value=object())
+        ProblemCache().get_or_parse(*files, parse)
+        ProblemCache().get_or_parse(*files, parse)
+        assert parse.call_count == 2
+
+    def test_disabled(self, files):
+        ProblemCache().enabled = False
+        parse = self.parser(*files)
+        ProblemCache().get_or_parse(*files, parse)
+        ProblemCache().get_or_parse(*files, parse)
+        assert parse.call_count == 2
+        assert not ProblemCache().folder.exists()
+
+    def test_get_or_build_none(self):
+        build = Mock(return_value=None)
+        assert ProblemCache().get_or_build("key", build) is None
+        assert not ProblemCache().get_path("key").exists()
+
+    # ================================ Management ================================ #
+
+    def test_clear_empty(self):
+        assert ProblemCache().clear() == 0
+
+    def test_clear(self, files):
+        ProblemCache().get_or_parse(*files, self.parser(*files))
+        assert ProblemCache().clear() == 1
+        assert list(ProblemCache().folder.iterdir()) == []
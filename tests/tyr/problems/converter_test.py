@@ -1,12 +1,32 @@
+import os
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 import unified_planning.model.htn.task
+from unified_planning.exceptions import UPProblemDefinitionError
 from unified_planning.io import PDDLReader
-from unified_planning.shortcuts import Problem
+from unified_planning.model.scheduling import SchedulingProblem
+from unified_planning.shortcuts import (
+    LE,
+    BoolType,
+    Fluent,
+    InstantaneousAction,
+    IntType,
+    Not,
+    Plus,
+    Problem,
+    StartTiming,
+    UserType,
+)
 
-from tyr import get_goals, goals_to_tasks
+from tyr import get_goals, goals_to_tasks, reduce_problems, reduce_version
+from tyr.problems.converter import (
+    _get_hier_template,
+    reduce_problem,
+    remove_user_typing,
+    scheduling_to_actions,
+)
 
 
 @pytest.fixture(scope="module")
@@ -77,3 +97,186 @@ class TestConverter:
         assert len(base_problem[1].goals) > 0
         goals_to_tasks(base_problem[1], hier_domain, mapping)
         assert len(base_problem[1].goals) > 0
+
+    @pytest.mark.parametrize("base_problem", ["1"], indirect=True)
+    def test_goals_to_tasks_template_is_cached(
+        self, base_problem, hier_domain, mapping
+    ):
+        _get_hier_template.cache_clear()
+        first = goals_to_tasks(base_problem[1], hier_domain, mapping)
+        second = goals_to_tasks(base_problem[1], hier_domain, mapping)
+        info = _get_hier_template.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert first is not second
+        assert len(first.task_network.subtasks) == len(second.task_network.subtasks)
+
+    @pytest.mark.parametrize("base_problem", ["1"], indirect=True)
+    def test_goals_to_tasks_template_is_updated(
+        self, base_problem, hier_domain, mapping, tmp_path
+    ):
+        domain = tmp_path / "domain.hddl"
+        domain.write_text(hier_domain.read_text())
+        goals_to_tasks(base_problem[1], domain, mapping)
+        misses = _get_hier_template.cache_info().misses
+        os.utime(domain, ns=(0, 0))
+        goals_to_tasks(base_problem[1], domain, mapping)
+        assert _get_hier_template.cache_info().misses == misses + 1
+
+    @pytest.mark.parametrize("base_problem", ["1", "2", "3"], indirect=True)
+    def test_reduce_problems(self, base_problem):
+        problem = base_problem[1]
+        goals = problem.goals[:]
+        numbers = [0, 1, 2, 100]
+        result = reduce_problems(problem, numbers)
+        assert list(result.keys()) == numbers
+        for number, reduced in result.items():
+            assert reduced == reduce_problem(problem, number)
+            assert reduced.actions is problem.actions
+        assert problem.goals == goals
+
+    @pytest.mark.parametrize("base_problem", ["1"], indirect=True)
+    def test_reduce_problems_goals_are_independent(self, base_problem):
+        goals = get_goals(base_problem[1])
+        result = reduce_problems(base_problem[1], [0, len(goals)])
+        result[0].add_goal(goals[0])
+        assert len(result[0].goals) == 1
+        assert len(result[len(goals)].goals) == len(goals)
+        assert len(get_goals(base_problem[1])) == len(goals)
+
+    @pytest.mark.parametrize("base_problem", ["1"], indirect=True)
+    def test_reduce_version(self, base_problem):
+        problem = Mock()
+        problem.versions = {"base": Mock(value=base_problem[1])}
+        with patch.object(type(base_problem[1]), "clone") as clone:
+            reduced = reduce_version(problem, "base", 1)
+            assert clone.call_count == 0
+        assert reduced == reduce_problem(base_problem[1], 1)
+        assert reduced.actions is base_problem[1].actions
+        problem.versions["base"].value = None
+        assert reduce_version(problem, "base", 1) is None
+
+
+class TestRemoveUserTyping:
+    @staticmethod
+    @pytest.fixture()
+    def typed_problem():
+        location = UserType("location")
+        robot = UserType("robot", location)
+        at = Fluent("at", BoolType(), r=robot, l=location)
+        move = InstantaneousAction("move", r=robot, a=location, b=location)
+        r, a, b = move.parameters
+        move.add_precondition(at(r, a))
+        move.add_precondition(Not(at(r, b)))
+        move.add_effect(at(r, a), False)
+        move.add_effect(at(r, b), True)
+
+        problem = Problem("typed")
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_action(move)
+        l1 = problem.add_object("l1", location)
+        r1 = problem.add_object("r1", robot)
+        problem.set_initial_value(at(r1, l1), True)
+        problem.add_goal(at(r1, r1))
+        yield problem
+
+    def test_objects_are_untyped(self, typed_problem):
+        result = remove_user_typing(typed_problem)
+        obj_tpe = result.user_type("tyr_object")
+        assert all(o.type == obj_tpe for o in result.all_objects)
+        is_location = result.fluent("is_location")
+        is_robot = result.fluent("is_robot")
+        assert result.initial_value(is_location(result.object("r1"))).is_true()
+        assert result.initial_value(is_robot(result.object("r1"))).is_true()
+        assert result.initial_value(is_location(result.object("l1"))).is_true()
+        assert result.initial_value(is_robot(result.object("l1"))) is None
+
+    def test_initial_values_are_kept(self, typed_problem):
+        result = remove_user_typing(typed_problem)
+        at = result.fluent("at")
+        r1, l1 = result.object("r1"), result.object("l1")
+        assert result.initial_value(at(r1, l1)).is_true()
+        assert result.initial_value(at(r1, r1)).is_false()
+
+    def test_parameters_are_shared(self, typed_problem):
+        result = remove_user_typing(typed_problem)
+        move = result.action("move")
+        params = {p.name: p for p in move.parameters}
+        at_args = [
+            arg.parameter()
+            for pre in move.preconditions
+            for fluent_exp in pre.environment.free_vars_extractor.get(pre)
+            for arg in fluent_exp.args
+            if fluent_exp.fluent().name == "at"
+        ]
+        assert len(at_args) > 0
+        assert all(params[p.name] == p for p in at_args)
+
+    def test_deep_expression(self):
+        value = Fluent("value", IntType())
+        problem = Problem("deep")
+        problem.add_fluent(value, default_initial_value=0)
+        action = InstantaneousAction("deep")
+        expression = value()
+        for _ in range(5000):
+            expression = Plus(expression, 1)
+        action.add_precondition(LE(expression, 10))
+        problem.add_action(action)
+        problem.add_goal(LE(value(), 1))
+
+        result = remove_user_typing(problem)
+        assert len(result.action("deep").preconditions) == 1
+
+
+class TestSchedulingToActions:
+    @staticmethod
+    @pytest.fixture()
+    def scheduling_problem():
+        problem = SchedulingProblem("jobshop")
+        machine = problem.add_resource("machine", capacity=1)
+        first = problem.add_activity("first", duration=3)
+        second = problem.add_activity("second", duration=2)
+        first.uses(machine)
+        second.uses(machine)
+        problem.add_constraint(LE(first.end, second.start))
+        yield problem
+
+    def test_actions(self, scheduling_problem):
+        result = scheduling_to_actions(scheduling_problem)
+        assert [a.name for a in result.actions] == ["first", "second"]
+        assert [f.name for f in result.fluents] == [
+            "machine",
+            "first_pres",
+            "second_pres",
+        ]
+        for fluent in result.fluents[1:]:
+            assert result.fluents_defaults[fluent].is_false()
+            assert fluent() in result.goals
+
+    def test_constraints(self, scheduling_problem):
+        result = scheduling_to_actions(scheduling_problem)
+        first_pres = result.fluent("first_pres")
+        second_start = [
+            c
+            for interval, conditions in result.action("second").conditions.items()
+            for c in conditions
+            if interval.lower == StartTiming()
+        ]
+        first_start = [
+            c
+            for interval, conditions in result.action("first").conditions.items()
+            for c in conditions
+            if interval.lower == StartTiming()
+        ]
+        assert first_pres() in second_start
+        assert first_pres() not in first_start
+
+    def test_plain_problem(self, scheduling_problem):
+        result = scheduling_to_actions(scheduling_problem)
+        assert type(result) is Problem  # pylint: disable = unidiomatic-typecheck
+        assert not result.has_name("third")
+        assert result.has_name("first") and result.has_name("first_pres")
+
+    def test_name_clash(self, scheduling_problem):
+        scheduling_problem.add_fluent("second_pres", default_initial_value=False)
+        with pytest.raises(UPProblemDefinitionError):
+            scheduling_to_actions(scheduling_problem)
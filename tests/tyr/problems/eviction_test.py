@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import pytest
+from unified_planning.shortcuts import BoolType, Fluent, Problem
+
+from tyr.patterns import Lazy
+from tyr.problems.eviction import (
+    ELEMENT_SIZE,
+    EvictableLazy,
+    VersionEvictor,
+    estimate_size,
+)
+
+
+class TestVersionEvictor:
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def evictor():
+        VersionEvictor().budget = None
+        yield VersionEvictor()
+        VersionEvictor().budget = None
+
+    @staticmethod
+    def touch(evictor: VersionEvictor, lazy: Lazy, size: int = 10):
+        assert lazy.value is not None
+        evictor.touch(lazy, lambda: size)
+
+    def test_singleton(self):
+        assert VersionEvictor() is VersionEvictor()
+
+    def test_invalid_budget(self, evictor: VersionEvictor):
+        with pytest.raises(ValueError):
+            evictor.budget = 0
+
+    def test_no_budget(self, evictor: VersionEvictor):
+        lazies = [Lazy(MagicMock) for _ in range(3)]
+        for lazy in lazies:
+            self.touch(evictor, lazy)
+        assert len(evictor) == 0
+        assert evictor.used == 0
+
+    def test_lru_eviction(self, evictor: VersionEvictor):
+        evictor.budget = 25
+        first, second, third = Lazy(MagicMock), Lazy(MagicMock), Lazy(MagicMock)
+        self.touch(evictor, first)
+        self.touch(evictor, second)
+        self.touch(evictor, first)
+        self.touch(evictor, third)
+        assert len(evictor) == 2
+        assert evictor.used == 20
+        assert not second.is_built
+        assert first.is_built
+        assert third.is_built
+
+    def test_keeps_last_version(self, evictor: VersionEvictor):
+        evictor.budget = 5
+        lazy = Lazy(MagicMock)
+        self.touch(evictor, lazy, 10)
+        assert len(evictor) == 1
+        assert lazy.is_built
+
+    def test_budget_update_evicts(self, evictor: VersionEvictor):
+        evictor.budget = 100
+        lazies = [Lazy(MagicMock) for _ in range(5)]
+        for lazy in lazies:
+            self.touch(evictor, lazy)
+        evictor.budget = 20
+        assert evictor.used == 20
+        assert [not lazy.is_built for lazy in lazies] == [True] * 3 + [False] * 2
+
+    def test_clear(self, evictor: VersionEvictor):
+        evictor.budget = 100
+        lazy = Lazy(MagicMock)
+        self.touch(evictor, lazy)
+        evictor.clear()
+        assert len(evictor) == 0
+        assert evictor.used == 0
+        assert not lazy.is_built
+
+    # ============================== Evictable lazy ============================== #
+
+    def test_evicted_value_is_rebuilt(self, evictor: VersionEvictor):
+        evictor.budget = ELEMENT_SIZE
+        factories = [MagicMock(return_value=Problem(f"p{i}")) for i in range(2)]
+        first, second = [EvictableLazy(f) for f in factories]
+        assert first.value is factories[0].return_value
+        assert second.value is factories[1].return_value
+        assert not first.is_built
+        assert first.value is factories[0].return_value
+        assert factories[0].call_count == 2
+        assert not second.is_built
+
+    def test_none_value_is_not_tracked(self, evictor: VersionEvictor):
+        evictor.budget = 100
+        assert EvictableLazy(lambda: None).value is None
+        assert len(evictor) == 0
+
+    # =================================== Size =================================== #
+
+    def test_estimate_size(self):
+        problem = Problem("problem")
+        empty_size = estimate_size(problem)
+        assert empty_size == ELEMENT_SIZE
+        problem.add_fluent(Fluent("f", BoolType()), default_initial_value=False)
+        assert estimate_size(problem) > empty_size
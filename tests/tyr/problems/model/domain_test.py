@@ -1,3 +1,4 @@
+import inspect
 from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import MagicMock, Mock, patch
@@ -7,7 +8,13 @@ from pyparsing import ParseException
 from unified_planning.shortcuts import AbstractProblem
 
 from tests.utils import AbstractSingletonModelTest
-from tyr import AbstractDomain, Lazy, ProblemInstance
+from tyr import (
+    AbstractDomain,
+    FolderAbstractDomain,
+    Lazy,
+    ProblemCache,
+    ProblemInstance,
+)
 
 
 class MockDomainDomain(AbstractDomain):
@@ -29,6 +36,10 @@ class EmptyDomain(AbstractDomain):
     pass
 
 
+class FolderMockDomain(FolderAbstractDomain):
+    pass
+
+
 class TestAbstractDomain(AbstractSingletonModelTest):
     # ============================================================================ #
     #                                    Getters                                   #
@@ -128,6 +139,31 @@ class TestAbstractDomain(AbstractSingletonModelTest):
         problem = empty_domain.build_problem(problem_id)
         assert problem is None
 
+    @pytest.mark.parametrize("version", ["base", "no_speed"])
+    def test_build_problem_version_from_problem_cache(
+        self, domain: AbstractDomain, version: str
+    ):
+        cached = MagicMock()
+        ProblemCache().enabled = True
+        with patch.object(ProblemCache(), "load", return_value=cached) as load_mock:
+            problem = domain.build_problem(1)
+            assert problem.versions[version].value is cached
+            key = ProblemCache().get_version_key(problem, version)
+            load_mock.assert_called_once_with(key)
+
+    def test_build_problem_version_cache_disabled(self, domain: AbstractDomain):
+        with patch.object(ProblemCache(), "load") as load_mock:
+            problem = domain.build_problem(1)
+            assert problem.versions["base"].value is not None
+            load_mock.assert_not_called()
+
+    def test_get_source_files(self, domain: AbstractDomain):
+        source_files = domain.get_source_files(1)
+        assert Path(__file__) in source_files
+        # The helper modules imported by the domain module are listed too.
+        assert Path(inspect.getfile(AbstractSingletonModelTest)) in source_files
+        assert Path(inspect.getfile(AbstractDomain)) in source_files
+
     # =============================== Save to cache ============================== #
 
     @pytest.mark.parametrize("problem", [1, 5, -2], indirect=True)
@@ -367,3 +403,80 @@ class TestAbstractDomain(AbstractSingletonModelTest):
         assert (result is None) == is_none
         if not is_none:
             assert isinstance(result, AbstractProblem)
+
+
+class TestFolderAbstractDomain:
+    @staticmethod
+    @pytest.fixture()
+    def domain(tmp_path: Path):
+        (tmp_path / "instances").mkdir()
+        for uid in [1, 2, 10]:
+            (tmp_path / "instances" / f"instance-{uid}.pddl").write_text("")
+        (tmp_path / "domain.pddl").write_text("")
+        domain = FolderMockDomain()
+        domain.folder = tmp_path
+        domain._index = None
+        yield domain
+        domain._problems.clear()
+
+    def test_index(self, domain: FolderAbstractDomain, tmp_path: Path):
+        index = domain.index
+        assert index.suffix == ".pddl"
+        assert index.domain == tmp_path / "domain.pddl"
+        assert index.instances == {
+            uid: tmp_path / "instances" / f"instance-{uid}.pddl" for uid in [1, 2, 10]
+        }
+        assert index.domains == {}
+
+    def test_paths(self, domain: FolderAbstractDomain, tmp_path: Path):
+        assert domain.suffix == ".pddl"
+        assert domain.get_num_problems() == 3
+        assert (
+            domain.get_instance_path(10) == tmp_path / "instances" / "instance-10.pddl"
+        )
+        assert domain.get_domain_path(10) == tmp_path / "domain.pddl"
+
+    def test_specific_domains(self, domain: FolderAbstractDomain, tmp_path: Path):
+        (tmp_path / "domain.pddl").unlink()
+        (tmp_path / "domains").mkdir()
+        (tmp_path / "domains" / "domain-2.pddl").write_text("")
+        assert domain.get_domain_path(2) == tmp_path / "domains" / "domain-2.pddl"
+        assert domain.get_domain_path(3) == tmp_path / "domains" / "domain-3.pddl"
+
+    def test_get_data_files(self, domain: FolderAbstractDomain, tmp_path: Path):
+        (tmp_path / "hierarchical.hddl").write_text("")
+        domain._index = None
+        assert domain.get_data_files(2) == [
+            tmp_path / "domain.pddl",
+            tmp_path / "hierarchical.hddl",
+            tmp_path / "instances" / "instance-2.pddl",
+            tmp_path / "domain.pddl",
+        ]
+
+    def test_index_is_cached(self, domain: FolderAbstractDomain):
+        index = domain.index
+        with patch("os.scandir") as scandir_mock:
+            assert domain.index is index
+            assert domain.get_num_problems() == 3
+            scandir_mock.assert_not_called()
+
+    def test_index_is_not_checked_on_access(self, domain: FolderAbstractDomain):
+        index = domain.index
+        domain.get_source_files(2)
+        with patch("os.stat") as stat_mock:
+            assert domain.index is index
+            assert domain.suffix == ".pddl"
+            domain.get_instance_path(1)
+            domain.get_domain_path(1)
+            domain.get_source_files(1)
+            stat_mock.assert_not_called()
+
+    def test_index_is_refreshed(self, domain: FolderAbstractDomain, tmp_path: Path):
+        index = domain.index
+        domain.refresh()
+        assert domain.index is index
+        (tmp_path / "instances" / "instance-3.pddl").write_text("")
+        assert domain.get_num_problems() == 3
+        domain.refresh()
+        assert domain.index is not index
+        assert domain.get_num_problems() == 4
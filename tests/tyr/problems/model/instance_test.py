@@ -96,6 +96,15 @@ class TestProblemInstance(ModelTest):
             problem.get_quality_of_plan(plan, "base")
             mock_get_makespan.assert_called_once_with(plan, orig_version)
 
+    def test_get_quality_of_plan_unbuildable_version(
+        self, problem: ProblemInstance, plan: str
+    ):
+        factory = MagicMock(return_value=None)
+        problem._versions = {"base": Lazy(factory)}
+        assert problem.get_quality_of_plan(plan, "base") is None
+        assert problem.get_quality_of_plan(plan, "base") is None
+        factory.assert_called_once()
+
     def test_get_quality_of_plan_multiple_metrics(
         self, problem: ProblemInstance, plan: str
     ):
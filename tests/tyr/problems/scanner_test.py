@@ -1,8 +1,11 @@
 from unittest.mock import patch
 
+import pytest
+
 import tests.integration.problems as problem_module
+import tyr.problems.scanner as scanner
 from tests.integration.problems.domains import FakeDomain
-from tyr.problems import get_all_domains
+from tyr.problems import get_all_domains, get_domain, get_problem
 
 
 class TestUtils:
@@ -17,3 +20,33 @@ class TestUtils:
     def test_get_all_domains_real(self):
         # Check no crash
         get_all_domains()
+
+    @staticmethod
+    @pytest.fixture()
+    def mocked_domains():
+        scanner._domains_cache.clear()  # pylint: disable = protected-access
+        with patch("tyr.problems.domains") as mocked_module:
+            mocked_module.__path__ = problem_module.__path__
+            mocked_module.__name__ = problem_module.__name__
+            yield mocked_module
+        scanner._domains_cache.clear()  # pylint: disable = protected-access
+
+    def test_get_domain(self, mocked_domains):
+        assert get_domain("fake") is FakeDomain()
+        assert get_domain("unknown") is None
+
+    def test_get_domain_scans_once(self, mocked_domains):
+        with patch("tyr.problems.scanner.get_all_domains") as mocked_get:
+            mocked_get.return_value = [FakeDomain()]
+            get_domain("fake")
+            get_domain("fake")
+            mocked_get.assert_called_once()
+
+    def test_get_problem(self, mocked_domains):
+        problem = get_problem("fake:2")
+        assert problem is FakeDomain().get_problem(2)
+        assert problem.name == "fake:2"
+
+    @pytest.mark.parametrize("name", ["fake", "fake:", "fake:one", "unknown:1"])
+    def test_get_problem_unknown(self, mocked_domains, name):
+        assert get_problem(name) is None